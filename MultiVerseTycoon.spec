@@ -5,7 +5,7 @@ a = Analysis(
     ['multiverse_tycoon.py'],
     pathex=[],
     binaries=[],
-    datas=[('README.md', '.')],
+    datas=[('README.md', '.'), ('content/*.json', 'content')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
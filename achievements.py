@@ -1,6 +1,87 @@
 
 #!/usr/bin/env python3
 
+from content import get_content
+from staff import employee_count
+
+# Achievements unlocked by a statistic reaching a threshold, as
+# (achievement_id, stat, threshold), in the order they are checked
+ACHIEVEMENT_RULES = [
+    ("first_business", "total_businesses", 1),
+    ("first_hire", "total_employees", 1),
+    ("business_tycoon", "total_businesses", 5),
+    ("business_magnate", "total_businesses", 10),
+    ("money_maker", "total_cash", 100000),
+    ("millionaire", "total_cash", 1000000),
+    ("hundred_thousandaire", "max_universe_cash", 100000),
+    ("quantum_collector", "quantum_credits", 1000),
+    ("job_creator", "total_employees", 10),
+    ("hiring_spree", "max_universe_employees", 3),
+    ("universe_monopoly", "monopolized_universes", 1),
+    ("multiverse_empire", "all_universes_with_businesses", 1),
+    ("dimensional_explorer", "all_universes_visited", 1),
+    ("risk_taker", "max_danger", 90),
+    ("full_turn", "turn", 10),
+    ("long_haul", "turn", 50),
+    ("event_survivor", "events_experienced", 20),
+    ("research_enthusiast", "research_completed", 1),
+    ("tech_visionary", "research_completed", 5),
+    ("first_heist", "heists_completed", 1),
+    ("master_thief", "heists_completed", 3),
+    ("game_winner", "minigames_won", 1),
+    ("game_master", "minigames_won", 5),
+    ("security_specialist", "risk_reductions", 5),
+]
+
+
+def _monopolized_universes(game_state):
+    """Count universes where the player owns every business."""
+    count = 0
+    for universe_id, universe_data in game_state["universes"].items():
+        if universe_data.get("businesses"):
+            all_universe_businesses = set(game_state.get("universe_businesses", {}).get(universe_id, []))
+            if all_universe_businesses and all_universe_businesses.issubset(universe_data["businesses"]):
+                count += 1
+    return count
+
+
+# Statistics read from the game state rather than from AchievementSystem.stats
+GAME_STATE_STATS = {
+    "total_businesses": lambda gs, stats: sum(len(u["businesses"]) for u in gs["universes"].values()),
+    "total_employees": lambda gs, stats: sum(employee_count(u["employees"]) for u in gs["universes"].values()),
+    "total_cash": lambda gs, stats: sum(u["cash"] for u in gs["universes"].values()),
+    "max_universe_cash": lambda gs, stats: max((u["cash"] for u in gs["universes"].values()), default=0),
+    "max_universe_employees": lambda gs, stats: max(
+        (employee_count(u["employees"]) for u in gs["universes"].values()), default=0),
+    "quantum_credits": lambda gs, stats: gs["quantum_credits"],
+    "monopolized_universes": lambda gs, stats: _monopolized_universes(gs),
+    "all_universes_with_businesses": lambda gs, stats: int(
+        sum(1 for u in gs["universes"].values() if u.get("businesses")) == len(gs["universes"])),
+    "all_universes_visited": lambda gs, stats: int(
+        len(stats.get("universe_visited", {})) == len(gs["universes"])),
+    "max_danger": lambda gs, stats: max((u.get("danger", 0) for u in gs["universes"].values()), default=0),
+    "turn": lambda gs, stats: gs["turn"],
+    "research_completed": lambda gs, stats: len(gs.get("completed_research", [])),
+}
+
+# Game state statistics that walk the universes, grouped by what changes them.
+# They are only evaluated after the TurnEngine reports such a change through
+# mark_changed(); the others above are read straight off the player state.
+CASH_STATS = ("total_cash", "max_universe_cash")
+EMPLOYEE_STATS = ("total_employees", "max_universe_employees")
+BUSINESS_STATS = ("total_businesses", "monopolized_universes", "all_universes_with_businesses")
+DANGER_STATS = ("max_danger",)
+UNIVERSE_STATS = CASH_STATS + EMPLOYEE_STATS + BUSINESS_STATS + DANGER_STATS + ("all_universes_visited",)
+
+# Statistics answered by the TurnEngine's EmpireAggregates when one is supplied
+AGGREGATE_STATS = {
+    "total_businesses": lambda agg, gs: agg.total_businesses,
+    "total_employees": lambda agg, gs: agg.total_employees,
+    "total_cash": lambda agg, gs: agg.total_cash,
+    "all_universes_with_businesses": lambda agg, gs: int(agg.universes_with_businesses == len(gs["universes"])),
+}
+
+
 class Achievement:
     def __init__(self, id, name, description, reward_cash=0, reward_quantum=0, universe_specific=False, hidden=False):
         """Initialize an achievement.
@@ -28,191 +109,8 @@ class AchievementSystem:
     def __init__(self):
         """Initialize the achievement system with predefined achievements."""
         self.achievements = {
-            # Beginner achievements - guide the player early in the game
-            "first_business": Achievement(
-                "first_business", 
-                "Entrepreneur", 
-                "Start your first business", 
-                reward_cash=1000
-            ),
-            "first_hire": Achievement(
-                "first_hire", 
-                "First Hire", 
-                "Hire your first employee", 
-                reward_cash=1000
-            ),
-            "first_jump": Achievement(
-                "first_jump", 
-                "Dimensional Traveler", 
-                "Travel to your first new universe", 
-                reward_quantum=50
-            ),
-            
-            # Business achievements
-            "business_tycoon": Achievement(
-                "business_tycoon", 
-                "Business Tycoon", 
-                "Own 5 businesses across all universes", 
-                reward_cash=5000
-            ),
-            "business_magnate": Achievement(
-                "business_magnate", 
-                "Business Magnate", 
-                "Own 10 businesses across all universes", 
-                reward_cash=15000,
-                reward_quantum=100
-            ),
-            "universe_monopoly": Achievement(
-                "universe_monopoly", 
-                "Universe Monopoly", 
-                "Own all businesses in a single universe", 
-                reward_cash=10000,
-                reward_quantum=150
-            ),
-            "multiverse_empire": Achievement(
-                "multiverse_empire", 
-                "Multiverse Empire", 
-                "Own at least one business in each universe", 
-                reward_cash=15000,
-                reward_quantum=200
-            ),
-            
-            # Financial achievements
-            "money_maker": Achievement(
-                "money_maker", 
-                "Money Maker", 
-                "Earn 100,000 in total across universes", 
-                reward_cash=5000
-            ),
-            "hundred_thousandaire": Achievement(
-                "hundred_thousandaire", 
-                "Hundred-Thousandaire", 
-                "Accumulate 100,000 cash in a single universe", 
-                reward_cash=10000
-            ),
-            "millionaire": Achievement(
-                "millionaire", 
-                "Millionaire", 
-                "Accumulate 1,000,000 total cash across universes", 
-                reward_cash=50000,
-                reward_quantum=300
-            ),
-            "quantum_collector": Achievement(
-                "quantum_collector", 
-                "Quantum Collector", 
-                "Accumulate 1,000 Quantum Credits", 
-                reward_quantum=200
-            ),
-            
-            # Security achievements (renamed from smooth_operator for terminology consistency)
-            "security_specialist": Achievement(
-                "security_specialist", 
-                "Security Specialist", 
-                "Successfully reduce detection risk 5 times", 
-                reward_cash=2000
-            ),
-            
-            # Employee achievements
-            "job_creator": Achievement(
-                "job_creator", 
-                "Job Creator", 
-                "Hire 10 employees across all universes", 
-                reward_cash=3000
-            ),
-            "hiring_spree": Achievement(
-                "hiring_spree", 
-                "Hiring Spree", 
-                "Hire 3 employees in a single universe", 
-                reward_cash=2000
-            ),
-            
-            # Risk achievements (updated for terminology consistency)
-            "risk_taker": Achievement(
-                "risk_taker", 
-                "Risk Taker", 
-                "Survive with 90+ detection risk", 
-                reward_cash=10000,
-                reward_quantum=100
-            ),
-            "master_negotiator": Achievement(
-                "master_negotiator", 
-                "Master Negotiator", 
-                "Reduce detection risk from 80+ to below 20 in one universe", 
-                reward_cash=8000
-            ),
-            
-            # Research achievements
-            "research_enthusiast": Achievement(
-                "research_enthusiast", 
-                "Research Enthusiast", 
-                "Complete your first research project", 
-                reward_quantum=50
-            ),
-            "tech_visionary": Achievement(
-                "tech_visionary", 
-                "Tech Visionary", 
-                "Complete 5 research projects", 
-                reward_quantum=150
-            ),
-            
-            # Heist achievements
-            "first_heist": Achievement(
-                "first_heist", 
-                "Daring Heist", 
-                "Successfully complete your first heist", 
-                reward_cash=5000
-            ),
-            "master_thief": Achievement(
-                "master_thief", 
-                "Master Thief", 
-                "Successfully complete 3 heists", 
-                reward_cash=15000,
-                reward_quantum=100
-            ),
-            
-            # Mini-game achievements
-            "game_winner": Achievement(
-                "game_winner", 
-                "Game Winner", 
-                "Win your first mini-game", 
-                reward_cash=1000
-            ),
-            "game_master": Achievement(
-                "game_master", 
-                "Game Master", 
-                "Win 5 mini-games", 
-                reward_cash=5000,
-                reward_quantum=50
-            ),
-            
-            # Special achievements
-            "dimensional_explorer": Achievement(
-                "dimensional_explorer", 
-                "Dimensional Explorer", 
-                "Visit all universes", 
-                reward_cash=5000,
-                reward_quantum=100
-            ),
-            "event_survivor": Achievement(
-                "event_survivor", 
-                "Event Survivor", 
-                "Experience 20 random events", 
-                reward_cash=4000,
-                reward_quantum=100
-            ),
-            "full_turn": Achievement(
-                "full_turn", 
-                "Full Turn", 
-                "Complete 10 game turns", 
-                reward_cash=2000
-            ),
-            "long_haul": Achievement(
-                "long_haul", 
-                "Long Haul", 
-                "Complete 50 game turns", 
-                reward_cash=10000,
-                reward_quantum=200
-            )
+            achievement_id: Achievement(achievement_id, **entry)
+            for achievement_id, entry in get_content("achievements").items()
         }
         
         # Track statistics for achievements
@@ -231,126 +129,92 @@ class AchievementSystem:
         # Keep unlocked achievements in a list for easy access
         self.unlocked_achievements = []
         
-    def check_achievements(self, game_state):
+        # Thresholds grouped per stat and sorted, each with a cursor at the
+        # first threshold not yet reached; stats whose cursor has run off the
+        # end are dropped from pending_stats and never evaluated again
+        self.thresholds = {}
+        for order, (achievement_id, stat, threshold) in enumerate(ACHIEVEMENT_RULES):
+            self.thresholds.setdefault(stat, []).append((threshold, order, achievement_id))
+        for stat_thresholds in self.thresholds.values():
+            stat_thresholds.sort()
+        self.cursors = {stat: 0 for stat in self.thresholds}
+        self.pending_stats = list(self.thresholds)
+        # Counter and universe stats changed since the last check
+        self.changed_stats = {stat for stat in self.thresholds
+                              if stat not in GAME_STATE_STATS or stat in UNIVERSE_STATS}
+        
+    def check_achievements(self, game_state, aggregates=None):
         """Check and unlock achievements based on game state.
         
+        Args:
+            game_state (dict): Current game state
+            aggregates (EmpireAggregates, optional): Running totals for game_state
+        
         Returns:
             list: Newly unlocked achievements (if any)
         """
+        next_rule = lambda s: self.thresholds[s][self.cursors[s]][1]
+        stats_to_check = {s for s in self.pending_stats
+                          if s in self.changed_stats or (s in GAME_STATE_STATS and s not in UNIVERSE_STATS)}
+        self.changed_stats.clear()
+        
+        # Check stats in the order of their next rule, so rewards granted
+        # earlier in this check count towards the achievements after them
         newly_unlocked = []
+        checked = set()
+        while stats_to_check:
+            stat = min(stats_to_check, key=next_rule)
+            rule = next_rule(stat)
+            stats_to_check.remove(stat)
+            checked.add(stat)
+            value = self.get_stat_value(stat, game_state, aggregates)
+            newly_unlocked.extend(self.advance_stat(stat, value, game_state))
+            
+            # A cash reward moves the cash stats; those with rules still to
+            # come are checked now, the others on the next check
+            for changed in [s for s in self.changed_stats if s in self.cursors and s not in checked]:
+                if changed in self.pending_stats and next_rule(changed) > rule:
+                    stats_to_check.add(changed)
+                    self.changed_stats.discard(changed)
         
-        # Calculate totals
-        total_businesses = sum(len(universe_data['businesses']) for universe_data in game_state["universes"].values())
-        total_employees = sum(len(universe_data['employees']) for universe_data in game_state["universes"].values())
-        total_cash = sum(universe_data['cash'] for universe_data in game_state["universes"].values())
+        newly_unlocked.sort()
+        return [self.achievements[achievement_id] for order, achievement_id in newly_unlocked]
+    
+    def get_stat_value(self, stat, game_state, aggregates=None):
+        """Get the current value of an achievement statistic."""
+        if aggregates is not None and stat in AGGREGATE_STATS:
+            return AGGREGATE_STATS[stat](aggregates, game_state)
+        if stat in GAME_STATE_STATS:
+            return GAME_STATE_STATS[stat](game_state, self.stats)
+        return self.stats.get(stat, 0)
+    
+    def advance_stat(self, stat, value, game_state):
+        """Unlock every achievement whose threshold for a stat has been reached.
         
-        # Check beginner achievements
-        if total_businesses >= 1 and self.unlock_achievement("first_business", game_state):
-            newly_unlocked.append(self.achievements["first_business"])
+        Args:
+            stat (str): The statistic that changed
+            value (int): Its current value
+            game_state (dict): Current game state
             
-        if total_employees >= 1 and self.unlock_achievement("first_hire", game_state):
-            newly_unlocked.append(self.achievements["first_hire"])
+        Returns:
+            list: (order, achievement_id) for each newly unlocked achievement
+        """
+        stat_thresholds = self.thresholds.get(stat)
+        if not stat_thresholds:
+            return []
         
-        # Check business achievements
-        if total_businesses >= 5 and self.unlock_achievement("business_tycoon", game_state):
-            newly_unlocked.append(self.achievements["business_tycoon"])
-            
-        if total_businesses >= 10 and self.unlock_achievement("business_magnate", game_state):
-            newly_unlocked.append(self.achievements["business_magnate"])
-            
-        # Check financial achievements    
-        if total_cash >= 100000 and self.unlock_achievement("money_maker", game_state):
-            newly_unlocked.append(self.achievements["money_maker"])
-            
-        if total_cash >= 1000000 and self.unlock_achievement("millionaire", game_state):
-            newly_unlocked.append(self.achievements["millionaire"])
-            
-        # Check for universe-specific cash achievements
-        for universe_id, universe_data in game_state["universes"].items():
-            if universe_data["cash"] >= 100000 and self.unlock_achievement("hundred_thousandaire", game_state):
-                newly_unlocked.append(self.achievements["hundred_thousandaire"])
-                break
-                
-        # Check quantum credits achievement
-        if game_state["quantum_credits"] >= 1000 and self.unlock_achievement("quantum_collector", game_state):
-            newly_unlocked.append(self.achievements["quantum_collector"])
-                
-        # Check employee achievements
-        if total_employees >= 10 and self.unlock_achievement("job_creator", game_state):
-            newly_unlocked.append(self.achievements["job_creator"])
-            
-        # Check for hiring spree in a single universe
-        for universe_id, universe_data in game_state["universes"].items():
-            if len(universe_data["employees"]) >= 3 and self.unlock_achievement("hiring_spree", game_state):
-                newly_unlocked.append(self.achievements["hiring_spree"])
-                break
-                
-        # Check universe monopoly (all businesses in one universe)
-        for universe_id, universe_data in game_state["universes"].items():
-            # Check if player owns every business in this universe
-            if "businesses" in universe_data and len(universe_data["businesses"]) > 0:
-                all_universe_businesses = set(game_state.get("universe_businesses", {}).get(universe_id, []))
-                owned_businesses = set(universe_data["businesses"])
-                
-                if all_universe_businesses and all_universe_businesses.issubset(owned_businesses):
-                    if self.unlock_achievement("universe_monopoly", game_state):
-                        newly_unlocked.append(self.achievements["universe_monopoly"])
-                        break
-            
-        # Check multiverse empire (at least one business in each universe)
-        universes_with_businesses = sum(1 for universe_data in game_state["universes"].values() 
-                                      if len(universe_data.get('businesses', [])) > 0)
-        if universes_with_businesses == len(game_state["universes"]) and self.unlock_achievement("multiverse_empire", game_state):
-            newly_unlocked.append(self.achievements["multiverse_empire"])
-            
-        # Check dimensional explorer achievement (visited all universes)
-        if len(self.stats.get("universe_visited", {})) == len(game_state["universes"]) and self.unlock_achievement("dimensional_explorer", game_state):
-            newly_unlocked.append(self.achievements["dimensional_explorer"])
-            
-        # Check risk-related achievements (using updated terminology)
-        for universe_id, universe_data in game_state["universes"].items():
-            if universe_data.get("danger", 0) >= 90 and self.unlock_achievement("risk_taker", game_state):
-                newly_unlocked.append(self.achievements["risk_taker"])
-                break
-                
-        # Check turn-based achievements
-        if game_state["turn"] >= 10 and self.unlock_achievement("full_turn", game_state):
-            newly_unlocked.append(self.achievements["full_turn"])
-            
-        if game_state["turn"] >= 50 and self.unlock_achievement("long_haul", game_state):
-            newly_unlocked.append(self.achievements["long_haul"])
-            
-        # Check event survivor
-        if self.stats["events_experienced"] >= 20 and self.unlock_achievement("event_survivor", game_state):
-            newly_unlocked.append(self.achievements["event_survivor"])
-            
-        # Check research achievements
-        completed_research = game_state.get("completed_research", [])
-        if len(completed_research) >= 1 and self.unlock_achievement("research_enthusiast", game_state):
-            newly_unlocked.append(self.achievements["research_enthusiast"])
-            
-        if len(completed_research) >= 5 and self.unlock_achievement("tech_visionary", game_state):
-            newly_unlocked.append(self.achievements["tech_visionary"])
-            
-        # Check heist achievements
-        if self.stats["heists_completed"] >= 1 and self.unlock_achievement("first_heist", game_state):
-            newly_unlocked.append(self.achievements["first_heist"])
-            
-        if self.stats["heists_completed"] >= 3 and self.unlock_achievement("master_thief", game_state):
-            newly_unlocked.append(self.achievements["master_thief"])
-            
-        # Check mini-game achievements
-        if self.stats["minigames_won"] >= 1 and self.unlock_achievement("game_winner", game_state):
-            newly_unlocked.append(self.achievements["game_winner"])
-            
-        if self.stats["minigames_won"] >= 5 and self.unlock_achievement("game_master", game_state):
-            newly_unlocked.append(self.achievements["game_master"])
-            
-        # Check security achievement (renamed from smooth_operator)
-        if self.stats["risk_reductions"] >= 5 and self.unlock_achievement("security_specialist", game_state):
-            newly_unlocked.append(self.achievements["security_specialist"])
-            
-        return newly_unlocked
+        unlocked = []
+        cursor = self.cursors[stat]
+        while cursor < len(stat_thresholds) and value >= stat_thresholds[cursor][0]:
+            threshold, order, achievement_id = stat_thresholds[cursor]
+            if self.unlock_achievement(achievement_id, game_state):
+                unlocked.append((order, achievement_id))
+            cursor += 1
+        
+        self.cursors[stat] = cursor
+        if cursor == len(stat_thresholds) and stat in self.pending_stats:
+            self.pending_stats.remove(stat)
+        return unlocked
     
     def update_stats(self, stat_name, value=1, universe_id=None):
         """Update achievement statistics.
@@ -366,6 +230,11 @@ class AchievementSystem:
         elif stat_name in self.stats:
             # Increment counter stats
             self.stats[stat_name] += value
+            self.changed_stats.add(stat_name)
+    
+    def mark_changed(self, *stats):
+        """Note that game state statistics (e.g. CASH_STATS) may have changed."""
+        self.changed_stats.update(stats)
             
     def check_master_negotiator(self, game_state, universe_id, previous_risk, current_risk):
         """Special check for master negotiator achievement.
@@ -409,6 +278,7 @@ class AchievementSystem:
             current_universe = game_state["current_universe"]
             if achievement.reward_cash > 0:
                 game_state["universes"][current_universe]["cash"] += achievement.reward_cash
+                self.mark_changed(*CASH_STATS)
                 
             if achievement.reward_quantum > 0:
                 game_state["quantum_credits"] += achievement.reward_quantum
@@ -424,11 +294,12 @@ class AchievementSystem:
         """
         return [self.achievements[ach_id] for ach_id in self.unlocked_achievements]
         
-    def get_progress_report(self, game_state):
+    def get_progress_report(self, game_state, aggregates=None):
         """Get a detailed progress report for upcoming achievements.
         
         Args:
             game_state (dict): Current game state
+            aggregates (EmpireAggregates, optional): Running totals for game_state
             
         Returns:
             dict: Progress information for achievements close to completion
@@ -436,9 +307,9 @@ class AchievementSystem:
         progress = {}
         
         # Calculate game state totals
-        total_businesses = sum(len(universe_data.get('businesses', [])) for universe_data in game_state["universes"].values())
-        total_employees = sum(len(universe_data.get('employees', [])) for universe_data in game_state["universes"].values())
-        total_cash = sum(universe_data.get('cash', 0) for universe_data in game_state["universes"].values())
+        total_businesses = self.get_stat_value("total_businesses", game_state, aggregates)
+        total_employees = self.get_stat_value("total_employees", game_state, aggregates)
+        total_cash = self.get_stat_value("total_cash", game_state, aggregates)
         
         # Check business achievements progress
         if not self.achievements["business_tycoon"].unlocked:
@@ -522,9 +393,9 @@ class AchievementSystem:
         # Universe exploration progress
         if not self.achievements["dimensional_explorer"].unlocked:
             progress["dimensional_explorer"] = {
-                "current": len(self.stats["universe_jumps"]),
+                "current": len(self.stats["universe_visited"]),
                 "target": len(game_state["universes"]),
-                "percentage": min(100, int(len(self.stats["universe_jumps"]) / len(game_state["universes"]) * 100))
+                "percentage": min(100, int(len(self.stats["universe_visited"]) / len(game_state["universes"]) * 100))
             }
             
         # Event survivor progress
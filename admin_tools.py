@@ -8,11 +8,9 @@ import json
 import os
 import sys
 import random
-import glob
-
-def clear_screen():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+from save_store import open_save_store
+from renderer import clear_screen
+from input_source import read_input
 
 def print_header(text):
     """Print a formatted header."""
@@ -20,8 +18,16 @@ def print_header(text):
     print(f"{text.center(80)}")
     print("=" * 80)
 
-def admin_menu():
-    """Main admin menu."""
+def admin_menu(save_store=None, timings=None):
+    """Main admin menu.
+
+    Args:
+        save_store: Store holding the player saves (defaults to the configured backend)
+        timings: TurnTimings of the running game, if turn phases are being timed
+    """
+    if save_store is None:
+        save_store = open_save_store()
+
     # This is a simple admin menu for debugging purposes
     while True:
         clear_screen()
@@ -31,9 +37,11 @@ def admin_menu():
         print("3. List active rewards")
         print("4. Reset ad watch cooldown")
         print("5. Delete save files")
-        print("6. Return to game")
+        print("6. Save statistics")
+        print("7. Turn timings")
+        print("8. Return to game")
         
-        choice = input("\nSelect an option (1-6): ")
+        choice = read_input("\nSelect an option (1-8): ")
         
         if choice == "1":
             generate_reward_codes()
@@ -44,30 +52,34 @@ def admin_menu():
         elif choice == "4":
             reset_ad_cooldown()
         elif choice == "5":
-            delete_save_files()
+            delete_save_files(save_store)
         elif choice == "6":
+            show_save_statistics(save_store)
+        elif choice == "7":
+            show_turn_timings(timings)
+        elif choice == "8":
             break
         else:
             print("\nInvalid option. Try again.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
 
-def delete_save_files():
+def delete_save_files(store=None):
     """Delete save files."""
     clear_screen()
     print_header("DELETE SAVE FILES")
     
-    # Get list of save files
-    save_files = glob.glob("saves/multiverse_tycoon_save_*.json")
+    # Get list of saved players
+    if store is None:
+        store = open_save_store()
+    player_names = store.list_saves()
     
-    if not save_files:
+    if not player_names:
         print("\nNo save files found.")
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
         return
     
     print("\nAvailable save files:")
-    for i, save_file in enumerate(save_files, 1):
-        # Extract player name from filename
-        player_name = save_file.split("_")[-1].replace(".json", "")
+    for i, player_name in enumerate(player_names, 1):
         print(f"{i}. {player_name}")
     
     print("\nOptions:")
@@ -75,30 +87,29 @@ def delete_save_files():
     print("A. Delete all saves")
     print("C. Cancel")
     
-    choice = input("\nSelect an option: ").upper()
+    choice = read_input("\nSelect an option: ").upper()
     
     if choice == "C":
         return
     elif choice == "A":
-        confirm = input("\nAre you sure you want to delete ALL save files? (yes/no): ").lower()
+        confirm = read_input("\nAre you sure you want to delete ALL save files? (yes/no): ").lower()
         if confirm == "yes":
-            for save_file in save_files:
-                try:
-                    os.remove(save_file)
-                    print(f"Deleted: {save_file}")
-                except Exception as e:
-                    print(f"Error deleting {save_file}: {e}")
-            print("\nAll save files deleted.")
+            try:
+                store.delete_many(player_names)
+                for player_name in player_names:
+                    print(f"Deleted: {store.save_path(player_name)}")
+                print("\nAll save files deleted.")
+            except Exception as e:
+                print(f"\nError deleting save files: {e}")
     else:
         try:
             index = int(choice) - 1
-            if 0 <= index < len(save_files):
-                save_file = save_files[index]
-                player_name = save_file.split("_")[-1].replace(".json", "")
-                confirm = input(f"\nAre you sure you want to delete save file for {player_name}? (yes/no): ").lower()
+            if 0 <= index < len(player_names):
+                player_name = player_names[index]
+                confirm = read_input(f"\nAre you sure you want to delete save file for {player_name}? (yes/no): ").lower()
                 if confirm == "yes":
                     try:
-                        os.remove(save_file)
+                        store.delete(player_name)
                         print(f"\nDeleted save file for {player_name}")
                     except Exception as e:
                         print(f"\nError deleting save file: {e}")
@@ -107,7 +118,51 @@ def delete_save_files():
         except ValueError:
             print("\nInvalid input.")
     
-    input("\nPress Enter to continue...")
+    read_input("\nPress Enter to continue...")
+
+def show_save_statistics(store=None):
+    """Show aggregate statistics over all saved profiles."""
+    clear_screen()
+    print_header("SAVE STATISTICS")
+    
+    if store is None:
+        store = open_save_store()
+    stats = store.stats()
+    
+    print(f"\nProfiles: {stats['profiles']}")
+    print(f"Average level: {stats['average_level']}")
+    print(f"Highest level: {stats['max_level']}")
+    print(f"Longest campaign: {stats['max_turn']} turns")
+    print(f"Total quantum wealth: {stats['total_quantum_wealth']:,.2f} Q¢")
+    
+    if stats["richest"]:
+        print("\nRichest players:")
+        for i, (name, wealth) in enumerate(stats["richest"], 1):
+            print(f"{i}. {name}: {wealth:,.2f} Q¢")
+    
+    read_input("\nPress Enter to continue...")
+
+def show_turn_timings(timings=None):
+    """Show how long each phase of a turn has taken this session."""
+    clear_screen()
+    print_header("TURN TIMINGS")
+
+    if timings is None:
+        print("\nTurn timings are off. Start the game with --timings to record them.")
+        read_input("\nPress Enter to continue...")
+        return
+
+    print()
+    print(timings.format_report())
+
+    report = timings.report()
+    if report:
+        print(f"\nRecent calls per phase (last {timings.window}):")
+        for phase, stats in report.items():
+            buckets = "  ".join(f"{label}: {count}" for label, count in stats["histogram"].items())
+            print(f"{phase:<16}{buckets}")
+
+    read_input("\nPress Enter to continue...")
 
 def generate_reward_codes():
     """Generate reward codes for testing."""
@@ -129,7 +184,7 @@ def generate_reward_codes():
                 
         except Exception as e:
             print(f"\nError creating ad codes file: {e}")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
     
     # Load the ad codes
@@ -138,7 +193,7 @@ def generate_reward_codes():
             ad_codes = json.load(file)
     except Exception as e:
         print(f"\nError loading ad codes: {e}")
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
         return
     
     # Generate 5 new codes
@@ -184,7 +239,7 @@ def generate_reward_codes():
     except Exception as e:
         print(f"\nError saving ad codes: {e}")
     
-    input("\nPress Enter to continue...")
+    read_input("\nPress Enter to continue...")
 
 def reset_active_rewards():
     """Reset all active rewards."""
@@ -194,7 +249,7 @@ def reset_active_rewards():
     # Check if active rewards file exists
     if not os.path.exists("saves/active_rewards.json"):
         print("\nActive rewards file not found. Nothing to reset.")
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
         return
     
     try:
@@ -207,7 +262,7 @@ def reset_active_rewards():
     except Exception as e:
         print(f"\nError resetting active rewards: {e}")
     
-    input("\nPress Enter to continue...")
+    read_input("\nPress Enter to continue...")
 
 def list_active_rewards():
     """List all active rewards."""
@@ -217,7 +272,7 @@ def list_active_rewards():
     # Check if active rewards file exists
     if not os.path.exists("saves/active_rewards.json"):
         print("\nActive rewards file not found.")
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
         return
     
     try:
@@ -253,7 +308,7 @@ def list_active_rewards():
     except Exception as e:
         print(f"\nError loading active rewards: {e}")
     
-    input("\nPress Enter to continue...")
+    read_input("\nPress Enter to continue...")
 
 def reset_ad_cooldown():
     """Reset the ad watch cooldown."""
@@ -263,7 +318,7 @@ def reset_ad_cooldown():
     # Check if active rewards file exists
     if not os.path.exists("saves/active_rewards.json"):
         print("\nActive rewards file not found.")
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
         return
     
     try:
@@ -283,7 +338,7 @@ def reset_ad_cooldown():
     except Exception as e:
         print(f"\nError resetting ad watch cooldown: {e}")
     
-    input("\nPress Enter to continue...")
+    read_input("\nPress Enter to continue...")
 
 if __name__ == "__main__":
     admin_menu()
\ No newline at end of file
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+from staff import employee_count
+
+
+class EmpireAggregates:
+    """Running totals across every universe of one player state.
+
+    The totals are computed once by rebuild() and then kept current by the
+    TurnEngine, which reports every purchase, hire, departure and cash change,
+    so screens and checks can read them without walking all universes.
+    """
+
+    def __init__(self, player=None):
+        """Initialize the totals, optionally from an existing player state.
+
+        Args:
+            player (dict, optional): Player state to total up
+        """
+        self.player = None
+        self._total_businesses = 0
+        self._total_employees = 0
+        self._total_cash = 0
+        self._universes_with_businesses = 0
+        if player is not None:
+            self.rebuild(player)
+
+    @property
+    def total_businesses(self):
+        """Number of businesses owned across all universes."""
+        return self._total_businesses
+
+    @property
+    def total_employees(self):
+        """Number of employees across all universes."""
+        return self._total_employees
+
+    @property
+    def total_cash(self):
+        """Local cash summed across all universes."""
+        return self._total_cash
+
+    @property
+    def universes_with_businesses(self):
+        """Number of universes where at least one business is owned."""
+        return self._universes_with_businesses
+
+    def rebuild(self, player):
+        """Recompute every total from scratch for a player state.
+
+        Args:
+            player (dict): Player state the totals will track from now on
+        """
+        self.player = player
+        self._total_businesses = 0
+        self._total_employees = 0
+        self._total_cash = 0
+        self._universes_with_businesses = 0
+        for universe_data in player["universes"].values():
+            self.universe_added(universe_data)
+
+    def universe_added(self, universe_data):
+        """Account for a newly initialized universe state."""
+        self._total_businesses += len(universe_data["businesses"])
+        self._total_employees += employee_count(universe_data["employees"])
+        self._total_cash += universe_data["cash"]
+        if universe_data["businesses"]:
+            self._universes_with_businesses += 1
+
+    def business_added(self, universe_data):
+        """Account for a business just appended to a universe's businesses."""
+        self._total_businesses += 1
+        if len(universe_data["businesses"]) == 1:
+            self._universes_with_businesses += 1
+
+    def employees_changed(self, amount):
+        """Account for employees hired (positive) or lost (negative)."""
+        self._total_employees += amount
+
+    def cash_changed(self, amount):
+        """Account for cash added to (positive) or removed from (negative) any universe."""
+        self._total_cash += amount
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the game's hot paths.
+
+Times the per-turn and per-save code paths against three player states:
+    small  a new game a few turns in
+    mid    a greedy campaign played headlessly for 120 turns
+    huge   a synthetic late-game state (see state_generator.py): a dozen
+           universes, hundreds of businesses, thousands of employees and
+           long histories
+
+Results can be written to a JSON baseline and later runs compared against
+it; a benchmark whose best time is slower than the baseline's by more than
+the tolerance counts as a regression (the best of several rounds is the
+least noisy estimate on a busy machine).
+
+Usage:
+    python benchmarks/hot_paths.py
+    python benchmarks/hot_paths.py --save-baseline benchmarks/baseline.json
+    python benchmarks/hot_paths.py --compare benchmarks/baseline.json --tolerance 0.2
+    python benchmarks/hot_paths.py --filter advance_turn --states huge
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+STATES = ("small", "mid", "huge")
+DEFAULT_TOLERANCE = 0.15
+STATE_SEED = 1234
+
+
+def new_game(name, seed):
+    """A headless game with a fresh player state."""
+    from multiverse_tycoon import MultiVerseTycoon
+
+    game = MultiVerseTycoon(pacing="instant", seed=seed)
+    game.turn_engine.start_new_game(game.player, name)
+    return game
+
+
+def build_small(seed=STATE_SEED):
+    """A new game with one business, a few turns in."""
+    game = new_game("bench-small", seed)
+    engine = game.turn_engine
+    engine.start_business(game.player, next(iter(game.universes["blade_runner"]["businesses"])))
+    for _ in range(5):
+        engine.advance_turn(game.player)
+    return game
+
+
+def build_mid(seed=STATE_SEED, turns=120):
+    """A campaign played by the greedy simulation policy."""
+    from simulate import greedy_policy
+
+    policy_rng = random.Random(seed)
+    game = new_game("bench-mid", seed)
+    engine = game.turn_engine
+    player = game.player
+    while player["turn"] < turns and not player["game_over"]:
+        greedy_policy(engine, player, policy_rng)
+        engine.advance_turn(player)
+    return game
+
+
+def build_huge(seed=STATE_SEED):
+    """A synthetic late-game state from the state generator."""
+    from state_generator import generate_game
+
+    return generate_game(seed, "huge")
+
+
+BUILDERS = {"small": build_small, "mid": build_mid, "huge": build_huge}
+
+
+def bench_advance_turn(game):
+    engine, player = game.turn_engine, game.player
+    return lambda: engine.advance_turn(player)
+
+
+def bench_check_achievements(game):
+    engine, player = game.turn_engine, game.player
+    return lambda: engine.check_achievements(player)
+
+
+def bench_check_and_update_quests(game):
+    quests, player = game.quest_system, game.player
+    return lambda: quests.check_and_update_quests(player, "turn_completed")
+
+
+def bench_apply_research_effects(game):
+    research, player = game.research_system, game.player
+    universe_id = player["current_universe"]
+    return lambda: research.apply_research_effects(player, universe_id)
+
+
+def bench_get_heist_success_chance(game):
+    heists = game.heist_system
+    heist = heists.get_available_heists(next(iter(heists.heist_types)))[0]
+    difficulty = list(heists.difficulty_levels)[-1]
+    crew = list(heists.specialists)
+    items = list(heists.special_items)
+    return lambda: heists.get_heist_success_chance(heist, difficulty, crew, items)
+
+
+def bench_calculate_total_quantum_wealth(game):
+    exchange, player = game.currency_exchange, game.player
+    return lambda: exchange.calculate_total_quantum_wealth(player)
+
+
+def bench_state_hash(game):
+    engine, player = game.turn_engine, game.player
+    engine.state_hash(player)  # Histories are hashed once, then reused
+    return lambda: engine.state_hash(player)
+
+
+def _store(game, backend, directory):
+    from save_store import open_save_store
+    return open_save_store(backend, directory, currency_exchange=game.currency_exchange)
+
+
+def _bench_save(game, backend, directory):
+    # One turn's worth of change per save, as when saving every turn
+    store, player = _store(game, backend, directory), game.player
+    store.save(player)
+
+    def save():
+        player["turn"] += 1
+        store.save(player)
+    return save, store
+
+
+def _bench_load(game, backend, directory):
+    store, player = _store(game, backend, directory), game.player
+    store.save(player)
+    return lambda: store.load(player["name"]), store
+
+
+BENCHMARKS = {
+    "advance_turn": bench_advance_turn,
+    "check_achievements": bench_check_achievements,
+    "check_and_update_quests": bench_check_and_update_quests,
+    "apply_research_effects": bench_apply_research_effects,
+    "get_heist_success_chance": bench_get_heist_success_chance,
+    "calculate_total_quantum_wealth": bench_calculate_total_quantum_wealth,
+    "state_hash": bench_state_hash,
+    "save_game_json": lambda game, directory: _bench_save(game, "json", directory),
+    "load_game_json": lambda game, directory: _bench_load(game, "json", directory),
+    "save_game_sqlite": lambda game, directory: _bench_save(game, "sqlite", directory),
+    "load_game_sqlite": lambda game, directory: _bench_load(game, "sqlite", directory),
+}
+
+# Benchmarks that write saves take a scratch directory and also return their store
+SAVE_BENCHMARKS = ("save_game_json", "load_game_json", "save_game_sqlite", "load_game_sqlite")
+
+
+def time_call(func, repeat):
+    """Time a callable like timeit's command line does.
+
+    Returns:
+        dict: Median and best time per call in microseconds, over repeat
+            rounds of an automatically chosen number of calls
+    """
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    per_call = [total / loops * 1e6 for total in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "median_us": round(statistics.median(per_call), 3),
+        "best_us": round(min(per_call), 3),
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def run_suite(states=STATES, names=None, repeat=5, seed=STATE_SEED):
+    """Run the benchmarks against each state, building a fresh state for each.
+
+    Returns:
+        dict: "<benchmark>/<state>" -> timing results
+    """
+    results = {}
+    for state in states:
+        for name, make in BENCHMARKS.items():
+            if names and not any(part in name for part in names):
+                continue
+            game = BUILDERS[state](seed)
+            if name in SAVE_BENCHMARKS:
+                with tempfile.TemporaryDirectory() as directory:
+                    func, store = make(game, directory)
+                    results[f"{name}/{state}"] = time_call(func, repeat)
+                    if hasattr(store, "close"):
+                        store.close()
+            else:
+                results[f"{name}/{state}"] = time_call(make(game), repeat)
+    return results
+
+
+def compare(results, baseline):
+    """Compare results against a baseline.
+
+    Returns:
+        list: (key, baseline best, current best, relative change) for every
+            benchmark present in both, slowest change first
+    """
+    changes = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None or not previous["best_us"]:
+            continue
+        change = current["best_us"] / previous["best_us"] - 1
+        changes.append((key, previous["best_us"], current["best_us"], change))
+    changes.sort(key=lambda item: item[3], reverse=True)
+    return changes
+
+
+def print_results(results):
+    """Print benchmark results as a table."""
+    print("=" * 80)
+    print(f"{'Benchmark':<48}{'Median us':>14}{'Best us':>14}")
+    print("=" * 80)
+    for key, timing in results.items():
+        print(f"{key:<48}{timing['median_us']:>14.2f}{timing['best_us']:>14.2f}")
+
+
+def print_comparison(changes, tolerance):
+    """Print a comparison, marking regressions beyond the tolerance."""
+    print("\n" + "=" * 80)
+    print(f"{'Benchmark':<40}{'Baseline us':>13}{'Current us':>13}{'Change':>10}")
+    print("=" * 80)
+    for key, previous, current, change in changes:
+        flag = "  REGRESSION" if change > tolerance else ""
+        print(f"{key:<40}{previous:>13.2f}{current:>13.2f}{change:>+10.1%}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Multiverse Tycoon's hot paths.")
+    parser.add_argument("--states", nargs="+", choices=STATES, default=list(STATES),
+                        help="player states to run against (default: all)")
+    parser.add_argument("--filter", nargs="+", default=None, metavar="NAME",
+                        help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--repeat", type=int, default=5, help="timing rounds per benchmark (default 5)")
+    parser.add_argument("--seed", type=int, default=STATE_SEED, help="seed for building the states")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the results to a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="relative slowdown counted as a regression (default 0.15)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.states, args.filter, max(1, args.repeat), args.seed)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "seed": args.seed, "results": results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        changes = compare(results, baseline)
+        print_comparison(changes, args.tolerance)
+        regressions = [key for key, _, _, change in changes if change > args.tolerance]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}: "
+                  f"{', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
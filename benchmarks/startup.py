@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for Multiverse Tycoon.
+
+Measures, in fresh interpreters:
+    - import time of multiverse_tycoon (python -X importtime), with the
+      slowest modules it pulls in
+    - first-frame latency: from launching the game until the title menu
+      prompt has been written
+    - bare interpreter startup, for reference
+
+Usage:
+    python benchmarks/startup.py --runs 20
+    python benchmarks/startup.py --budget-ms 250   # fail if the first frame is slower
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME_SCRIPT = os.path.join(REPO_ROOT, "multiverse_tycoon.py")
+# Last line of the title menu; the prompt itself is not drawn when stdin is a pipe
+FIRST_FRAME_MARKER = b"3. Quit"
+
+
+def measure_interpreter_startup():
+    """Seconds to start and stop a bare interpreter."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start
+
+
+def measure_import_time():
+    """Import the game module with -X importtime.
+
+    Returns:
+        tuple: (total microseconds, {module: cumulative microseconds} for
+            the modules imported directly by multiverse_tycoon)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import multiverse_tycoon"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+    # Modules are listed after the imports they triggered, indented by depth
+    total = 0
+    direct_imports = {}
+    children = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            children[name.strip()] = int(cumulative)
+        elif depth == 0:
+            if name.strip() == "multiverse_tycoon":
+                total, direct_imports = int(cumulative), children
+            children = {}
+    return total, direct_imports
+
+
+def measure_first_frame():
+    """Seconds from launching the game until the title menu is drawn."""
+    env = dict(os.environ, MULTIVERSE_PACING="instant")
+    start = time.perf_counter()
+    game = subprocess.Popen(
+        [sys.executable, GAME_SCRIPT], cwd=REPO_ROOT, env=env,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    output = b""
+    while FIRST_FRAME_MARKER not in output:
+        chunk = os.read(game.stdout.fileno(), 65536)
+        if not chunk:
+            game.wait()
+            raise RuntimeError(f"Game exited before its first frame:\n{game.stderr.read().decode()}")
+        output += chunk
+    elapsed = time.perf_counter() - start
+
+    game.communicate(b"3\n")
+    return elapsed
+
+
+def run_benchmark(runs):
+    """Run every measurement several times.
+
+    Returns:
+        dict: Median timings in milliseconds, plus the slowest direct imports
+    """
+    interpreter = [measure_interpreter_startup() for _ in range(runs)]
+    imports = [measure_import_time() for _ in range(runs)]
+    first_frame = [measure_first_frame() for _ in range(runs)]
+
+    module_times = {}
+    for _, direct_imports in imports:
+        for name, micros in direct_imports.items():
+            module_times.setdefault(name, []).append(micros)
+    slowest = sorted(
+        ((name, statistics.median(times) / 1000) for name, times in module_times.items()),
+        key=lambda item: item[1], reverse=True)[:10]
+
+    return {
+        "runs": runs,
+        "interpreter_ms": round(statistics.median(interpreter) * 1000, 2),
+        "import_ms": round(statistics.median(total for total, _ in imports) / 1000, 2),
+        "first_frame_ms": round(statistics.median(first_frame) * 1000, 2),
+        "first_frame_p90_ms": round(sorted(first_frame)[int(0.9 * (runs - 1))] * 1000, 2),
+        "slowest_imports_ms": {name: round(ms, 2) for name, ms in slowest},
+    }
+
+
+def print_report(report):
+    """Print benchmark results in a readable form."""
+    print("=" * 80)
+    print(f"Startup benchmark ({report['runs']} runs, medians)")
+    print("=" * 80)
+    print(f"Interpreter startup:        {report['interpreter_ms']:8.2f} ms")
+    print(f"import multiverse_tycoon:   {report['import_ms']:8.2f} ms")
+    print(f"First frame:                {report['first_frame_ms']:8.2f} ms "
+          f"(p90 {report['first_frame_p90_ms']:.2f} ms)")
+    print("\nSlowest direct imports:")
+    for name, ms in report["slowest_imports_ms"].items():
+        print(f"  {name:<24} {ms:8.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure Multiverse Tycoon startup time.")
+    parser.add_argument("--runs", type=int, default=10, help="measurements per metric (default 10)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="exit with an error if the median first frame is slower than this")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(max(1, args.runs))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if args.budget_ms is not None and report["first_frame_ms"] > args.budget_ms:
+        print(f"\nFirst frame {report['first_frame_ms']:.2f} ms is over the "
+              f"{args.budget_ms:.2f} ms budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
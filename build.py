@@ -17,18 +17,14 @@ def print_separator():
 APP_NAME = "MultiVerseTycoon"
 MAIN_SCRIPT = "multiverse_tycoon.py"
 
-# Files to include in the distribution
+# Files to include in the distribution besides the game's modules; every
+# top-level .py file except this script is copied, so new modules are never
+# left out of the package
 INCLUDE_FILES = [
-    "multiverse_tycoon.py",
-    "currency.py",
-    "achievements.py",
-    "heists.py", 
-    "minigames.py",
-    "ad_rewards.py",
-    "admin_tools.py",  # Include for debugging
     "generated-icon.png",
     "README.md"
 ]
+BUILD_SCRIPT = os.path.basename(__file__)
 
 # Create the distribution folder
 dist_dir = "dist"
@@ -55,13 +51,22 @@ print_separator()
 
 # Copy all required files to the build directory
 print("Copying game files...")
-for file in INCLUDE_FILES:
+modules = sorted(file for file in os.listdir(".") if file.endswith(".py") and file != BUILD_SCRIPT)
+for file in modules + INCLUDE_FILES:
     if os.path.exists(file):
         shutil.copy(file, build_dir)
         print(f"  - Copied {file}")
     else:
         print(f"  - Warning: {file} not found, skipping")
 
+# Copy the game content data files
+content_dir = os.path.join(build_dir, "content")
+os.makedirs(content_dir)
+for file in sorted(os.listdir("content")):
+    if file.endswith(".json"):
+        shutil.copy(os.path.join("content", file), content_dir)
+        print(f"  - Copied content/{file}")
+
 # Create the platform-specific runner scripts in the build directory
 if system == "Windows" or True:  # Include Windows files for all platforms
     # Create Windows batch file
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Game content loaded from the JSON data files in the content directory.
+
+Each file is validated the first time it is loaded and the result is
+compiled into a marshal cache next to it (content/__cache__), keyed by the
+source file's modification time and size. Later startups load the cache
+directly and skip both JSON parsing and validation until the file changes.
+
+load_content() returns fresh, modifiable objects. The game itself uses
+get_content(), a read-only view of each file that is loaded once per process
+and shared by every game instance and subsystem, so a session only holds
+its own mutable state.
+"""
+
+import json
+import marshal
+import os
+from types import MappingProxyType
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+CACHE_DIRNAME = "__cache__"
+CACHE_SUFFIX = ".marshal"
+
+# Bump whenever validation or the compiled format changes
+CACHE_VERSION = 2
+
+NUMBER = (int, float)
+
+
+def _require(entry, fields, where):
+    """Check that an entry is an object with the given fields and types."""
+    if not isinstance(entry, dict):
+        raise ValueError(f"{where}: expected an object")
+    for field, types in fields.items():
+        if field not in entry:
+            raise ValueError(f"{where}: missing '{field}'")
+        if not isinstance(entry[field], types):
+            raise ValueError(f"{where}.{field}: unexpected value {entry[field]!r}")
+
+
+def _require_each(entries, fields, where):
+    """Check every value of an object (or item of a list) against the same fields."""
+    items = entries.items() if isinstance(entries, dict) else enumerate(entries)
+    for key, entry in items:
+        _require(entry, fields, f"{where}[{key!r}]")
+
+
+def _check_references(references, known, where):
+    """Check that every ID in references is one of the known IDs."""
+    for reference in references:
+        if reference not in known:
+            raise ValueError(f"{where}: unknown ID '{reference}'")
+
+
+def validate_universes(universes):
+    """Check the universe catalog: businesses and random events per universe."""
+    _require_each(universes, {
+        "name": str, "description": str, "currency": str, "risk_factor": NUMBER,
+        "level_required": int, "economic_traits": list, "businesses": dict, "events": list,
+    }, "universes")
+    for universe_id, universe in universes.items():
+        _require_each(universe["businesses"], {
+            "name": str, "cost": NUMBER, "income_per_turn": NUMBER,
+            "risk_increase": NUMBER, "description": str,
+        }, f"universes[{universe_id!r}].businesses")
+        _require_each(universe["events"], {"name": str, "description": str, "effect": dict},
+                      f"universes[{universe_id!r}].events")
+        for index, event in enumerate(universe["events"]):
+            # Optional relative chance of the event (default 1)
+            weight = event.get("weight", 1)
+            if not isinstance(weight, NUMBER) or weight <= 0:
+                raise ValueError(f"universes[{universe_id!r}].events[{index}].weight: "
+                                 f"unexpected value {weight!r}")
+
+
+def validate_employee_types(employee_types):
+    """Check the hireable employee types."""
+    _require_each(employee_types, {
+        "name": str, "hiring_cost": NUMBER, "salary_per_turn": NUMBER,
+        "efficiency_bonus": NUMBER, "risk_reduction": NUMBER,
+    }, "employee_types")
+
+
+def validate_heists(heists):
+    """Check difficulty levels, heist types, specialists and special items."""
+    _require(heists, {"difficulty_levels": dict, "heist_types": dict,
+                      "specialists": dict, "special_items": dict}, "heists")
+    _require_each(heists["difficulty_levels"], {
+        "name": str, "success_chance": NUMBER, "reward_multiplier": NUMBER,
+        "danger_increase": NUMBER, "min_preparation": NUMBER, "min_crew": int,
+    }, "heists.difficulty_levels")
+    for universe_id, heist_types in heists["heist_types"].items():
+        _require_each(heist_types, {
+            "name": str, "description": str, "base_reward": NUMBER,
+            "quantum_reward": NUMBER, "required_skills": list,
+        }, f"heists.heist_types[{universe_id!r}]")
+    _require_each(heists["specialists"], {
+        "name": str, "skills": list, "hiring_cost": NUMBER,
+        "payment_percentage": NUMBER, "success_bonus": NUMBER,
+    }, "heists.specialists")
+    _require_each(heists["special_items"], {
+        "name": str, "description": str, "cost": NUMBER,
+        "success_bonus": NUMBER, "applicable_heists": list,
+    }, "heists.special_items")
+
+
+def validate_minigames(minigames):
+    """Check the mini games, their universe themes and word lists."""
+    _require(minigames, {"mini_games": dict, "universe_themes": dict, "universe_word_lists": dict,
+                         "word_lists": dict, "symbols": list}, "minigames")
+    _require_each(minigames["mini_games"], {
+        "name": str, "base_description": str, "difficulty": str, "rewards": dict,
+    }, "minigames.mini_games")
+    _require_each(minigames["universe_word_lists"], {"easy": list, "medium": list, "hard": list},
+                  "minigames.universe_word_lists")
+    _require(minigames["word_lists"], {"easy": list, "medium": list, "hard": list},
+             "minigames.word_lists")
+
+
+def validate_research(technologies):
+    """Check the research tree, including that prerequisites exist."""
+    known = set()
+    for category, category_techs in technologies.items():
+        _require_each(category_techs, {
+            "name": str, "description": str, "cost": dict, "research_turns": int,
+            "effects": dict, "required_level": int, "prerequisites": list,
+        }, f"research[{category!r}]")
+        known.update(category_techs)
+    for category, category_techs in technologies.items():
+        for tech_id, tech in category_techs.items():
+            _check_references(tech["prerequisites"], known,
+                              f"research[{category!r}][{tech_id!r}].prerequisites")
+
+
+def validate_quests(quests):
+    """Check quests, their objectives and rewards, and that prerequisites exist."""
+    _require_each(quests, {"name": str, "description": str, "objectives": list, "rewards": dict},
+                  "quests")
+    for quest_id, quest in quests.items():
+        _require_each(quest["objectives"], {"description": str, "target": NUMBER},
+                      f"quests[{quest_id!r}].objectives")
+        _require(quest["rewards"], {"cash": NUMBER, "quantum": NUMBER, "xp": NUMBER},
+                 f"quests[{quest_id!r}].rewards")
+        _check_references(quest.get("prerequisites", []), quests,
+                          f"quests[{quest_id!r}].prerequisites")
+
+
+def validate_achievements(achievements):
+    """Check achievements and their optional reward and visibility fields."""
+    _require_each(achievements, {"name": str, "description": str}, "achievements")
+    optional = {"reward_cash": NUMBER, "reward_quantum": NUMBER, "universe_specific": (bool, str), "hidden": bool}
+    for achievement_id, achievement in achievements.items():
+        for field in achievement:
+            if field not in optional and field not in ("name", "description"):
+                raise ValueError(f"achievements[{achievement_id!r}]: unknown field '{field}'")
+            if field in optional and not isinstance(achievement[field], optional[field]):
+                raise ValueError(f"achievements[{achievement_id!r}].{field}: unexpected value {achievement[field]!r}")
+
+
+VALIDATORS = {
+    "universes": validate_universes,
+    "employee_types": validate_employee_types,
+    "heists": validate_heists,
+    "minigames": validate_minigames,
+    "research": validate_research,
+    "quests": validate_quests,
+    "achievements": validate_achievements,
+}
+
+
+def compile_content(name, directory=CONTENT_DIR):
+    """Parse and validate a content file.
+
+    Raises:
+        ValueError: If the file does not match what the game expects
+    """
+    path = os.path.join(directory, f"{name}.json")
+    with open(path, encoding="utf-8") as content_file:
+        data = json.load(content_file)
+    try:
+        VALIDATORS[name](data)
+    except ValueError as e:
+        raise ValueError(f"Invalid content in {path}: {e}") from None
+    return data
+
+
+def load_content(name, directory=CONTENT_DIR):
+    """Load a content file by name (e.g. "universes"), through the compiled cache.
+
+    Returns:
+        The file's data, as fresh objects owned by the caller
+    """
+    path = os.path.join(directory, f"{name}.json")
+    source = os.stat(path)
+    key = (CACHE_VERSION, source.st_mtime_ns, source.st_size)
+    cache_path = os.path.join(directory, CACHE_DIRNAME, f"{name}{CACHE_SUFFIX}")
+
+    try:
+        with open(cache_path, "rb") as cache_file:
+            cached_key, data = marshal.loads(cache_file.read())
+        if cached_key == key:
+            return data
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    data = compile_content(name, directory)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as cache_file:
+            marshal.dump((key, data), cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # Read-only installs simply validate on every start
+        pass
+    return data
+
+
+def freeze(data):
+    """Read-only copy of loaded content: objects become mapping proxies and lists tuples."""
+    if isinstance(data, dict):
+        return MappingProxyType({key: freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(freeze(item) for item in data)
+    return data
+
+
+# Content name -> frozen content shared by everything in this process
+_shared_content = {}
+
+
+def get_content(name):
+    """Shared read-only content for a file name (e.g. "universes"), loaded on first use."""
+    content = _shared_content.get(name)
+    if content is None:
+        content = _shared_content[name] = freeze(load_content(name))
+    return content
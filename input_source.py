@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Where the game reads its answers from.
+
+Every prompt goes through read_input(). By default it asks the keyboard with
+input(). A ScriptInput answers prompts with the lines of a file or pipe
+instead, one line per prompt, so whole sessions can run through the real
+menus without anyone at the keyboard. Prompts are only drawn when the output
+is a terminal; in a pipe or log they would just be noise.
+
+Script lines are answered exactly as typed, so an empty line presses Enter.
+Lines starting with "#" are comments.
+"""
+
+import sys
+
+
+class ScriptEnded(EOFError):
+    """The script ran out of lines."""
+
+
+class KeyboardInput:
+    """Reads answers from the keyboard."""
+
+    def read(self, prompt=""):
+        return input(prompt)
+
+
+class ScriptInput:
+    """Reads answers from the lines of a script."""
+
+    def __init__(self, stream, output=None):
+        """Initialize the script reader.
+
+        Args:
+            stream (file): Script to read, such as an open file or sys.stdin
+            output (file, optional): Where prompts would go; defaults to
+                whatever sys.stdout is at each prompt
+        """
+        self.stream = stream
+        self.output = output
+        self.answered = 0  # Prompts answered so far
+
+    def read(self, prompt=""):
+        """The next answer of the script.
+
+        Raises:
+            ScriptEnded: When the script has no lines left
+        """
+        # Send the frame built so far before waiting, like input() does
+        output = self.output or sys.stdout
+        output.flush()
+
+        while True:
+            line = self.stream.readline()
+            if not line:
+                raise ScriptEnded(f"Script ended after {self.answered} answers")
+            if not line.startswith("#"):
+                break
+        answer = line.rstrip("\r\n")
+        self.answered += 1
+
+        try:
+            interactive = output.isatty()
+        except (AttributeError, ValueError):
+            interactive = False
+        if interactive:
+            # Show the prompt with its answer, as if it had been typed
+            output.write(f"{prompt}{answer}\n")
+            output.flush()
+        return answer
+
+
+def open_script(path):
+    """A ScriptInput for a script file, or for standard input if path is "-"."""
+    if path == "-":
+        return ScriptInput(sys.stdin)
+    return ScriptInput(open(path, encoding="utf-8"))
+
+
+_source = None
+
+
+def get_input_source():
+    """The input source shared by the game and the admin tools.
+
+    Defaults to the keyboard, or to a script on standard input when it is
+    piped in rather than typed.
+    """
+    global _source
+    if _source is None:
+        try:
+            interactive = sys.stdin.isatty()
+        except (AttributeError, ValueError):
+            interactive = False
+        _source = KeyboardInput() if interactive else ScriptInput(sys.stdin)
+    return _source
+
+
+def set_input_source(source):
+    """Replace the input source, e.g. with open_script(path)."""
+    global _source
+    _source = source
+
+
+def read_input(prompt=""):
+    """Ask for an answer from the current input source."""
+    return get_input_source().read(prompt)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Append-only action journal for a campaign.
+
+Next to each save, the game keeps multiverse_tycoon_save_<name>.journal.jsonl:
+one JSON object per line, written as the game is played.
+
+    checkpoint  the full player state and random streams, when a game is
+                started or loaded; replays start here
+    action      a turn engine action and its arguments, e.g.
+                {"action": "start_business", "args": ["ai_lab"]}
+    turn        the end of a turn, with the random stream positions and the
+                canonical state hash before it
+    save        a save (or autosave) of the game at that point
+
+Together with the turn engine's determinism this is enough to replay a
+campaign headlessly (see replay.py): a save is a checkpoint, and everything
+played since is the journal's tail. When a save is loaded, the journal is cut
+back to the matching save entry, so play that was never saved drops out.
+"""
+
+import json
+import os
+
+from save_store import _plain
+
+JOURNAL_FORMAT = 1
+
+
+def _encode(entry):
+    return json.dumps(entry, separators=(",", ":"), default=_plain)
+
+
+def read_journal(path):
+    """Read every entry of a journal.
+
+    A final line cut short by a crash is ignored.
+    """
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return entries
+
+
+def _save_offset(path, turn, random_state):
+    """Byte offset just past the last save entry matching a loaded save, or 0."""
+    offset = end = 0
+    with open(path, "rb") as f:
+        for line in f:
+            end += len(line)
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            if (entry["type"] == "save" and entry["turn"] == turn
+                    and entry["random_state"] == random_state):
+                offset = end
+    return offset
+
+
+class ActionJournal:
+    """Writes one campaign's journal, one flushed line per entry."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    @classmethod
+    def open(cls, path, player, random_state, resumed=False):
+        """Start the journal for a new or loaded game with a checkpoint.
+
+        Args:
+            path (str): Journal file
+            player (dict): Player state the game continues from
+            random_state (dict): RandomStreams.state() of the game
+            resumed (bool): The player state was loaded from a save; the
+                journal is kept up to that save if it has a matching entry,
+                otherwise it is started over
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        keep = 0
+        if resumed and os.path.exists(path):
+            keep = _save_offset(path, player["turn"], random_state)
+        with open(path, "ab") as f:
+            f.truncate(keep)
+
+        journal = cls(path)
+        journal.record_checkpoint(player, random_state)
+        return journal
+
+    def write(self, entry):
+        """Append an entry, flushed so a crash loses at most the line being written."""
+        self._file.write(_encode(entry) + "\n")
+        self._file.flush()
+
+    def record_checkpoint(self, player, random_state):
+        self.write({"type": "checkpoint", "format": JOURNAL_FORMAT,
+                    "player": player, "random_state": random_state})
+
+    def record_action(self, turn, action, args):
+        self.write({"type": "action", "turn": turn, "action": action, "args": list(args)})
+
+    def record_turn(self, turn, universe_id, random_state, state_hash):
+        """Record the end of a turn played (and checked for game over) in universe_id."""
+        self.write({"type": "turn", "turn": turn, "universe": universe_id,
+                    "random_state": random_state, "state": state_hash})
+
+    def record_save(self, turn, random_state):
+        self.write({"type": "save", "turn": turn, "random_state": random_state})
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Declarative numbered menus.
+
+A Menu is a list of MenuOptions, each with a label, a handler and an optional
+guard deciding whether it is currently offered. Visible options are numbered
+in order; hidden options (like the admin code on the title screen) are
+selected by typing their key. Invalid input is handled inside a flat loop, so
+re-prompting never grows the stack, and the numbered option list is only
+rebuilt when the set of visible options changes.
+"""
+
+import time
+
+from input_source import read_input
+
+
+class MenuOption:
+    """One entry of a Menu."""
+
+    def __init__(self, label, handler=None, guard=None, name=None, key=None):
+        """Initialize a menu option.
+
+        Args:
+            label (str): Text shown after the option number; may span lines
+            handler (callable, optional): Called without arguments when chosen
+            guard (callable, optional): Returns whether the option is offered
+                right now; options without a guard are always offered
+            name (str, optional): Identifier for callers that need to know
+                which option was picked
+            key (str, optional): Typed instead of a number to pick the option;
+                options with a key are not numbered or listed
+        """
+        self.label = label
+        self.handler = handler
+        self.guard = guard
+        self.name = name
+        self.key = key
+
+    def available(self):
+        """Whether the option is currently offered."""
+        return self.guard is None or self.guard()
+
+
+class Menu:
+    """A numbered list of options, answered through read_input()."""
+
+    def __init__(self, options, prompt="\nSelect an option: ",
+                 invalid_message="\nInvalid choice. Please try again.",
+                 number_message=None):
+        """Initialize the menu.
+
+        Args:
+            options (list): MenuOptions in display order
+            prompt (str): Input prompt; "{count}" is replaced with the number
+                of listed options
+            invalid_message (str): Shown when the choice matches no option
+            number_message (str, optional): Shown instead when the choice is
+                not a number at all
+        """
+        self.options = options
+        self.prompt = prompt
+        self.invalid_message = invalid_message
+        self.number_message = number_message
+        self._layout_key = None
+        self._text = ""
+        self._dispatch = {}
+        self._count = 0
+
+    def layout(self):
+        """Build the rendered option list and choice table for the visible options.
+
+        Returns:
+            tuple: (text, dispatch) where dispatch maps typed choices to options
+        """
+        visible = tuple(option.available() for option in self.options)
+        if visible != self._layout_key:
+            lines = []
+            dispatch = {}
+            for option, shown in zip(self.options, visible):
+                if not shown:
+                    continue
+                if option.key is not None:
+                    dispatch[option.key.lower()] = option
+                    continue
+                number = str(len(lines) + 1)
+                lines.append(f"{number}. {option.label}")
+                dispatch[number] = option
+            self._layout_key = visible
+            self._text = "\n".join(lines)
+            self._dispatch = dispatch
+            self._count = len(lines)
+        return self._text, self._dispatch
+
+    def select(self, choice):
+        """The option a typed choice refers to, or None."""
+        _, dispatch = self.layout()
+        return dispatch.get(choice.strip().lower())
+
+    def choose(self, draw=None, pause=time.sleep):
+        """Show the menu until a valid option is picked.
+
+        Args:
+            draw (callable, optional): Draws the screen above the options
+            pause (callable): Called with a delay after an invalid choice
+
+        Returns:
+            MenuOption: The chosen option
+        """
+        while True:
+            if draw is not None:
+                draw()
+            text, _ = self.layout()
+            print(text)
+
+            choice = read_input(self.prompt.replace("{count}", str(self._count)))
+            option = self.select(choice)
+            if option is not None:
+                return option
+
+            if self.number_message and not choice.strip().isdigit():
+                print(self.number_message)
+            else:
+                print(self.invalid_message)
+            pause(0.75)
+
+    def run(self, draw=None, pause=time.sleep):
+        """Show the menu until a valid option is picked, then call its handler.
+
+        Returns:
+            The handler's return value
+        """
+        option = self.choose(draw, pause)
+        if option.handler is not None:
+            return option.handler()
+        return None
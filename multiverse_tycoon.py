@@ -1,22 +1,43 @@
 #!/usr/bin/env python3
 
-import json
-import random
 import time
 import os
 import sys
-from currency import CurrencyExchange, QuantumBusinesses, QuantumEvents
-from heists import HeistSystem
-from minigames import MiniGameSystem
-from research import ResearchSystem
-from achievements import AchievementSystem
-from quests import QuestSystem
+import argparse
+import atexit
+import shutil
+from functools import cached_property, partial
+from content import get_content
+import staff
+from save_store import JsonSaveStore, AutosaveWorker, SAVE_BACKENDS, open_save_store
+from renderer import get_renderer
+from input_source import read_input, open_script, set_input_source, ScriptEnded
+from pacing import Pacer, PACING_MODES
+from menus import Menu, MenuOption
+from timings import TurnTimings
+from random_streams import RandomStreams, EVENTS, QUANTUM_EVENTS, HEISTS, MINIGAMES
+from journal import ActionJournal
 
 
 class MultiVerseTycoon:
 
-    def __init__(self):
-        """Initialize the game with default settings."""
+    def __init__(self, autosave_every=0, save_backend=None, pacing=None, timings=None, seed=None,
+                 journal=True):
+        """Initialize the game with default settings.
+
+        Args:
+            autosave_every (int): Autosave every this many turns (0 disables autosave)
+            save_backend (str, optional): "json" or "sqlite"; defaults to the
+                MULTIVERSE_SAVE_BACKEND environment variable, then "json"
+            pacing (str, optional): "cinematic", "fast", "instant" or "skip";
+                defaults to the MULTIVERSE_PACING environment variable, then "cinematic"
+            timings (TurnTimings, optional): Records how long each phase of a
+                turn takes; turns are not timed without it
+            seed (int, optional): Campaign seed for the random streams; drawn
+                from the random module when omitted
+            journal (bool): Record every action in an action journal next
+                to the save, for replaying the campaign
+        """
         self.player = {
             "name": "",
             "universes": {},
@@ -53,511 +74,155 @@ class MultiVerseTycoon:
             }
         }
 
-        # Universe data includes level requirements for unlocking
-        self.universes = {
-            # Default starting universe
-            "blade_runner": {
-                "name": "Blade Runner",
-                "description": "A dystopian future where AI businesses thrive but are highly regulated.",
-                "currency": "Credits",
-                "risk_factor": 75,
-                "level_required": 1,  # Available from the start
-                "economic_traits": ["High-tech", "Unstable Politics", "AI-driven"],
-                "businesses": {
-                    "replicant_manufacturing": {
-                        "name": "Replicant Manufacturing",
-                        "cost": 10000,
-                        "income_per_turn": 2500,
-                        "risk_increase": 10,
-                        "description": "Create synthetic humans for dangerous work."
-                    },
-                    "memory_implants": {
-                        "name": "Memory Implants",
-                        "cost": 7500,
-                        "income_per_turn": 1800,
-                        "risk_increase": 5,
-                        "description": "Design and sell artificial memories for replicants."
-                    },
-                    "surveillance_tech": {
-                        "name": "Surveillance Tech",
-                        "cost": 5000,
-                        "income_per_turn": 1200,
-                        "risk_increase": 3,
-                        "description": "Develop technology to track replicants and citizens."
-                    }
-                },
-                "events": [{
-                    "name": "Replicant Uprising",
-                    "description": "Your replicants are rebelling against poor working conditions!",
-                    "effect": {
-                        "cash": -3000,
-                        "danger": 20,
-                        "reputation": -15
-                    }
-                }, {
-                    "name": "Blade Runner Investigation",
-                    "description": "Your business is being investigated by a Blade Runner.",
-                    "effect": {
-                        "cash": -1000,
-                        "danger": 15,
-                        "reputation": -5
-                    }
-                }, {
-                    "name": "Off-world Expansion",
-                    "description": "Opportunity to expand your business to off-world colonies.",
-                    "effect": {
-                        "cash": 5000,
-                        "danger": 5,
-                        "reputation": 10
-                    }
-                }, {
-                    "name": "Corporate Favor",
-                    "description": "A Tyrell Corporation executive offers you a partnership.",
-                    "effect": {
-                        "cash": 2000,
-                        "danger": -10,
-                        "reputation": 15
-                    }
-                }, {
-                    "name": "Blackout",
-                    "description": "Digital systems fail during a city-wide blackout.",
-                    "effect": {
-                        "cash": -2000,
-                        "danger": 0,
-                        "reputation": 0
-                    }
-                }]
-            },
-            "gta_v": {
-                "name": "GTA V",
-                "description": "A world of organized crime, corruption, and fast money.",
-                "currency": "Dollars",
-                "risk_factor": 60,
-                "level_required": 2,  # Unlocked at level 2
-                "economic_traits": ["Corruption", "Criminal Opportunities", "Fast Money"],
-                "businesses": {
-                    "nightclub": {
-                        "name": "Nightclub",
-                        "cost": 15000,
-                        "income_per_turn": 3500,
-                        "risk_increase": 8,
-                        "description": "Run a popular nightclub as a front for criminal activities."
-                    },
-                    "auto_shop": {
-                        "name": "Auto Shop",
-                        "cost": 12000,
-                        "income_per_turn": 2800,
-                        "risk_increase": 5,
-                        "description": "Modify stolen cars and sell them for profit."
-                    },
-                    "weapon_dealing": {
-                        "name": "Weapon Dealing",
-                        "cost": 20000,
-                        "income_per_turn": 4500,
-                        "risk_increase": 15,
-                        "description": "Trade illegal weapons on the black market."
-                    }
-                },
-                "events": [{
-                    "name": "Police Raid",
-                    "description": "The LSPD is raiding one of your businesses!",
-                    "effect": {
-                        "cash": -5000,
-                        "danger": 25,
-                        "reputation": -10
-                    }
-                }, {
-                    "name": "Gang War",
-                    "description": "Local gangs are fighting in your territory.",
-                    "effect": {
-                        "cash": -3000,
-                        "danger": 15,
-                        "reputation": 5
-                    }
-                }, {
-                    "name": "Heist Opportunity",
-                    "description": "You've been invited to participate in a major bank heist.",
-                    "effect": {
-                        "cash": 10000,
-                        "danger": 20,
-                        "reputation": 10
-                    }
-                }, {
-                    "name": "Corrupt Official",
-                    "description": "A police officer offers protection for your businesses.",
-                    "effect": {
-                        "cash": -2000,
-                        "danger": -15,
-                        "reputation": 0
-                    }
-                }, {
-                    "name": "Celebrity Client",
-                    "description": "A famous celebrity becomes a regular at your establishment.",
-                    "effect": {
-                        "cash": 3000,
-                        "danger": 0,
-                        "reputation": 15
-                    }
-                }]
-            },
-            "mcu": {
-                "name": "MCU",
-                "description": "A world of superheroes, advanced technology, and constant innovation.",
-                "currency": "USD",
-                "risk_factor": 50,
-                "level_required": 3,  # Unlocked at level 3
-                "economic_traits": ["High Innovation", "Superhero Interference", "Tech-driven"],
-                "businesses": {
-                    "stark_tech_competitor": {
-                        "name": "Stark Tech Competitor",
-                        "cost": 25000,
-                        "income_per_turn": 5000,
-                        "risk_increase": 7,
-                        "description": "Develop advanced technology to compete with Stark Industries."
-                    },
-                    "superhero_insurance": {
-                        "name": "Superhero Insurance",
-                        "cost": 15000,
-                        "income_per_turn": 3000,
-                        "risk_increase": 3,
-                        "description": "Provide insurance against damage caused by superhero battles."
-                    },
-                    "shield_supplies": {
-                        "name": "S.H.I.E.L.D. Supplies",
-                        "cost": 20000,
-                        "income_per_turn": 4000,
-                        "risk_increase": 5,
-                        "description": "Supply equipment and technology to S.H.I.E.L.D. agents."
-                    }
-                },
-                "events": [{
-                    "name": "Avengers Battle",
-                    "description": "A battle between The Avengers and a villain destroyed part of your business!",
-                    "effect": {
-                        "cash": -6000,
-                        "danger": 10,
-                        "reputation": 0
-                    }
-                }, {
-                    "name": "Stark Partnership",
-                    "description": "Tony Stark offers to collaborate on a new technology.",
-                    "effect": {
-                        "cash": 8000,
-                        "danger": -5,
-                        "reputation": 20
-                    }
-                }, {
-                    "name": "Alien Artifact",
-                    "description": "You discovered an alien artifact with valuable technology.",
-                    "effect": {
-                        "cash": 5000,
-                        "danger": 15,
-                        "reputation": 5
-                    }
-                }, {
-                    "name": "Government Scrutiny",
-                    "description": "Your business is being investigated for potential Hydra connections.",
-                    "effect": {
-                        "cash": -2000,
-                        "danger": 10,
-                        "reputation": -10
-                    }
-                }, {
-                    "name": "Multiverse Entrepreneur Award",
-                    "description": "Your innovative business model wins a prestigious award.",
-                    "effect": {
-                        "cash": 3000,
-                        "danger": 0,
-                        "reputation": 15
-                    }
-                }]
-            },
-            # New worlds as requested
-            "doraemon": {
-                "name": "Doraemon",
-                "description": "A world where futuristic gadgets from the 22nd century help solve everyday problems.",
-                "currency": "Yen",
-                "risk_factor": 40,
-                "level_required": 4,  # Unlocked at level 4
-                "economic_traits": ["Future Technology", "Kid-Friendly", "Gadget-Based"],
-                "businesses": {
-                    "gadget_shop": {
-                        "name": "Future Gadget Shop",
-                        "cost": 20000,
-                        "income_per_turn": 4000,
-                        "risk_increase": 5,
-                        "description": "Sell unique gadgets from the 22nd century to help with daily life."
-                    },
-                    "anywhere_door_transport": {
-                        "name": "Anywhere Door Transport",
-                        "cost": 30000,
-                        "income_per_turn": 6000,
-                        "risk_increase": 10,
-                        "description": "Provide instantaneous transportation services to any location."
-                    },
-                    "time_machine_tours": {
-                        "name": "Time Machine Tours",
-                        "cost": 40000,
-                        "income_per_turn": 8000,
-                        "risk_increase": 15,
-                        "description": "Offer guided historical tours through different time periods."
-                    }
-                },
-                "events": [{
-                    "name": "Gadget Malfunction",
-                    "description": "One of your futuristic gadgets has gone haywire!",
-                    "effect": {
-                        "cash": -4000,
-                        "danger": 15,
-                        "reputation": -5
-                    }
-                }, {
-                    "name": "Rival Inventor",
-                    "description": "A jealous inventor tries to sabotage your technology.",
-                    "effect": {
-                        "cash": -3000,
-                        "danger": 10,
-                        "reputation": -10
-                    }
-                }, {
-                    "name": "Temporal Agency Inspection",
-                    "description": "The Time Patrol is inspecting your time machine tours for regulations compliance.",
-                    "effect": {
-                        "cash": -2000,
-                        "danger": 5,
-                        "reputation": 0
-                    }
-                }, {
-                    "name": "Future Tech Award",
-                    "description": "Your gadget innovations win a prestigious award from the 22nd century.",
-                    "effect": {
-                        "cash": 5000,
-                        "danger": 0,
-                        "reputation": 20
-                    }
-                }, {
-                    "name": "Special Customer",
-                    "description": "A mysterious blue cat robot becomes a loyal customer and promoter.",
-                    "effect": {
-                        "cash": 3000,
-                        "danger": -10,
-                        "reputation": 15
-                    }
-                }]
-            },
-            "harry_potter": {
-                "name": "Wizarding World",
-                "description": "A hidden magical society with its own economy, government, and educational system.",
-                "currency": "Galleons",
-                "risk_factor": 65,
-                "level_required": 5,  # Unlocked at level 5
-                "economic_traits": ["Magic-Powered", "Secretive", "Traditional"],
-                "businesses": {
-                    "wand_shop": {
-                        "name": "Wand Crafting",
-                        "cost": 25000,
-                        "income_per_turn": 5500,
-                        "risk_increase": 8,
-                        "description": "Craft and sell magical wands to witches and wizards."
-                    },
-                    "potion_brewery": {
-                        "name": "Potion Brewery",
-                        "cost": 20000,
-                        "income_per_turn": 4500,
-                        "risk_increase": 12,
-                        "description": "Brew and sell various magical potions for any need."
-                    },
-                    "magical_creatures_sanctuary": {
-                        "name": "Magical Creatures Sanctuary",
-                        "cost": 35000,
-                        "income_per_turn": 7000,
-                        "risk_increase": 15,
-                        "description": "Care for and study magical creatures while offering tours to visitors."
-                    }
-                },
-                "events": [{
-                    "name": "Ministry Raid",
-                    "description": "The Ministry of Magic is investigating your business for illegal magical artifacts.",
-                    "effect": {
-                        "cash": -5000,
-                        "danger": 20,
-                        "reputation": -10
-                    }
-                }, {
-                    "name": "Dark Wizard Threat",
-                    "description": "Dark wizards are threatening your business unless you pay protection money.",
-                    "effect": {
-                        "cash": -4000,
-                        "danger": 15,
-                        "reputation": -5
-                    }
-                }, {
-                    "name": "Magical Mishap",
-                    "description": "A spell gone wrong has caused chaos in your establishment.",
-                    "effect": {
-                        "cash": -3000,
-                        "danger": 10,
-                        "reputation": 0
-                    }
-                }, {
-                    "name": "Famous Wizard Visit",
-                    "description": "A famous wizard publicly endorses your business.",
-                    "effect": {
-                        "cash": 6000,
-                        "danger": 0,
-                        "reputation": 20
-                    }
-                }, {
-                    "name": "Magical Innovation",
-                    "description": "You've discovered a new magical process that revolutionizes your industry.",
-                    "effect": {
-                        "cash": 8000,
-                        "danger": 5,
-                        "reputation": 15
-                    }
-                }]
-            },
-            "dark_netflix": {
-                "name": "Dark (Netflix)",
-                "description": "A world where time travel connects multiple generations across different eras in a complex web of cause and effect.",
-                "currency": "Euros",
-                "risk_factor": 80,
-                "level_required": 6,  # Unlocked at level 6
-                "economic_traits": ["Time-Influenced", "Paradox-Prone", "Mysterious"],
-                "businesses": {
-                    "temporal_consultancy": {
-                        "name": "Temporal Consultancy",
-                        "cost": 40000,
-                        "income_per_turn": 8000,
-                        "risk_increase": 20,
-                        "description": "Provide strategic advice to clients across different time periods."
-                    },
-                    "nuclear_power": {
-                        "name": "Nuclear Power Research",
-                        "cost": 50000,
-                        "income_per_turn": 10000,
-                        "risk_increase": 25,
-                        "description": "Research advanced nuclear technology with help from different time periods."
-                    },
-                    "cave_expeditions": {
-                        "name": "Winden Cave Tours",
-                        "cost": 30000,
-                        "income_per_turn": 6000,
-                        "risk_increase": 15,
-                        "description": "Guide special tours through the mysterious cave system (avoiding the time portal)."
-                    }
-                },
-                "events": [{
-                    "name": "Temporal Paradox",
-                    "description": "A paradox has occurred affecting your business across multiple time periods!",
-                    "effect": {
-                        "cash": -8000,
-                        "danger": 30,
-                        "reputation": -15
-                    }
-                }, {
-                    "name": "Prophet's Warning",
-                    "description": "A mysterious old man warns you of impending apocalypse.",
-                    "effect": {
-                        "cash": -3000,
-                        "danger": 20,
-                        "reputation": -5
-                    }
-                }, {
-                    "name": "Time Travel Incident",
-                    "description": "An employee accidentally traveled through time and altered something.",
-                    "effect": {
-                        "cash": -5000,
-                        "danger": 25,
-                        "reputation": -10
-                    }
-                }, {
-                    "name": "Future Investment",
-                    "description": "Someone from the future has invested heavily in your business.",
-                    "effect": {
-                        "cash": 10000,
-                        "danger": 10,
-                        "reputation": 10
-                    }
-                }, {
-                    "name": "Temporal Loop Advantage",
-                    "description": "You've managed to exploit knowledge from a time loop for business gain.",
-                    "effect": {
-                        "cash": 12000,
-                        "danger": 15,
-                        "reputation": 5
-                    }
-                }]
-            }
-        }
-
-        self.employee_types = {
-            "manager": {
-                "name": "Manager",
-                "hiring_cost": 1000,
-                "salary_per_turn": 500,
-                "efficiency_bonus": 0.15,  # 15% more income
-                "risk_reduction": 1,  # Reduces danger by 1 each turn
-            },
-            "security": {
-                "name": "Security Personnel",
-                "hiring_cost": 800,
-                "salary_per_turn": 400,
-                "efficiency_bonus": 0.05,  # 5% more income
-                "risk_reduction": 3,  # Reduces danger by 3 each turn
-            },
-            "tech_expert": {
-                "name": "Tech Expert",
-                "hiring_cost": 1500,
-                "salary_per_turn": 700,
-                "efficiency_bonus": 0.2,  # 20% more income
-                "risk_reduction": 2,  # Reduces danger by 2 each turn
-            }
+        # Universe catalog (with level requirements for unlocking) and employee types
+        self.universes = get_content("universes")
+        self.employee_types = get_content("employee_types")
+
+        # Announcements shown when a feature unlocks: (title, detail lines)
+        self.FEATURE_UNLOCK_MESSAGES = {
+            "universe_travel": ("Universe Travel", ["You can now jump between different universes."]),
+            "currency_exchange": ("Currency Exchange", ["You can now exchange currencies between universes."]),
+            "mini_games": ("Mini Games", ["Play games to earn extra rewards!"]),
+            "research": ("Quantum Research Division", [
+                "Research new technologies to enhance your interdimensional operations.",
+                "Advanced technologies can help stabilize the multiverse faster!"]),
+            "heist_operations": ("Heist Operations", ["Plan and execute heists for big rewards!"]),
+            "specialists": ("Specialists Recruitment", ["Hire specialist crew members to improve your heist success rates."]),
+            "special_items": ("Special Items", ["Purchase special equipment to help with your heists."]),
         }
 
         self.DETECTION_RISK_THRESHOLD = 100  # Maximum allowed detection risk
         self.starting_cash = 10000
 
-        # Initialize currency exchange system
-        self.currency_exchange = CurrencyExchange(self.universes)
-
-        # Initialize quantum business system
-        self.quantum_businesses = QuantumBusinesses()
-
-        # Initialize quantum events
-        self.quantum_events = QuantumEvents()
-
         # Constants for quantum events
         self.QUANTUM_EVENT_PROBABILITY = 0.15  # 15% chance per turn
         self.QUANTUM_EVENT_COOLDOWN = 3  # At least 3 turns between events
 
-        # Initialize heist system
-        self.heist_system = HeistSystem(self.universes)
-        
-        # Initialize mini game system
-        self.mini_game_system = MiniGameSystem()
-        
-        # Initialize research system
-        self.research_system = ResearchSystem()
-        
-        # Initialize achievement system
-        self.achievement_system = AchievementSystem()
-        
-        # Initialize quest system
-        self.quest_system = QuestSystem()
+        # Every subsystem rolls its own dice, all derived from the campaign seed
+        self.random_streams = RandomStreams(seed)
+
+        # Subsystems are imported and built on first use; drop any built for a previous game
+        for name in self.SUBSYSTEMS:
+            self.__dict__.pop(name, None)
+
+        # Save locations, in order of preference; they build the currency
+        # exchange on the first save rather than now
+        self.save_backend = save_backend
+        currency_exchange = partial(getattr, self, "currency_exchange")
+        self.save_stores = [open_save_store(save_backend, currency_exchange=currency_exchange)]
+        if isinstance(self.save_stores[0], JsonSaveStore):
+            self.save_stores.append(JsonSaveStore(".", currency_exchange=currency_exchange))
+
+        # Background autosave into the primary save location
+        self.autosave_every = autosave_every
+        self.autosave = None
+        if autosave_every > 0:
+            self.autosave = AutosaveWorker(self.save_stores[0])
+            atexit.register(self.autosave.close)
+
+        # Screens are drawn as single buffered frames
+        self.renderer = get_renderer()
+
+        # Typing effects and pauses
+        self.pacing = pacing
+        self.pacer = Pacer(pacing)
+
+        # Turn phase timings, kept across games in the same session
+        self.timings = timings
+
+        # Action journal of the game being played, opened once it has a player
+        self.record_journal = journal
+        self.journal = None
+
+        self.title_menu = Menu([
+            MenuOption("New Game", self.new_game),
+            MenuOption("Load Game", self.load_game),
+            MenuOption("Quit", self.quit_game),
+            MenuOption("Admin tools", self.admin_tools, key="admin"),  # Secret admin access
+        ])
+        self.action_menu = self.build_action_menu()
+
+    # Subsystems built lazily, most of them stay locked for the first turns
+    SUBSYSTEMS = (
+        "currency_exchange", "quantum_businesses", "quantum_events", "heist_system",
+        "mini_game_system", "research_system", "achievement_system", "quest_system", "turn_engine",
+    )
+
+    @cached_property
+    def currency_exchange(self):
+        """Currency exchange system."""
+        from currency import CurrencyExchange
+        return CurrencyExchange(self.universes)
+
+    @cached_property
+    def quantum_businesses(self):
+        """Quantum business system."""
+        from currency import QuantumBusinesses
+        return QuantumBusinesses()
+
+    @cached_property
+    def quantum_events(self):
+        """Quantum events."""
+        from currency import QuantumEvents
+        return QuantumEvents()
+
+    @cached_property
+    def heist_system(self):
+        """Heist system (heist operations unlock at turn 20)."""
+        from heists import HeistSystem
+        return HeistSystem(self.universes, rng=self.random_streams[HEISTS])
+
+    @cached_property
+    def mini_game_system(self):
+        """Mini game system (mini games unlock at turn 5)."""
+        from minigames import MiniGameSystem
+        return MiniGameSystem(rng=self.random_streams[MINIGAMES])
+
+    @cached_property
+    def research_system(self):
+        """Research system."""
+        from research import ResearchSystem
+        return ResearchSystem()
+
+    @cached_property
+    def achievement_system(self):
+        """Achievement system."""
+        from achievements import AchievementSystem
+        return AchievementSystem()
+
+    @cached_property
+    def quest_system(self):
+        """Quest system."""
+        from quests import QuestSystem
+        return QuestSystem()
+
+    @cached_property
+    def turn_engine(self):
+        """Headless turn logic shared by the menus, bots and simulations."""
+        from turn_engine import TurnEngine
+        return TurnEngine(
+            self.universes, self.employee_types, self.research_system,
+            self.achievement_system, self.quest_system,
+            currency_exchange=self.currency_exchange,
+            starting_cash=self.starting_cash,
+            detection_risk_threshold=self.DETECTION_RISK_THRESHOLD,
+            timings=self.timings,
+            rng=self.random_streams[EVENTS],
+            heist_system=self.heist_system,
+            mini_game_system=self.mini_game_system)
 
     def clear_screen(self):
-        """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the terminal screen and start buffering the next frame."""
+        self.renderer.clear()
+        self.pacer.new_screen()
+
+    def pause(self, seconds):
+        """Show what has been printed so far, then wait as the pacing mode allows."""
+        self.pacer.pause(seconds)
 
     def slow_print(self, text, delay=0.01):
-        """Print text with a typing effect, but faster."""
-        # Reduced delay from 0.03 to 0.01 for faster typing effect
-        for char in text:
-            sys.stdout.write(char)
-            sys.stdout.flush()
-            time.sleep(delay)
-        print()
+        """Print text with a typing effect, as the pacing mode allows."""
+        self.pacer.type_text(text, delay)
 
     def display_title(self):
         """Display the game title."""
@@ -578,7 +243,7 @@ class MultiVerseTycoon:
         ]
         
         # Get terminal width
-        terminal_width = os.get_terminal_size().columns
+        terminal_width = shutil.get_terminal_size().columns
         
         # Print each line centered
         print("")  # Add a blank line before the title
@@ -591,61 +256,40 @@ class MultiVerseTycoon:
         print("=" * 80 + "\n")
 
     def start_game(self):
-        """Start a new game or load a saved game."""
+        """Show the title screen to start a new game or load a saved game until the player quits."""
+        while True:
+            self.title_menu.run(draw=self.display_title_screen, pause=self.pause)
+
+    def display_title_screen(self):
+        """Draw the title screen above the title menu."""
         self.clear_screen()
         self.display_title()
+        print("\n")
 
-        print("\n\n1. New Game")
-        print("2. Load Game")
-        print("3. Quit")
-
-        choice = input("\nSelect an option: ")
+    def quit_game(self):
+        """Say goodbye and exit."""
+        print("\nThanks for playing Multiverse Tycoon!")
+        sys.exit()
 
-        if choice == "1":
-            self.new_game()
-        elif choice == "2":
-            self.load_game()
-        elif choice == "3":
-            print("\nThanks for playing Multiverse Tycoon!")
-            sys.exit()
-        elif choice.lower() == "admin":  # Secret admin access
-            self.admin_tools()
-        else:
-            print("\nInvalid choice. Please try again.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
-            self.start_game()
-            
     def admin_tools(self):
         """Access admin tools for developers and debugging."""
         try:
             import admin_tools
-            admin_tools.admin_menu()
-            self.start_game()
+            admin_tools.admin_menu(self.save_stores[0], self.timings)
         except ImportError:
             print("\nAdmin tools not found. This feature is only for developers.")
-            time.sleep(1.5)
-            self.start_game()
+            self.pause(1.5)
 
     def new_game(self):
         """Initialize a new game."""
         self.clear_screen()
         print("\n=== New Multiverse Tycoon Game ===\n")
 
-        player_name = input("Enter your name, multiverse entrepreneur: ")
-        self.player["name"] = player_name
-
-        # Initialize player state for each universe
-        for universe_id, universe in self.universes.items():
-            self.player["universes"][universe_id] = {
-                "cash": self.starting_cash,
-                "danger": 0,  # This is now detection_risk but keeping variable name for compatibility
-                "reputation": 0,
-                "businesses": [],
-                "employees": []
-            }
+        player_name = read_input("Enter your name, multiverse entrepreneur: ")
 
-        # Start in the Blade Runner universe
-        self.player["current_universe"] = "blade_runner"
+        # Initialize player state for each universe and start in Blade Runner
+        self.turn_engine.start_new_game(self.player, player_name)
+        self.open_journal()
 
         # Core narrative introduction
         self.clear_screen()
@@ -680,91 +324,88 @@ class MultiVerseTycoon:
         
         self.slow_print("\nThe fate of all realities rests in your hands. Good luck, Tycoon.")
 
-        input("\nPress Enter to begin your adventure...")
+        read_input("\nPress Enter to begin your adventure...")
         self.main_game_loop()
 
     def save_game(self):
-        """Save the current game state to a file."""
-        # Create saves directory if it doesn't exist
-        if not os.path.exists("saves"):
-            try:
-                os.makedirs("saves")
-            except Exception:
-                # If we can't create the directory, save in the current directory
-                pass
-                
-        # Try to save in the saves directory first
-        try:
-            save_path = os.path.join("saves", f"multiverse_tycoon_save_{self.player['name']}.json")
-            with open(save_path, "w") as save_file:
-                json.dump(self.player, save_file)
-            print(f"\nGame saved successfully as '{save_path}'!")
-        except Exception as e:
-            # Fall back to current directory if saves directory doesn't work
+        """Save the current game state, appending only what changed since the last save."""
+        self.player["random_state"] = self.random_streams.state()
+        if self.journal:
+            self.journal.record_save(self.player["turn"], self.player["random_state"])
+
+        # With autosave on, go through the worker so saves are written in order
+        if self.autosave:
+            self.autosave.submit(self.player)
+            self.autosave.flush()
+            if not self.autosave.last_error:
+                print(f"\nGame saved successfully as '{self.autosave.store.save_path(self.player['name'])}'!")
+                read_input("\nPress Enter to continue...")
+                return
+
+        # Try to save in the saves directory first, then fall back to the current directory
+        for store in self.save_stores:
             try:
-                fallback_path = f"multiverse_tycoon_save_{self.player['name']}.json"
-                with open(fallback_path, "w") as save_file:
-                    json.dump(self.player, save_file)
-                print(f"\nGame saved successfully as '{fallback_path}'!")
+                save_path = store.save(self.player)
+                print(f"\nGame saved successfully as '{save_path}'!")
+                break
             except Exception as e:
-                print(f"\nError saving game: {e}")
+                error = e
+        else:
+            print(f"\nError saving game: {error}")
 
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
 
     def load_game(self):
-        """Load a saved game state from a file."""
-        # Check for save files in both the saves directory and current directory
-        save_files = []
-        
-        # Check saves directory if it exists
-        if os.path.exists("saves"):
-            save_files.extend([
-                os.path.join("saves", f) for f in os.listdir("saves")
-                if f.startswith("multiverse_tycoon_save_") and f.endswith(".json")
-            ])
-        
-        # Also check current directory
-        save_files.extend([
-            f for f in os.listdir()
-            if f.startswith("multiverse_tycoon_save_") and f.endswith(".json")
-        ])
+        """Pick a saved game and play it, returning to the title screen afterwards."""
+        while True:
+            # Check for save files in both the saves directory and current directory
+            save_files = [
+                (store, save_info)
+                for store in self.save_stores
+                for save_info in store.list_save_info()
+            ]
 
-        if not save_files:
-            print("\nNo saved games found!")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
-            self.start_game()
-            return
+            if not save_files:
+                print("\nNo saved games found!")
+                self.pause(0.75)  # Reduced delay for faster gameplay
+                return
 
-        print("\n=== Load Game ===\n")
-        for i, save_file in enumerate(save_files, 1):
-            # Extract player name from filename, handling both path formats
-            file_name = os.path.basename(save_file)
-            player_name = file_name[22:-5]
-            print(f"{i}. {player_name}")
+            options = []
+            for store, save_info in save_files:
+                last_saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(save_info["last_saved"]))
+                options.append(MenuOption(
+                    f"{save_info['name']} - Level {save_info['level']}, Turn {save_info['turn']}, "
+                    f"{save_info['universes_unlocked']} universes unlocked (saved {last_saved})",
+                    partial(self.resume_game, store, save_info["name"])))
+            options.append(MenuOption("Back"))
+
+            load_menu = Menu(options, prompt="\nSelect a save file: ")
+            if load_menu.run(draw=lambda: print("\n=== Load Game ===\n"), pause=self.pause) is not False:
+                return
 
-        print(f"{len(save_files) + 1}. Back")
+    def resume_game(self, store, name):
+        """Load a save and continue playing it.
 
+        Returns:
+            bool: False if the save could not be loaded
+        """
         try:
-            choice = int(input("\nSelect a save file: "))
-            if choice == len(save_files) + 1:
-                self.start_game()
-                return
-
-            if 1 <= choice <= len(save_files):
-                filename = save_files[choice - 1]
-                with open(filename, "r") as file:
-                    self.player = json.load(file)
-                print(f"\nWelcome back, {self.player['name']}!")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
-                self.main_game_loop()
-            else:
-                print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
-                self.load_game()
+            player = store.load(name)
         except Exception as e:
             print(f"\nError loading game: {e}")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
-            self.load_game()
+            self.pause(0.75)  # Reduced delay for faster gameplay
+            return False
+
+        self.player = player
+        staff.upgrade_player_staff(self.player)
+        if "random_state" in player:
+            # Carry on with the dice exactly where the save left them
+            self.random_streams.restore(player["random_state"])
+        self.open_journal(resumed=True)
+        print(f"\nWelcome back, {self.player['name']}!")
+        self.pause(0.75)  # Reduced delay for faster gameplay
+        self.main_game_loop()
+        return True
 
     def display_universe_info(self):
         """Display information about the current universe."""
@@ -796,8 +437,9 @@ class MultiVerseTycoon:
         print(f"Local Influence: {player_universe_data['reputation']}")
         
         # Network statistics
-        print(f"\nNetwork Status: {sum(len(universe_data['businesses']) for universe_data in self.player['universes'].values())} business nodes")
-        print(f"Network Spread: {sum(1 for universe_data in self.player['universes'].values() if len(universe_data['businesses']) > 0)}/{len(self.player['unlocked_universes'])} universes")
+        empire = self.turn_engine.empire(self.player)
+        print(f"\nNetwork Status: {empire.total_businesses} business nodes")
+        print(f"Network Spread: {empire.universes_with_businesses}/{len(self.player['unlocked_universes'])} universes")
         print(f"Mission Cycle: {self.player['turn']}")
         
         # Research status
@@ -846,178 +488,76 @@ class MultiVerseTycoon:
 
         if player_universe_data['employees']:
             print("\n=== Your Employees ===")
-            for employee in player_universe_data['employees']:
-                emp_type = self.employee_types[employee['type']]
+            for emp_id, count in staff.type_counts(player_universe_data['employees']):
+                emp_type = self.employee_types[emp_id]
                 print(
-                    f"- {emp_type['name']} (Salary: {emp_type['salary_per_turn']} {universe['currency']}/turn)"
+                    f"- {emp_type['name']} x{count} (Salary: {emp_type['salary_per_turn']} {universe['currency']}/turn each)"
                 )
 
         print(f"\nTurn: {self.player['turn']}")
 
+    def build_action_menu(self):
+        """Create the in-game action menu; options appear as features unlock."""
+        def unlocked(feature):
+            return lambda: self.player["unlocked_features"][feature]
+
+        return Menu([
+            MenuOption("Start a new business", self.start_business),
+            MenuOption("Hire employees", self.hire_employee),
+            MenuOption("Fire employees", self.fire_employee),
+            MenuOption("Reduce Detection Risk", self.reduce_detection_risk),
+            MenuOption("Jump to another universe", self.jump_universe, unlocked("universe_travel")),
+            MenuOption("Currency exchange", self.currency_exchange_menu, unlocked("currency_exchange")),
+            MenuOption("View exchange rates", self.view_exchange_rates, unlocked("currency_exchange")),
+            MenuOption("Heist operations", self.heist_operations, unlocked("heist_operations")),
+            MenuOption("Recruit specialists", self.recruit_specialists, unlocked("specialists")),
+            MenuOption("Purchase special items", self.purchase_special_items, unlocked("special_items")),
+            MenuOption("Play mini games", self.play_mini_games, unlocked("mini_games")),
+            MenuOption("Research new technologies", self.research_menu, unlocked("research")),
+            # Achievements, quests, saving and quitting are always available
+            MenuOption("View Achievements", self.achievements_menu),
+            MenuOption("View Quests", self.quests_menu),
+            MenuOption("Save game", self.save_game, name="save"),
+            MenuOption("Quit game", self.confirm_quit, name="quit"),
+        ], prompt="\nChoose an action (1-{count}): ",
+            number_message="\nInvalid choice. Please enter a number.")
+
+    def display_action_screen(self):
+        """Draw the universe overview above the action menu."""
+        self.display_universe_info()
+        print("\n=== Actions ===")
+
+    def confirm_quit(self):
+        """Quit the game if the player confirms."""
+        confirm = read_input(
+            "\nAre you sure you want to quit? Progress will be lost unless saved. (y/n): "
+        )
+        if confirm.lower() == "y":
+            self.quit_game()
+
     def main_game_loop(self):
-        """Main game loop."""
+        """Main game loop; returns once the game is over and the player goes back to the title screen."""
         while not self.player["game_over"]:
             universe_id = self.player["current_universe"]
-            universe = self.universes[universe_id]
-            player_universe_data = self.player["universes"][universe_id]
 
-            # Display universe and player info
-            self.display_universe_info()
+            option = self.action_menu.choose(draw=self.display_action_screen, pause=self.pause)
+            option.handler()
 
-            # Display menu options
-            print("\n=== Actions ===")
-            print("1. Start a new business")
-            print("2. Hire employees")
-            print("3. Fire employees")
-            print("4. Reduce Detection Risk")
-            
-            # Only show unlocked features
-            options = []
-            option_index = 5  # Start counting from option 5
-            
-            # Universe travel (unlocks at turn 10)
-            if self.player["unlocked_features"]["universe_travel"]:
-                print(f"{option_index}. Jump to another universe")
-                options.append("universe_travel")
-                option_index += 1
-            
-            # Currency exchange (unlocks at turn 15)
-            if self.player["unlocked_features"]["currency_exchange"]:
-                print(f"{option_index}. Currency exchange")
-                options.append("currency_exchange")
-                option_index += 1
-                print(f"{option_index}. View exchange rates")
-                options.append("exchange_rates")
-                option_index += 1
-            
-            # Heist operations (unlocks at turn 20)
-            if self.player["unlocked_features"]["heist_operations"]:
-                print(f"{option_index}. Heist operations")
-                options.append("heist_operations")
-                option_index += 1
-            
-            # Specialists (unlocks after completing 2 heists)
-            if self.player["unlocked_features"]["specialists"]:
-                print(f"{option_index}. Recruit specialists")
-                options.append("specialists")
-                option_index += 1
-            
-            # Special items (unlocks after recruiting 2 specialists)
-            if self.player["unlocked_features"]["special_items"]:
-                print(f"{option_index}. Purchase special items")
-                options.append("special_items")
-                option_index += 1
-            
-            # Mini games (unlocks at turn 5)
-            if self.player["unlocked_features"]["mini_games"]:
-                print(f"{option_index}. Play mini games")
-                options.append("mini_games")
-                option_index += 1
-                
-            if self.player["unlocked_features"]["research"]:
-                print(f"{option_index}. Research new technologies")
-                options.append("research")
-                option_index += 1
-                
-            # Achievements are always available
-            print(f"{option_index}. View Achievements")
-            options.append("achievements")
-            option_index += 1
-            
-            # Quests are always available
-            print(f"{option_index}. View Quests")
-            options.append("quests")
-            option_index += 1
-                
-            # Ad rewards option removed
-            
-            # Always available options
-            print(f"{option_index}. Save game")
-            options.append("save")
-            option_index += 1
-            
-            print(f"{option_index}. Quit game")
-            options.append("quit")
-            
-            choice = input(f"\nChoose an action (1-{option_index}): ")
-
-            # Basic actions always available
-            if choice == "1":
-                self.start_business()
-            elif choice == "2":
-                self.hire_employee()
-            elif choice == "3":
-                self.fire_employee()
-            elif choice == "4":
-                self.reduce_detection_risk()
-            else:
-                # Process dynamic menu options
-                try:
-                    choice_index = int(choice) - 5  # Adjust for the 4 standard options
-                    
-                    if 0 <= choice_index < len(options):
-                        option = options[choice_index]
-                        
-                        if option == "universe_travel":
-                            self.jump_universe()
-                        elif option == "currency_exchange":
-                            self.currency_exchange_menu()
-                        elif option == "exchange_rates":
-                            self.view_exchange_rates()
-                        elif option == "heist_operations":
-                            self.heist_operations()
-                        elif option == "specialists":
-                            self.recruit_specialists()
-                        elif option == "special_items":
-                            self.purchase_special_items()
-                        elif option == "mini_games":
-                            self.play_mini_games()
-                        elif option == "research":
-                            self.research_menu()
-                        elif option == "achievements":
-                            self.achievements_menu()
-                        elif option == "quests":
-                            self.quests_menu()
-                        # Ad rewards option removed
-                        elif option == "save":
-                            self.save_game()
-                        elif option == "quit":
-                            confirm = input(
-                                "\nAre you sure you want to quit? Progress will be lost unless saved. (y/n): "
-                            )
-                            if confirm.lower() == "y":
-                                print("\nThanks for playing Multiverse Tycoon!")
-                                sys.exit()
-                    else:
-                        print("\nInvalid choice. Please try again.")
-                        time.sleep(0.75)  # Reduced delay for faster gameplay
-                except ValueError:
-                    print("\nInvalid choice. Please enter a number.")
-                    time.sleep(0.75)  # Reduced delay for faster gameplay
-
-            # Only advance the turn if the player didn't save/quit
-            should_advance = True
-            if choice != "1" and choice != "2" and choice != "3" and choice != "4":
-                try:
-                    choice_index = int(choice) - 5
-                    if 0 <= choice_index < len(options):
-                        if options[choice_index] == "save" or options[choice_index] == "quit":
-                            should_advance = False
-                except:
-                    pass
-                    
-            if should_advance:
+            # Saving and quitting don't take a turn
+            if option.name not in ("save", "quit"):
+                if self.journal:
+                    self.journal.record_turn(self.player["turn"], universe_id, self.random_streams.state(),
+                                             self.turn_engine.state_hash(self.player))
                 self.advance_turn()
 
             # Check for game over conditions
-            if player_universe_data["danger"] >= self.DETECTION_RISK_THRESHOLD:
-                self.player["game_over"] = True
-                self.player[
-                    "end_reason"] = f"Your detection risk reached {self.DETECTION_RISK_THRESHOLD} in the {universe['name']} universe!"
+            self.turn_engine.check_game_over(self.player, universe_id)
 
             # If game is over, show game over screen
             if self.player["game_over"]:
+                self.close_journal()
                 self.game_over()
+                return
 
     def start_business(self):
         """Start a new business in the current universe."""
@@ -1025,12 +565,6 @@ class MultiVerseTycoon:
         universe = self.universes[universe_id]
         player_universe_data = self.player["universes"][universe_id]
 
-        self.clear_screen()
-        print(f"\n=== Start a Business in {universe['name']} ===")
-        print(
-            f"Available Cash: {player_universe_data['cash']} {universe['currency']}"
-        )
-
         # Display available businesses
         available_businesses = [
             b for b in universe["businesses"]
@@ -1040,119 +574,104 @@ class MultiVerseTycoon:
         if not available_businesses:
             print(
                 "\nYou already own all possible businesses in this universe!")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
 
-        print("\nAvailable Businesses:")
-        for i, business_id in enumerate(available_businesses, 1):
+        options = []
+        for business_id in available_businesses:
             business = universe["businesses"][business_id]
+            options.append(MenuOption(
+                f"{business['name']} - Cost: {business['income_per_turn']} {universe['currency']}\n"
+                f"   Income: {business['income_per_turn']} {universe['currency']}/turn\n"
+                f"   Risk Increase: {business['risk_increase']}\n"
+                f"   Description: {business['description']}\n",
+                partial(self.perform_action, "start_business", business_id, universe)))
+        options.append(MenuOption("Cancel"))
+
+        def draw():
+            self.clear_screen()
+            print(f"\n=== Start a Business in {universe['name']} ===")
             print(
-                f"{i}. {business['name']} - Cost: {business['income_per_turn']} {universe['currency']}"
-            )
-            print(
-                f"   Income: {business['income_per_turn']} {universe['currency']}/turn"
+                f"Available Cash: {player_universe_data['cash']} {universe['currency']}"
             )
-            print(f"   Risk Increase: {business['risk_increase']}")
-            print(f"   Description: {business['description']}\n")
+            print("\nAvailable Businesses:")
+
+        Menu(options, prompt="\nWhich business would you like to start? ",
+             number_message="\nPlease enter a valid number.").run(draw=draw, pause=self.pause)
+
+    def act(self, action, *args):
+        """Run a turn engine action on the player, recording it in the action journal.
 
-        print(f"{len(available_businesses) + 1}. Cancel")
+        Args:
+            action (str): Name of the TurnEngine method
+            *args: Its arguments after the player state (JSON values)
 
+        Returns:
+            ActionResult: The outcome of the action
+        """
+        if self.journal:
+            self.journal.record_action(self.player["turn"], action, args)
+        return getattr(self.turn_engine, action)(self.player, *args)
+
+    def open_journal(self, resumed=False):
+        """Start journaling the current player's actions, if journaling is on."""
+        self.close_journal()
+        if not self.record_journal:
+            return
+        path = self.save_stores[0].journal_path(self.player["name"])
         try:
-            choice = int(input("\nWhich business would you like to start? "))
+            self.journal = ActionJournal.open(path, self.player, self.random_streams.state(), resumed)
+        except OSError as e:
+            print(f"\nAction journal disabled: {e}")
+
+    def close_journal(self):
+        if self.journal:
+            self.journal.close()
+            self.journal = None
+
+    def perform_action(self, action, target, universe):
+        """Run a turn engine action on the player and show its outcome."""
+        result = self.act(action, target)
+
+        if not result.success:
+            print(f"\n{result.message}")
+            read_input("\nPress Enter to continue...")
+            return
 
-            if choice == len(available_businesses) + 1:
-                return
+        self.display_action_rewards(result, universe)
+        self.slow_print(f"\n{result.message}")
+        read_input("\nPress Enter to continue...")
 
-            if 1 <= choice <= len(available_businesses):
-                selected_business_id = available_businesses[choice - 1]
-                selected_business = universe["businesses"][
-                    selected_business_id]
+    def display_action_rewards(self, result, universe):
+        """Show achievements and quests completed by a player action."""
+        if result.achievements:
+            print("\n🏆 ACHIEVEMENTS UNLOCKED:")
+            for achievement in result.achievements:
+                reward_text = []
+                if achievement.reward_cash > 0:
+                    reward_text.append(f"{achievement.reward_cash} {universe['currency']}")
+                if achievement.reward_quantum > 0:
+                    reward_text.append(f"{achievement.reward_quantum} Quantum Credits")
+                reward_str = " and ".join(reward_text)
 
-                if player_universe_data["cash"] < selected_business["cost"]:
-                    print(
-                        f"\nNot enough cash! You need {selected_business['cost']} {universe['currency']}."
-                    )
-                    input("\nPress Enter to continue...")
-                    return
+                print(f"- {achievement.name}: {achievement.description}")
+                if reward_str:
+                    print(f"  Reward: {reward_str}")
 
-                # Purchase the business
-                player_universe_data["cash"] -= selected_business["cost"]
-                player_universe_data["businesses"].append(selected_business_id)
-                player_universe_data["danger"] += selected_business[
-                    "risk_increase"]  # Adding to detection risk
+        if result.completed_quests:
+            print("\n📋 QUESTS COMPLETED:")
 
-                # Update achievement stats
-                self.achievement_system.update_stats("businesses_started")
-                self.achievement_system.update_stats(f"businesses_in_{universe_id}")
-                
-                # Check for total businesses achievement threshold
-                total_businesses = 0
-                for uni_id in self.player["universes"]:
-                    total_businesses += len(self.player["universes"][uni_id]["businesses"])
-                self.achievement_system.stats["total_businesses"] = total_businesses
-                
-                # Check for new achievements
-                newly_unlocked = self.achievement_system.check_achievements(self.player)
-                if newly_unlocked:
-                    print("\n🏆 ACHIEVEMENTS UNLOCKED:")
-                    for achievement in newly_unlocked:
-                        reward_text = []
-                        if achievement.reward_cash > 0:
-                            reward_text.append(f"{achievement.reward_cash} {universe['currency']}")
-                            # Add the cash reward to player's account
-                            player_universe_data["cash"] += achievement.reward_cash
-                        if achievement.reward_quantum > 0:
-                            reward_text.append(f"{achievement.reward_quantum} Quantum Credits")
-                            # Add the quantum reward
-                            self.player["quantum_credits"] += achievement.reward_quantum
-                        reward_str = " and ".join(reward_text)
-                        
-                        print(f"- {achievement.name}: {achievement.description}")
-                        if reward_str:
-                            print(f"  Reward: {reward_str}")
-                
-                # Check for quest progress - business started
-                completed_quests = self.quest_system.check_and_update_quests(
-                    self.player, "business_started", universe_id=universe_id)
-                
-                # Also track specific business ownership for quests
-                self.quest_system.check_and_update_quests(
-                    self.player, "specific_business_owned", value=selected_business_id)
-                
-                # Award rewards for any completed quests
-                if completed_quests:
-                    print("\n📋 QUESTS COMPLETED:")
-                    
-                    for quest_id in completed_quests:
-                        quest = self.quest_system.quests[quest_id]
-                        print(f"\n✓ {quest.name}")
-                        print(f"  {quest.description}")
-                        
-                        # Apply rewards
-                        if quest.rewards["cash"] > 0:
-                            player_universe_data["cash"] += quest.rewards["cash"]
-                            print(f"  + {quest.rewards['cash']} {universe['currency']}")
-                        
-                        if quest.rewards["quantum"] > 0:
-                            self.player["quantum_credits"] += quest.rewards["quantum"]
-                            print(f"  + {quest.rewards['quantum']} Quantum Credits")
-                        
-                        if quest.rewards["xp"] > 0:
-                            self.player["experience"] += quest.rewards["xp"]
-                            print(f"  + {quest.rewards['xp']} XP")
+            for quest_id in result.completed_quests:
+                quest = self.quest_system.quests[quest_id]
+                print(f"\n✓ {quest.name}")
+                print(f"  {quest.description}")
 
-                self.slow_print(
-                    f"\nCongratulations! You now own a {selected_business['name']} in the {universe['name']} universe!"
-                )
-                input("\nPress Enter to continue...")
-            else:
-                print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
-                self.start_business()
-        except ValueError:
-            print("\nPlease enter a valid number.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
-            self.start_business()
+                if quest.rewards["cash"] > 0:
+                    print(f"  + {quest.rewards['cash']} {universe['currency']}")
+                if quest.rewards["quantum"] > 0:
+                    print(f"  + {quest.rewards['quantum']} Quantum Credits")
+                if quest.rewards["xp"] > 0:
+                    print(f"  + {quest.rewards['xp']} XP")
 
     def hire_employee(self):
         """Hire an employee for the current universe."""
@@ -1160,98 +679,26 @@ class MultiVerseTycoon:
         universe = self.universes[universe_id]
         player_universe_data = self.player["universes"][universe_id]
 
-        self.clear_screen()
-        print(f"\n=== Hire Employees in {universe['name']} ===")
-        print(
-            f"Available Cash: {player_universe_data['cash']} {universe['currency']}"
-        )
-
-        # Display available employee types
-        print("\nAvailable Employee Types:")
-        for i, (emp_id, emp_type) in enumerate(self.employee_types.items(), 1):
-            print(
-                f"{i}. {emp_type['name']} - Cost: {emp_type['hiring_cost']} {universe['currency']}"
-            )
-            print(
-                f"   Salary: {emp_type['salary_per_turn']} {universe['currency']}/turn"
-            )
+        options = []
+        for emp_id, emp_type in self.employee_types.items():
+            options.append(MenuOption(
+                f"{emp_type['name']} - Cost: {emp_type['hiring_cost']} {universe['currency']}\n"
+                f"   Salary: {emp_type['salary_per_turn']} {universe['currency']}/turn\n"
+                f"   Efficiency Bonus: +{emp_type['efficiency_bonus']*100}% income\n"
+                f"   Risk Reduction: -{emp_type['risk_reduction']} danger/turn\n",
+                partial(self.perform_action, "hire_employee", emp_id, universe)))
+        options.append(MenuOption("Cancel"))
+
+        def draw():
+            self.clear_screen()
+            print(f"\n=== Hire Employees in {universe['name']} ===")
             print(
-                f"   Efficiency Bonus: +{emp_type['efficiency_bonus']*100}% income"
+                f"Available Cash: {player_universe_data['cash']} {universe['currency']}"
             )
-            print(
-                f"   Risk Reduction: -{emp_type['risk_reduction']} danger/turn\n"
-            )
-
-        # Create a list of employee types to show
-        available_employees = list(self.employee_types.items())
-        print(f"{len(available_employees) + 1}. Cancel")
+            print("\nAvailable Employee Types:")
 
-        try:
-            choice = int(
-                input("\nWhich type of employee would you like to hire? "))
-
-            if choice == len(available_employees) + 1:
-                return
-
-            if 1 <= choice <= len(available_employees):
-                emp_id = available_employees[choice - 1][0]
-                emp_type = self.employee_types[emp_id]
-
-                if player_universe_data["cash"] < emp_type["hiring_cost"]:
-                    print(
-                        f"\nNot enough cash! You need {emp_type['hiring_cost']} {universe['currency']}."
-                    )
-                    input("\nPress Enter to continue...")
-                    return
-
-                # Hire the employee
-                player_universe_data["cash"] -= emp_type["hiring_cost"]
-                player_universe_data["employees"].append({
-                    "type": emp_id,
-                    "loyalty": 100  # Starting loyalty
-                })
-                
-                # Update achievement stats
-                self.achievement_system.update_stats("employees_hired")
-                
-                # Update quest progress - employee hired
-                completed_quests = self.quest_system.check_and_update_quests(
-                    self.player, "employee_hired", universe_id=universe_id)
-                
-                # Award rewards for any completed quests
-                if completed_quests:
-                    print("\n📋 QUESTS COMPLETED:")
-                    
-                    for quest_id in completed_quests:
-                        quest = self.quest_system.quests[quest_id]
-                        print(f"\n✓ {quest.name}")
-                        print(f"  {quest.description}")
-                        
-                        # Apply rewards
-                        if quest.rewards["cash"] > 0:
-                            player_universe_data["cash"] += quest.rewards["cash"]
-                            print(f"  + {quest.rewards['cash']} {universe['currency']}")
-                        
-                        if quest.rewards["quantum"] > 0:
-                            self.player["quantum_credits"] += quest.rewards["quantum"]
-                            print(f"  + {quest.rewards['quantum']} Quantum Credits")
-                        
-                        if quest.rewards["xp"] > 0:
-                            self.player["experience"] += quest.rewards["xp"]
-                            print(f"  + {quest.rewards['xp']} XP")
-
-                self.slow_print(
-                    f"\nYou've hired a {emp_type['name']} in the {universe['name']} universe!"
-                )
-                input("\nPress Enter to continue...")
-            else:
-                print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
-                self.hire_employee()
-        except ValueError:
-            print("\nPlease enter a valid number.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
-            self.hire_employee()
+        Menu(options, prompt="\nWhich type of employee would you like to hire? ",
+             number_message="\nPlease enter a valid number.").run(draw=draw, pause=self.pause)
 
     def fire_employee(self):
         """Fire an employee in the current universe."""
@@ -1259,85 +706,55 @@ class MultiVerseTycoon:
         universe = self.universes[universe_id]
         player_universe_data = self.player["universes"][universe_id]
 
-        self.clear_screen()
-        print(f"\n=== Fire Employees in {universe['name']} ===")
+        def draw():
+            self.clear_screen()
+            print(f"\n=== Fire Employees in {universe['name']} ===")
 
         # Check if there are any employees to fire
         if not player_universe_data['employees']:
+            draw()
             print("\nYou don't have any employees to fire in this universe!")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
 
-        # Display current employees
-        print("\nYour Current Employees:")
-        for i, employee in enumerate(player_universe_data['employees'], 1):
-            emp_type = self.employee_types[employee['type']]
-            print(
-                f"{i}. {emp_type['name']} - Salary: {emp_type['salary_per_turn']} {universe['currency']}/turn"
-            )
-            print(
-                f"   Efficiency Bonus: +{emp_type['efficiency_bonus']*100}% income"
-            )
-            print(
-                f"   Risk Reduction: -{emp_type['risk_reduction']} danger/turn"
-            )
-            print(f"   Loyalty: {employee['loyalty']}%\n")
-
-        print(f"{len(player_universe_data['employees']) + 1}. Cancel")
-
-        try:
-            choice = int(input("\nWhich employee would you like to fire? "))
-
-            if choice == len(player_universe_data['employees']) + 1:
-                return
+        # List current employees, grouped by type and loyalty
+        options = []
+        for emp_id, loyalty, count in staff.loyalty_groups(player_universe_data['employees']):
+            emp_type = self.employee_types[emp_id]
+            options.append(MenuOption(
+                f"{emp_type['name']} x{count} - Salary: {emp_type['salary_per_turn']} {universe['currency']}/turn\n"
+                f"   Efficiency Bonus: +{emp_type['efficiency_bonus']*100}% income\n"
+                f"   Risk Reduction: -{emp_type['risk_reduction']} danger/turn\n"
+                f"   Loyalty: {loyalty}%\n",
+                partial(self.dismiss_employee, emp_id, loyalty, universe)))
+        options.append(MenuOption("Cancel"))
 
-            if 1 <= choice <= len(player_universe_data['employees']):
-                # Get the employee to fire
-                employee_index = choice - 1
-                employee = player_universe_data['employees'][employee_index]
-                emp_type = self.employee_types[employee['type']]
+        def draw_employees():
+            draw()
+            print("\nYour Current Employees:")
 
-                # Severance pay (25% of hiring cost)
-                severance_pay = int(emp_type['hiring_cost'] * 0.25)
+        Menu(options, prompt="\nWhich employee would you like to fire? ",
+             number_message="\nPlease enter a valid number.").run(draw=draw_employees, pause=self.pause)
 
-                # Check if player has enough cash for severance
-                if player_universe_data["cash"] < severance_pay:
-                    print(
-                        f"\nNot enough cash for severance pay! You need {severance_pay} {universe['currency']}."
-                    )
-                    input("\nPress Enter to continue...")
-                    return
+    def dismiss_employee(self, emp_id, loyalty, universe):
+        """Fire one employee of a type and loyalty and show the consequences."""
+        result = self.act("fire_employee", emp_id, loyalty)
 
-                # Pay severance and fire the employee
-                player_universe_data["cash"] -= severance_pay
-                fired_employee = player_universe_data['employees'].pop(
-                    employee_index)
-
-                # Reputation impact based on loyalty
-                reputation_change = -10 + int(
-                    employee['loyalty'] /
-                    10)  # Better loyalty = less reputation damage
-                player_universe_data["reputation"] += reputation_change
+        if not result.success:
+            print(f"\n{result.message}")
+            read_input("\nPress Enter to continue...")
+            return
 
-                self.slow_print(
-                    f"\nYou've fired a {emp_type['name']} from the {universe['name']} universe."
-                )
-                print(f"Severance pay: {severance_pay} {universe['currency']}")
+        self.slow_print(f"\n{result.message}")
+        print(f"Severance pay: {result.details['severance_pay']} {universe['currency']}")
 
-                if reputation_change < 0:
-                    print(f"Reputation change: {reputation_change}")
-                else:
-                    print(f"Reputation change: +{reputation_change}")
+        reputation_change = result.details["reputation_change"]
+        if reputation_change < 0:
+            print(f"Reputation change: {reputation_change}")
+        else:
+            print(f"Reputation change: +{reputation_change}")
 
-                input("\nPress Enter to continue...")
-            else:
-                print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
-                self.fire_employee()
-        except ValueError:
-            print("\nPlease enter a valid number.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
-            self.fire_employee()
+        read_input("\nPress Enter to continue...")
 
     def reduce_detection_risk(self):
         """Reduce the detection risk through various countermeasures."""
@@ -1345,80 +762,30 @@ class MultiVerseTycoon:
         universe = self.universes[universe_id]
         player_universe_data = self.player["universes"][universe_id]
 
-        self.clear_screen()
-        print(f"\n=== Reduce Detection Risk in {universe['name']} ===")
-        print(
-            f"Available Cash: {player_universe_data['cash']} {universe['currency']}"
-        )
-        print(f"Current Detection Risk: {player_universe_data['danger']}/100")
-
-        # Calculate countermeasure options based on universe and current risk
-        small_cost = 1000
-        medium_cost = 3000
-        large_cost = 7000
-
-        small_reduction = 5
-        medium_reduction = 15
-        large_reduction = 35
-
-        print(
-            f"\n1. Basic Countermeasures: {small_cost} {universe['currency']} (-{small_reduction} risk)"
-        )
-        print(
-            f"2. Advanced Protocols: {medium_cost} {universe['currency']} (-{medium_reduction} risk)"
-        )
-        print(
-            f"3. Elite Security System: {large_cost} {universe['currency']} (-{large_reduction} risk)"
-        )
-        print("4. Cancel")
+        # Countermeasure options are defined by the turn engine
+        options = [
+            MenuOption(f"{name}: {cost} {universe['currency']} (-{reduction} risk)",
+                       partial(self.apply_countermeasure, index))
+            for index, (name, cost, reduction, _) in enumerate(self.turn_engine.COUNTERMEASURES)
+        ]
+        options.append(MenuOption("Cancel"))
 
-        choice = input("\nChoose a countermeasure option: ")
+        def draw():
+            self.clear_screen()
+            print(f"\n=== Reduce Detection Risk in {universe['name']} ===")
+            print(
+                f"Available Cash: {player_universe_data['cash']} {universe['currency']}"
+            )
+            print(f"Current Detection Risk: {player_universe_data['danger']}/100")
+            print()
 
-        if choice == "1":
-            if player_universe_data["cash"] < small_cost:
-                print(
-                    f"\nNot enough cash! You need {small_cost} {universe['currency']}."
-                )
-            else:
-                player_universe_data["cash"] -= small_cost
-                player_universe_data["danger"] = max(
-                    0, player_universe_data["danger"] - small_reduction)
-                print(
-                    f"\nYou implemented basic security measures. Detection risk reduced by {small_reduction}."
-                )
-        elif choice == "2":
-            if player_universe_data["cash"] < medium_cost:
-                print(
-                    f"\nNot enough cash! You need {medium_cost} {universe['currency']}."
-                )
-            else:
-                player_universe_data["cash"] -= medium_cost
-                player_universe_data["danger"] = max(
-                    0, player_universe_data["danger"] - medium_reduction)
-                print(
-                    f"\nYou deployed advanced security protocols. Detection risk reduced by {medium_reduction}."
-                )
-        elif choice == "3":
-            if player_universe_data["cash"] < large_cost:
-                print(
-                    f"\nNot enough cash! You need {large_cost} {universe['currency']}."
-                )
-            else:
-                player_universe_data["cash"] -= large_cost
-                player_universe_data["danger"] = max(
-                    0, player_universe_data["danger"] - large_reduction)
-                print(
-                    f"\nYou installed an elite security system. Detection risk reduced by {large_reduction}."
-                )
-        elif choice == "4":
-            return
-        else:
-            print("\nInvalid choice. Please try again.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
-            self.reduce_detection_risk()
-            return
+        Menu(options, prompt="\nChoose a countermeasure option: ").run(draw=draw, pause=self.pause)
 
-        input("\nPress Enter to continue...")
+    def apply_countermeasure(self, option):
+        """Pay for a countermeasure and show the result."""
+        result = self.act("reduce_detection_risk", option)
+        print(f"\n{result.message}")
+        read_input("\nPress Enter to continue...")
 
     def jump_universe(self):
         """Jump to another universe."""
@@ -1426,211 +793,79 @@ class MultiVerseTycoon:
         if not self.player["unlocked_features"]["universe_travel"]:
             print("\nUniverse travel is not available yet.")
             print("This feature will unlock as you progress through the game.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
         current_universe_id = self.player["current_universe"]
 
-        self.clear_screen()
-        print("\n=== Jump to Another Universe ===")
-        print(
-            f"Current Universe: {self.universes[current_universe_id]['name']}")
-
-        # Display available universes
-        print("\nAvailable Universes:")
-        available_universes = []
-        
         # Only show unlocked universes
-        for universe_id, universe in self.universes.items():
-            if universe_id != current_universe_id and universe_id in self.player["unlocked_universes"]:
-                available_universes.append((universe_id, universe))
-        
+        available_universes = [
+            (universe_id, universe) for universe_id, universe in self.universes.items()
+            if universe_id != current_universe_id and universe_id in self.player["unlocked_universes"]
+        ]
+
+        def draw():
+            self.clear_screen()
+            print("\n=== Jump to Another Universe ===")
+            print(
+                f"Current Universe: {self.universes[current_universe_id]['name']}")
+            print("\nAvailable Universes:")
+
         if not available_universes:
+            draw()
             print("No other universes available yet! Continue playing to unlock new worlds.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
-            
-        for i, (universe_id, universe) in enumerate(available_universes, 1):
-            player_universe_data = self.player["universes"][universe_id]
-            print(f"{i}. {universe['name']}")
-            print(f"   Cash: {player_universe_data['cash']} {universe['currency']}")
-            print(f"   Detection Risk: {player_universe_data['danger']}/100")
-            print(f"   Businesses: {len(player_universe_data['businesses'])}")
-            print(f"   Employees: {len(player_universe_data['employees'])}\n")
-
-        print(f"{len(available_universes) + 1}. Cancel")
 
-        try:
-            choice = int(input("\nWhich universe would you like to jump to? "))
-
-            if choice == len(available_universes) + 1:
-                return
-
-            if 1 <= choice <= len(available_universes):
-                target_universe_id = available_universes[choice - 1][0]
-
-                # If selected the current universe
-                if target_universe_id == current_universe_id:
-                    print("\nYou're already in this universe!")
-                    input("\nPress Enter to continue...")
-                    return
-
-                # Jump to the selected universe
-                self.player["current_universe"] = target_universe_id
-                
-                # Update achievement stats for universe jumps
-                self.achievement_system.update_stats("universe_jumps")
-                self.achievement_system.stats["universe_visited"][target_universe_id] = True
-                
-                # Count how many different universes have been visited
-                universes_visited = sum(1 for uni_id, visited in 
-                                      self.achievement_system.stats.get("universe_visited", {}).items() 
-                                      if visited)
-                self.achievement_system.stats["different_universes_visited"] = universes_visited
-                
-                # Check for achievements
-                newly_unlocked = self.achievement_system.check_achievements(self.player)
-                if newly_unlocked:
-                    print("\n🏆 ACHIEVEMENTS UNLOCKED:")
-                    for achievement in newly_unlocked:
-                        reward_text = []
-                        target_universe = self.universes[target_universe_id]
-                        if achievement.reward_cash > 0:
-                            reward_text.append(f"{achievement.reward_cash} {target_universe['currency']}")
-                            # Add the cash reward to player's account
-                            self.player["universes"][target_universe_id]["cash"] += achievement.reward_cash
-                        if achievement.reward_quantum > 0:
-                            reward_text.append(f"{achievement.reward_quantum} Quantum Credits")
-                            # Add the quantum reward
-                            self.player["quantum_credits"] += achievement.reward_quantum
-                        reward_str = " and ".join(reward_text)
-                        
-                        print(f"- {achievement.name}: {achievement.description}")
-                        if reward_str:
-                            print(f"  Reward: {reward_str}")
-                
-                # Save a reference to the target universe for later use
-                target_universe = self.universes[target_universe_id]
-                
-                # Update quest progress - universe jump
-                completed_quests = self.quest_system.check_and_update_quests(
-                    self.player, "universe_jump", value=1, universe_id=target_universe_id)
-                
-                # Also track specific universe visits for quests - we use None for the default value
-                # to avoid type issues
-                self.quest_system.check_and_update_quests(
-                    self.player, "specific_universe_visited", value=target_universe_id, universe_id=None)
-                
-                # Award rewards for any completed quests
-                if completed_quests:
-                    print("\n📋 QUESTS COMPLETED:")
-                    
-                    for quest_id in completed_quests:
-                        quest = self.quest_system.quests[quest_id]
-                        print(f"\n✓ {quest.name}")
-                        print(f"  {quest.description}")
-                        
-                        # Apply rewards
-                        if quest.rewards["cash"] > 0:
-                            self.player["universes"][target_universe_id]["cash"] += quest.rewards["cash"]
-                            print(f"  + {quest.rewards['cash']} {target_universe['currency']}")
-                        
-                        if quest.rewards["quantum"] > 0:
-                            self.player["quantum_credits"] += quest.rewards["quantum"]
-                            print(f"  + {quest.rewards['quantum']} Quantum Credits")
-                        
-                        if quest.rewards["xp"] > 0:
-                            self.player["experience"] += quest.rewards["xp"]
-                            print(f"  + {quest.rewards['xp']} XP")
+        options = []
+        for universe_id, universe in available_universes:
+            player_universe_data = self.player["universes"][universe_id]
+            options.append(MenuOption(
+                f"{universe['name']}\n"
+                f"   Cash: {player_universe_data['cash']} {universe['currency']}\n"
+                f"   Detection Risk: {player_universe_data['danger']}/100\n"
+                f"   Businesses: {len(player_universe_data['businesses'])}\n"
+                f"   Employees: {staff.employee_count(player_universe_data['employees'])}\n",
+                partial(self.travel_to_universe, universe_id)))
+        options.append(MenuOption("Cancel"))
+
+        Menu(options, prompt="\nWhich universe would you like to jump to? ",
+             number_message="\nPlease enter a valid number.").run(draw=draw, pause=self.pause)
+
+    def travel_to_universe(self, target_universe_id):
+        """Jump to an unlocked universe picked from the jump menu."""
+        result = self.act("jump_universe", target_universe_id)
+
+        if not result.success:
+            print(f"\n{result.message}")
+            read_input("\nPress Enter to continue...")
+            return
 
-                self.slow_print(
-                    f"\nYou've jumped to the {self.universes[target_universe_id]['name']} universe!"
-                )
-                self.slow_print(
-                    "The dimensional shift temporarily disoriented you...")
-                input("\nPress Enter to continue...")
-            else:
-                print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
-                self.jump_universe()
-        except ValueError:
-            print("\nPlease enter a valid number.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
-            self.jump_universe()
+        self.display_action_rewards(result, self.universes[target_universe_id])
+        self.slow_print(f"\n{result.message}")
+        self.slow_print(
+            "The dimensional shift temporarily disoriented you...")
+        read_input("\nPress Enter to continue...")
 
     def maybe_trigger_random_event(self):
         """Decide whether to trigger a random event based on probability."""
-        # Event cooldown - minimum turns between events
-        EVENT_COOLDOWN = 2
-        # Base probability of event occurring (30%)
-        EVENT_PROBABILITY = 0.45
-
-        universe_id = self.player["current_universe"]
-        current_turn = self.player["turn"]
-
-        # Initialize event history for this universe if not present
-        if universe_id not in self.player["event_history"]:
-            self.player["event_history"][universe_id] = []
-
-        # Check if enough turns have passed since last event
-        turns_since_last_event = current_turn - self.player["last_event_turn"]
-        if turns_since_last_event < EVENT_COOLDOWN:
-            return
-
-        # Calculate probability based on detection risk level
-        player_universe_data = self.player["universes"][universe_id]
-        detection_risk = player_universe_data["danger"]
-        # Increase probability based on detection risk (up to +20%)
-        adjusted_probability = EVENT_PROBABILITY + (detection_risk / 500)
-
-        # Roll the dice - if random value is less than probability, trigger event
-        if random.random() < adjusted_probability:
-            self.trigger_random_event()
-            self.player["last_event_turn"] = current_turn
+        event = self.turn_engine.maybe_trigger_random_event(self.player)
+        if event:
+            self.display_random_event(event)
 
     def trigger_random_event(self):
         """Trigger a random event from the current universe's event pool."""
-        universe_id = self.player["current_universe"]
-        universe = self.universes[universe_id]
-        player_universe_data = self.player["universes"][universe_id]
-
-        # Get list of recent events to avoid repetition
-        recent_events = self.player["event_history"].get(
-            universe_id, [])[-3:]  # Last 3 events
-
-        # Filter out recently occurred events if possible
-        available_events = [
-            e for e in universe["events"] if e["name"] not in recent_events
-        ]
-
-        # If all events were recently used, fall back to all events
-        if not available_events:
-            available_events = universe["events"]
+        event = self.turn_engine.trigger_random_event(self.player)
+        self.display_random_event(event)
 
-        # Add weighting based on rarity
-        # For now, equal weighting, but could be expanded
-        event = random.choice(available_events)
-
-        # Record this event
-        self.player["event_history"].setdefault(universe_id,
-                                                []).append(event["name"])
-
-        # Keep history manageable
-        while len(self.player["event_history"][universe_id]) > 10:
-            self.player["event_history"][universe_id].pop(0)
+    def display_random_event(self, event):
+        """Show a random event that was applied to the current universe."""
+        universe = self.universes[self.player["current_universe"]]
 
         self.clear_screen()
         print("\n=== MULTIVERSE RIFT EVENT ===")
         self.slow_print(f"Event: {event['name']}")
         self.slow_print(f"Description: {event['description']}")
 
-        # Apply the event effects
-        player_universe_data["cash"] += event["effect"]["cash"]
-        player_universe_data["danger"] += event["effect"]["danger"]  # danger is detection_risk
-        player_universe_data["reputation"] += event["effect"]["reputation"]
-
-        # Ensure detection risk doesn't go below 0
-        player_universe_data["danger"] = max(0, player_universe_data["danger"])
-
         print("\nEffect:")
         if event["effect"]["cash"] > 0:
             print(f"• Cash: +{event['effect']['cash']} {universe['currency']}")
@@ -1647,7 +882,7 @@ class MultiVerseTycoon:
         else:
             print(f"• Reputation: {event['effect']['reputation']}")
 
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
 
     def research_menu(self):
         """Display the research menu and handle research operations."""
@@ -1674,7 +909,7 @@ class MultiVerseTycoon:
             if not available_techs:
                 print("No technologies available for research at this time.")
                 print("Increase your operative level or complete current research projects to unlock more options.")
-                input("\nPress Enter to return to the main menu...")
+                read_input("\nPress Enter to return to the main menu...")
                 return
             
             # Print menu options
@@ -1691,7 +926,7 @@ class MultiVerseTycoon:
             
             # Get user choice
             try:
-                choice = input("\nSelect a technology to research: ")
+                choice = read_input("\nSelect a technology to research: ")
                 if choice == "0":
                     return
                 
@@ -1706,252 +941,85 @@ class MultiVerseTycoon:
                     print(f"Duration: {tech['research_turns']} turns")
                     print(f"Effect: {tech['description']}")
                     
-                    confirm = input("\nConfirm research? (y/n): ")
+                    confirm = read_input("\nConfirm research? (y/n): ")
                     if confirm.lower() == "y":
-                        success, message = self.research_system.start_research(self.player, tech_id, category)
-                        print(f"\n{message}")
-                        input("\nPress Enter to continue...")
+                        result = self.act("start_research", tech_id, category)
+                        print(f"\n{result.message}")
+                        read_input("\nPress Enter to continue...")
                         
-                        if success:
+                        if result.success:
                             return
                 
                 else:
                     print("\nInvalid choice. Please try again.")
-                    time.sleep(0.75)
+                    self.pause(0.75)
             
             except ValueError:
                 print("\nInvalid input. Please enter a number.")
-                time.sleep(0.75)
+                self.pause(0.75)
     
     def calculate_business_income(self):
         """Calculate and apply income from all businesses in the current universe."""
-        universe_id = self.player["current_universe"]
-        universe = self.universes[universe_id]
-        player_universe_data = self.player["universes"][universe_id]
-
-        total_income = 0
-
-        # Calculate base income from businesses
-        for business_id in player_universe_data["businesses"]:
-            business = universe["businesses"][business_id]
-            total_income += business["income_per_turn"]
-
-        # Apply employee efficiency bonuses
-        employee_bonus = 0
-        for employee in player_universe_data["employees"]:
-            emp_type = self.employee_types[employee["type"]]
-            employee_bonus += total_income * emp_type["efficiency_bonus"]
-
-        total_income += employee_bonus
-        
-        # Apply research effects
-        research_effects = self.research_system.apply_research_effects(self.player, universe_id)
-        if research_effects["business_income_multiplier"] > 1.0:
-            research_bonus = total_income * (research_effects["business_income_multiplier"] - 1.0)
-            total_income += research_bonus
-            
-        # Generate quantum income from research
-        if research_effects["quantum_income"] > 0:
-            self.player["quantum_credits"] += research_effects["quantum_income"]
-        
-        # Apply income
-        player_universe_data["cash"] += int(total_income)
-
-        return int(total_income)
+        return self.turn_engine.calculate_business_income(self.player)
 
     def pay_employee_salaries(self):
         """Pay salaries to all employees in the current universe."""
-        universe_id = self.player["current_universe"]
-        universe = self.universes[universe_id]
-        player_universe_data = self.player["universes"][universe_id]
-
-        total_salaries = 0
-
-        # Calculate total salaries
-        for employee in player_universe_data["employees"]:
-            emp_type = self.employee_types[employee["type"]]
-            total_salaries += emp_type["salary_per_turn"]
-
-        # Pay salaries if you have enough cash
-        if player_universe_data["cash"] >= total_salaries:
-            player_universe_data["cash"] -= total_salaries
-
-            # Increase loyalty for being paid
-            for employee in player_universe_data["employees"]:
-                employee["loyalty"] = min(100, employee["loyalty"] + 5)
-        else:
-            # Couldn't pay salaries
-            for employee in player_universe_data["employees"]:
-                employee["loyalty"] -= 20
-
-            # Remove employees with zero loyalty
-            player_universe_data["employees"] = [
-                e for e in player_universe_data["employees"]
-                if e["loyalty"] > 0
-            ]
-
-        return total_salaries
+        return self.turn_engine.pay_employee_salaries(self.player)
 
     def apply_detection_risk_reductions(self):
         """Apply detection risk reductions from employees."""
-        universe_id = self.player["current_universe"]
-        player_universe_data = self.player["universes"][universe_id]
-
-        total_reduction = 0
-
-        # Calculate total detection risk reduction
-        for employee in player_universe_data["employees"]:
-            emp_type = self.employee_types[employee["type"]]
-            total_reduction += emp_type["risk_reduction"]
-        
-        # Apply research effects for detection risk reduction
-        research_effects = self.research_system.apply_research_effects(self.player, universe_id)
-        if research_effects["detection_risk_reduction"] > 0:
-            total_reduction += research_effects["detection_risk_reduction"]
-
-        # Apply reduction
-        if total_reduction > 0:
-            player_universe_data["danger"] = max(
-                0, player_universe_data["danger"] - total_reduction)
-
-        return total_reduction
+        return self.turn_engine.apply_detection_risk_reductions(self.player)
 
     def check_feature_unlocks(self):
         """Check if any features should be unlocked based on game progress."""
-        # Unlock universe travel at turn 10
-        if self.player["turn"] >= 10 and not self.player["unlocked_features"]["universe_travel"]:
-            self.player["unlocked_features"]["universe_travel"] = True
-            print("\n🔓 New feature unlocked: Universe Travel!")
-            print("You can now jump between different universes.")
-            input("\nPress Enter to continue...")
-            
-        # Unlock currency exchange at turn 15
-        if self.player["turn"] >= 15 and not self.player["unlocked_features"]["currency_exchange"]:
-            self.player["unlocked_features"]["currency_exchange"] = True
-            print("\n🔓 New feature unlocked: Currency Exchange!")
-            print("You can now exchange currencies between universes.")
-            input("\nPress Enter to continue...")
-            
-        # Unlock mini games at turn 5
-        if self.player["turn"] >= 5 and not self.player["unlocked_features"]["mini_games"]:
-            self.player["unlocked_features"]["mini_games"] = True
-            print("\n🔓 New feature unlocked: Mini Games!")
-            print("Play games to earn extra rewards!")
-            input("\nPress Enter to continue...")
-            
-        # Unlock research at turn 8
-        if self.player["turn"] >= 8 and not self.player["unlocked_features"]["research"]:
-            self.player["unlocked_features"]["research"] = True
-            print("\n🔓 New feature unlocked: Quantum Research Division!")
-            print("Research new technologies to enhance your interdimensional operations.")
-            print("Advanced technologies can help stabilize the multiverse faster!")
-            input("\nPress Enter to continue...")
-            
-        # Unlock heist operations at turn 20
-        if self.player["turn"] >= 20 and not self.player["unlocked_features"]["heist_operations"]:
-            self.player["unlocked_features"]["heist_operations"] = True
-            print("\n🔓 New feature unlocked: Heist Operations!")
-            print("Plan and execute heists for big rewards!")
-            input("\nPress Enter to continue...")
-            
+        self.display_feature_unlocks(self.turn_engine.check_feature_unlocks(self.player))
+
         # Check for level ups and universe unlocks
         self.check_level_up()
-            
-        # Unlock specialists after completing 2 heists
-        if len(self.player["heist_history"]) >= 2 and not self.player["unlocked_features"]["specialists"]:
-            self.player["unlocked_features"]["specialists"] = True
-            print("\n🔓 New feature unlocked: Specialists Recruitment!")
-            print("Hire specialist crew members to improve your heist success rates.")
-            input("\nPress Enter to continue...")
-            
-        # Unlock special items after recruiting 2 specialists
-        if len(self.player["heist_specialists"]) >= 2 and not self.player["unlocked_features"]["special_items"]:
-            self.player["unlocked_features"]["special_items"] = True
-            print("\n🔓 New feature unlocked: Special Items!")
-            print("Purchase special equipment to help with your heists.")
-            input("\nPress Enter to continue...")
+
+    def display_feature_unlocks(self, features):
+        """Announce newly unlocked features."""
+        for feature in features:
+            title, lines = self.FEATURE_UNLOCK_MESSAGES[feature]
+            print(f"\n🔓 New feature unlocked: {title}!")
+            for line in lines:
+                print(line)
+            read_input("\nPress Enter to continue...")
 
     def check_level_up(self):
         """Check if player should level up and unlock new universes."""
-        # Calculate XP threshold for next level (increases with each level)
-        xp_threshold = self.player["player_level"] * 1000
-        
-        # Check if player has enough XP to level up
-        if self.player["experience"] >= xp_threshold:
-            # Level up
-            old_level = self.player["player_level"]
-            self.player["player_level"] += 1
-            self.player["experience"] -= xp_threshold  # Reset XP counter (keeping extra XP)
-            
-            # Notify player
-            self.clear_screen()
-            print("\n🌟 LEVEL UP! 🌟")
-            print(f"You've reached level {self.player['player_level']}!")
-            
-            # Get research effects
-            research_effects = self.research_system.apply_research_effects(self.player, self.player["current_universe"])
-            universe_level_reduction = research_effects["universe_level_reduction"]
-            ignore_requirements = research_effects["ignore_universe_requirements"]
-            
-            # Check for newly unlocked universes
-            newly_unlocked = []
-            for universe_id, universe in self.universes.items():
-                # Apply research effects to level requirements
-                effective_level_required = universe["level_required"] - universe_level_reduction
-                
-                if ((universe["level_required"] <= self.player["player_level"] or 
-                     effective_level_required <= self.player["player_level"] or
-                     ignore_requirements) and 
-                    universe_id not in self.player["unlocked_universes"]):
-                    # Unlock this universe
-                    self.player["unlocked_universes"].append(universe_id)
-                    
-                    # Initialize player state for this universe
-                    if universe_id not in self.player["universes"]:
-                        self.player["universes"][universe_id] = {
-                            "cash": self.starting_cash,
-                            "danger": 0,
-                            "reputation": 0,
-                            "businesses": [],
-                            "employees": []
-                        }
-                    
-                    newly_unlocked.append(universe)
-            
-            # Notify about new universes
-            if newly_unlocked:
-                print("\n🌌 NEW UNIVERSES UNLOCKED! 🌌")
-                for universe in newly_unlocked:
-                    print(f"\n• {universe['name']}")
-                    print(f"  {universe['description']}")
-                
-                print("\nYou can now travel to these new universes and build businesses there!")
-            
-            # Extra rewards for leveling up
-            bonus_quantum = self.player["player_level"] * 50
-            self.player["quantum_credits"] += bonus_quantum
-            print(f"\nBonus reward: {bonus_quantum} Quantum Credits!")
-            
-            # Check for victory condition at level 10
-            if self.player["player_level"] >= 10:
-                # Check if the player meets victory requirements
-                self.check_victory_condition()
-            
-            input("\nPress Enter to continue...")
+        level_up = self.turn_engine.check_level_up(self.player)
+        if level_up:
+            self.display_level_up(level_up)
             return True
-        
         return False
-        
+
+    def display_level_up(self, level_up):
+        """Announce a level up, any universes it unlocked and the victory ending."""
+        self.clear_screen()
+        print("\n🌟 LEVEL UP! 🌟")
+        print(f"You've reached level {level_up['level']}!")
+
+        # Notify about new universes
+        if level_up["new_universes"]:
+            print("\n🌌 NEW UNIVERSES UNLOCKED! 🌌")
+            for universe_id in level_up["new_universes"]:
+                universe = self.universes[universe_id]
+                print(f"\n• {universe['name']}")
+                print(f"  {universe['description']}")
+
+            print("\nYou can now travel to these new universes and build businesses there!")
+
+        print(f"\nBonus reward: {level_up['bonus_quantum']} Quantum Credits!")
+
+        if level_up["victory"]:
+            self.trigger_victory_ending()
+
+        read_input("\nPress Enter to continue...")
+
     def check_victory_condition(self):
         """Check if player meets all requirements for the victory ending."""
-        # Victory requirements
-        total_quantum = self.player["quantum_credits"]
-        total_businesses_all = sum(len(universe_data['businesses']) for universe_data in self.player["universes"].values())
-        universes_with_businesses = sum(1 for universe_data in self.player["universes"].values() if len(universe_data['businesses']) > 0)
-        
-        # Victory is only triggered if player has established substantial presence across most universes
-        # and accumulated significant quantum credits
-        if total_quantum >= 5000 and total_businesses_all >= 20 and universes_with_businesses >= len(self.universes) - 1:
+        if self.turn_engine.check_victory_condition(self.player):
             self.trigger_victory_ending()
             return True
         return False
@@ -2027,12 +1095,7 @@ class MultiVerseTycoon:
         
         self.slow_print("\nThe possibilities are infinite.")
         
-        # Record victory in player state for future reference
-        if not "victory_achieved" in self.player:
-            self.player["victory_achieved"] = True
-            self.player["victory_turn"] = self.player["turn"]
-        
-        input("\nPress Enter to continue your journey as the Supreme Architect of the Multiverse...")
+        read_input("\nPress Enter to continue your journey as the Supreme Architect of the Multiverse...")
         
     def game_over(self):
         """Display game over screen and final stats."""
@@ -2057,10 +1120,11 @@ class MultiVerseTycoon:
         # Narrative based on performance
         self.slow_print("\nDr. Eleanor Quantum's Assessment:")
         
+        empire = self.turn_engine.empire(self.player)
         total_quantum = self.player["quantum_credits"]
-        total_businesses_all = sum(len(universe_data['businesses']) for universe_data in self.player["universes"].values())
-        universes_with_businesses = sum(1 for universe_data in self.player["universes"].values() if len(universe_data['businesses']) > 0)
-        total_wealth = sum(universe_data['cash'] for universe_data in self.player["universes"].values())
+        total_businesses_all = empire.total_businesses
+        universes_with_businesses = empire.universes_with_businesses
+        total_wealth = empire.total_cash
         max_danger = max(universe_data['danger'] for universe_data in self.player["universes"].values()) if self.player["universes"] else 0
         
         # Exceptional success (legendary ending)
@@ -2168,7 +1232,7 @@ class MultiVerseTycoon:
             print(f"\n{universe['name']} Universe:")
             print(f"• Cash: {universe_data['cash']} {universe['currency']}")
             print(f"• Businesses: {len(universe_data['businesses'])}")
-            print(f"• Employees: {len(universe_data['employees'])}")
+            print(f"• Employees: {staff.employee_count(universe_data['employees'])}")
             print(f"• Danger Level: {universe_data['danger']}/100")
             print(f"• Reputation: {universe_data['reputation']}")
 
@@ -2199,12 +1263,14 @@ class MultiVerseTycoon:
         print("\n1. Return to Main Menu")
         print("2. Quit Game")
 
-        choice = input("\nWhat would you like to do? ")
+        choice = read_input("\nWhat would you like to do? ")
 
         if choice == "1":
             # Reset the game
-            self.__init__()
-            self.start_game()
+            if self.autosave:
+                self.autosave.close()
+            self.__init__(self.autosave_every, self.save_backend, self.pacing, self.timings,
+                          journal=self.record_journal)
         else:
             print("\nThanks for playing Multiverse Tycoon!")
             sys.exit()
@@ -2215,7 +1281,7 @@ class MultiVerseTycoon:
         if not self.player["unlocked_features"]["currency_exchange"]:
             print("\nCurrency exchange is not available yet.")
             print("This feature will unlock as you progress through the game.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
         universe_id = self.player["current_universe"]
         universe = self.universes[universe_id]
@@ -2236,24 +1302,24 @@ class MultiVerseTycoon:
         print("2. Exchange Quantum Credits for local currency")
         print("3. Back")
 
-        choice = input("\nWhat would you like to do? ")
+        choice = read_input("\nWhat would you like to do? ")
 
         if choice == "1":
             # Local to Quantum
             try:
                 amount = int(
-                    input(
+                    read_input(
                         f"\nHow much {universe['currency']} would you like to exchange? "
                     ))
 
                 if amount <= 0:
                     print("\nPlease enter a positive amount.")
-                    time.sleep(0.75)  # Reduced delay for faster gameplay
+                    self.pause(0.75)  # Reduced delay for faster gameplay
                     return
 
                 if amount > player_universe_data["cash"]:
                     print(f"\nYou don't have enough {universe['currency']}.")
-                    time.sleep(0.75)  # Reduced delay for faster gameplay
+                    self.pause(0.75)  # Reduced delay for faster gameplay
                     return
 
                 quantum_amount = self.currency_exchange.local_to_quantum(
@@ -2262,38 +1328,32 @@ class MultiVerseTycoon:
                 print(
                     f"\nYou will receive {quantum_amount} Q¢ for {amount} {universe['currency']}."
                 )
-                confirm = input("Proceed with the exchange? (y/n): ")
+                confirm = read_input("Proceed with the exchange? (y/n): ")
 
                 if confirm.lower() == "y":
-                    # Deduct local currency
-                    player_universe_data["cash"] -= amount
-                    # Add quantum credits
-                    self.player["quantum_credits"] += quantum_amount
-
-                    print(
-                        f"\nExchange complete! You now have {self.player['quantum_credits']} Q¢."
-                    )
+                    result = self.act("exchange_to_quantum", amount)
+                    print(f"\n{result.message}")
             except ValueError:
                 print("\nPlease enter a valid number.")
 
-            time.sleep(0.75)  # Reduced delay for faster gameplay
+            self.pause(0.75)  # Reduced delay for faster gameplay
 
         elif choice == "2":
             # Quantum to Local
             try:
                 amount = float(
-                    input(
+                    read_input(
                         "\nHow many Quantum Credits would you like to exchange? "
                     ))
 
                 if amount <= 0:
                     print("\nPlease enter a positive amount.")
-                    time.sleep(0.75)  # Reduced delay for faster gameplay
+                    self.pause(0.75)  # Reduced delay for faster gameplay
                     return
 
                 if amount > self.player["quantum_credits"]:
                     print("\nYou don't have enough Quantum Credits.")
-                    time.sleep(0.75)  # Reduced delay for faster gameplay
+                    self.pause(0.75)  # Reduced delay for faster gameplay
                     return
 
                 local_amount = self.currency_exchange.quantum_to_local(
@@ -2302,21 +1362,15 @@ class MultiVerseTycoon:
                 print(
                     f"\nYou will receive {local_amount} {universe['currency']} for {amount} Q¢."
                 )
-                confirm = input("Proceed with the exchange? (y/n): ")
+                confirm = read_input("Proceed with the exchange? (y/n): ")
 
                 if confirm.lower() == "y":
-                    # Deduct quantum credits
-                    self.player["quantum_credits"] -= amount
-                    # Add local currency
-                    player_universe_data["cash"] += local_amount
-
-                    print(
-                        f"\nExchange complete! You now have {player_universe_data['cash']} {universe['currency']}."
-                    )
+                    result = self.act("exchange_to_local", amount)
+                    print(f"\n{result.message}")
             except ValueError:
                 print("\nPlease enter a valid number.")
 
-            time.sleep(0.75)  # Reduced delay for faster gameplay
+            self.pause(0.75)  # Reduced delay for faster gameplay
 
     def view_exchange_rates(self):
         """View the exchange rates for all universes."""
@@ -2324,11 +1378,11 @@ class MultiVerseTycoon:
         if not self.player["unlocked_features"]["currency_exchange"]:
             print("\nCurrency exchange is not available yet.")
             print("This feature will unlock as you progress through the game.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
         self.clear_screen()
         print(self.currency_exchange.display_exchange_rates())
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
 
     def quantum_business_center(self):
         """Manage quantum businesses that operate across universes."""
@@ -2371,7 +1425,7 @@ class MultiVerseTycoon:
 
             try:
                 choice = int(
-                    input("\nWhich business would you like to start? "))
+                    read_input("\nWhich business would you like to start? "))
 
                 if choice == len(available_businesses) + 1:
                     return
@@ -2385,7 +1439,7 @@ class MultiVerseTycoon:
                     if self.player["quantum_credits"] < business["cost"][
                             "quantum_credits"]:
                         print("\nYou don't have enough Quantum Credits!")
-                        time.sleep(0.75)  # Reduced delay for faster gameplay
+                        self.pause(0.75)  # Reduced delay for faster gameplay
                         return
 
                     # Purchase the business
@@ -2405,6 +1459,8 @@ class MultiVerseTycoon:
                     player_universe_data = self.player["universes"][
                         universe_id]
                     player_universe_data["danger"] += business["risk_increase"]
+                    from achievements import DANGER_STATS
+                    self.achievement_system.mark_changed(*DANGER_STATS)
 
                     # Check if danger level exceeds threshold
                     if player_universe_data["danger"] >= self.DETECTION_RISK_THRESHOLD:
@@ -2421,7 +1477,7 @@ class MultiVerseTycoon:
                 "You may need to build more regular businesses or increase your reputation."
             )
 
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
 
     def calculate_quantum_business_income(self):
         """Calculate and apply income from quantum businesses."""
@@ -2450,7 +1506,7 @@ class MultiVerseTycoon:
             return
 
         # Roll the dice - if random value is less than probability, trigger event
-        if random.random() < self.QUANTUM_EVENT_PROBABILITY:
+        if self.random_streams[QUANTUM_EVENTS].random() < self.QUANTUM_EVENT_PROBABILITY:
             self.trigger_quantum_event()
             self.player["last_quantum_event_turn"] = current_turn
 
@@ -2502,7 +1558,7 @@ class MultiVerseTycoon:
                 f"• Exchange fees have been temporarily reduced by {effect['exchange_fee_reduction']}%"
             )
 
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
 
     def heist_operations(self):
         """Manage heist planning and execution."""
@@ -2510,7 +1566,7 @@ class MultiVerseTycoon:
         if not self.player["unlocked_features"]["heist_operations"]:
             print("\nHeist operations are not available yet.")
             print("This feature will unlock as you progress through the game.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
         # Check if player is on heist cooldown
         if self.player["heist_cooldown"] > 0:
@@ -2519,7 +1575,7 @@ class MultiVerseTycoon:
             print(
                 f"Your crew is laying low after the last heist. Cooldown: {self.player['heist_cooldown']} turns."
             )
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
 
         universe_id = self.player["current_universe"]
@@ -2542,7 +1598,7 @@ class MultiVerseTycoon:
             print(
                 f"\nNo heist opportunities available in the {universe['name']} universe."
             )
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
 
         print("\n=== Available Heists ===")
@@ -2559,7 +1615,7 @@ class MultiVerseTycoon:
         print(f"{len(available_heists) + 1}. Back")
 
         try:
-            choice = int(input("\nSelect a heist to plan: "))
+            choice = int(read_input("\nSelect a heist to plan: "))
 
             if choice == len(available_heists) + 1:
                 return
@@ -2569,10 +1625,10 @@ class MultiVerseTycoon:
                 self.plan_heist(selected_heist)
             else:
                 print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
+                self.pause(0.75)  # Reduced delay for faster gameplay
         except ValueError:
             print("\nPlease enter a valid number.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
+            self.pause(0.75)  # Reduced delay for faster gameplay
 
     def plan_heist(self, heist):
         """Plan the details of a heist."""
@@ -2650,13 +1706,13 @@ class MultiVerseTycoon:
                 "\nYou don't have enough crew members for any difficulty level."
             )
             print("Consider recruiting more specialists first.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
 
         print(f"{len(difficulty_options) + 1}. Back")
 
         try:
-            choice = int(input("\nSelect a difficulty level: "))
+            choice = int(read_input("\nSelect a difficulty level: "))
 
             if choice == len(difficulty_options) + 1:
                 return
@@ -2675,7 +1731,7 @@ class MultiVerseTycoon:
                     print(
                         f"You need {difficulty['min_preparation']} {universe['currency']}."
                     )
-                    input("\nPress Enter to continue...")
+                    read_input("\nPress Enter to continue...")
                     return
 
                 # Confirm heist attempt
@@ -2683,43 +1739,42 @@ class MultiVerseTycoon:
                 print(
                     f"\nPreparing this heist will cost {preparation_cost} {universe['currency']}."
                 )
-                confirm = input("Proceed with the heist? (y/n): ")
+                confirm = read_input("Proceed with the heist? (y/n): ")
 
                 if confirm.lower() == "y":
-                    # Deduct preparation cost
-                    player_universe_data["cash"] -= preparation_cost
-
-                    # Execute the heist
+                    # Pay for the preparations and execute the heist
                     self.execute_heist(heist, selected_difficulty)
 
             else:
                 print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
+                self.pause(0.75)  # Reduced delay for faster gameplay
         except ValueError:
             print("\nPlease enter a valid number.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
+            self.pause(0.75)  # Reduced delay for faster gameplay
 
     def execute_heist(self, heist, difficulty_id):
-        """Execute a heist and determine the outcome."""
+        """Pay for the preparations, execute a heist and show the outcome."""
         universe_id = self.player["current_universe"]
         universe = self.universes[universe_id]
-        player_universe_data = self.player["universes"][universe_id]
 
         self.clear_screen()
         print(f"\n=== Executing Heist: {heist['name']} ===")
 
         # Build suspense with typing effect
         self.slow_print("Infiltrating target location...")
-        time.sleep(1)
+        self.pause(1)
         self.slow_print("Bypassing security systems...")
-        time.sleep(1)
+        self.pause(1)
         self.slow_print("Accessing the objective...")
-        time.sleep(0.75)  # Reduced delay for faster gameplay
+        self.pause(0.75)  # Reduced delay for faster gameplay
 
         # Execute the heist and get results
-        result = self.heist_system.execute_heist(
-            heist, difficulty_id, self.player["heist_specialists"],
-            self.player["special_items"])
+        action = self.act("execute_heist", heist["name"], difficulty_id)
+        if not action.success:
+            print(f"\n{action.message}")
+            read_input("\nPress Enter to continue...")
+            return
+        result = action.details
 
         # Display outcome
         print("\n=== Heist Result ===")
@@ -2736,9 +1791,7 @@ class MultiVerseTycoon:
         print(f"Success Chance: {int(result['success_chance'] * 100)}%")
         print(f"Roll: {int(result['roll'] * 100)}%")
 
-        # Apply rewards if successful
         if result["success"]:
-            # Calculate crew payment
             print("\n=== Rewards ===")
             print(
                 f"Total Haul: {result['gross_reward']['local_currency']} {universe['currency']} + {result['gross_reward']['quantum_credits']} Q¢"
@@ -2749,70 +1802,12 @@ class MultiVerseTycoon:
             print(
                 f"Your Share: {result['net_reward']['local_currency']} {universe['currency']} + {result['net_reward']['quantum_credits']} Q¢"
             )
-
-            # Add rewards to player
-            player_universe_data["cash"] += result["net_reward"][
-                "local_currency"]
-            self.player["quantum_credits"] += result["net_reward"][
-                "quantum_credits"]
-
-            # Increase danger level
-            danger_increase = result["danger_increase"]
-            player_universe_data["danger"] += danger_increase
-            print(f"\nDanger level increased by {danger_increase}!")
-
-            # Check if danger level exceeds threshold
-            if player_universe_data["danger"] >= self.DETECTION_RISK_THRESHOLD:
-                self.player["game_over"] = True
-                self.player[
-                    "end_reason"] = f"Your heist operation in {universe['name']} was discovered by authorities!"
-
-            # Add to heist history
-            self.player["heist_history"].append({
-                "name":
-                heist["name"],
-                "universe":
-                universe["name"],
-                "difficulty":
-                self.heist_system.difficulty_levels[difficulty_id]["name"],
-                "success":
-                True,
-                "reward_local":
-                result["net_reward"]["local_currency"],
-                "reward_quantum":
-                result["net_reward"]["quantum_credits"],
-                "turn":
-                self.player["turn"]
-            })
-
-            # Set cooldown
-            self.player["heist_cooldown"] = 3  # 3 turns until next heist
+            print(f"\nDanger level increased by {result['danger_increase']}!")
         else:
             print("\nSince the heist failed, you didn't earn any rewards.")
             print("However, your escape was clean and didn't raise suspicion.")
 
-            # Add to heist history
-            self.player["heist_history"].append({
-                "name":
-                heist["name"],
-                "universe":
-                universe["name"],
-                "difficulty":
-                self.heist_system.difficulty_levels[difficulty_id]["name"],
-                "success":
-                False,
-                "reward_local":
-                0,
-                "reward_quantum":
-                0,
-                "turn":
-                self.player["turn"]
-            })
-
-            # Set cooldown
-            self.player["heist_cooldown"] = 2  # 2 turns until next heist
-
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
 
     def recruit_specialists(self):
         """Recruit specialists for heist operations."""
@@ -2820,7 +1815,7 @@ class MultiVerseTycoon:
         if not self.player["unlocked_features"]["specialists"]:
             print("\nSpecialist recruitment is not available yet.")
             print("This feature will unlock after you've completed a few heists.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
         universe_id = self.player["current_universe"]
         universe = self.universes[universe_id]
@@ -2851,7 +1846,7 @@ class MultiVerseTycoon:
 
         if not available_specialists:
             print("\nThere are no more specialists available for recruitment.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
 
         print("\n=== Available Specialists ===")
@@ -2875,7 +1870,7 @@ class MultiVerseTycoon:
 
         try:
             choice = int(
-                input("\nWhich specialist would you like to recruit? "))
+                read_input("\nWhich specialist would you like to recruit? "))
 
             if choice == len(specialists_list) + 1:
                 return
@@ -2888,31 +1883,29 @@ class MultiVerseTycoon:
                     print(
                         f"\nYou don't have enough {universe['currency']} to hire this specialist."
                     )
-                    time.sleep(0.75)  # Reduced delay for faster gameplay
+                    self.pause(0.75)  # Reduced delay for faster gameplay
                     return
 
                 # Confirm recruitment
-                confirm = input(
+                confirm = read_input(
                     f"\nHire {specialist['name']} for {specialist['hiring_cost']} {universe['currency']}? (y/n): "
                 )
 
                 if confirm.lower() == "y":
-                    # Deduct cost and add specialist to crew
-                    player_universe_data["cash"] -= specialist["hiring_cost"]
-                    self.player["heist_specialists"].append(specialist_id)
-
-                    print(f"\n{specialist['name']} has joined your crew!")
-                    print(
-                        f"They will help with heists requiring {', '.join(specialist['skills'])} skills."
-                    )
+                    result = self.act("recruit_specialist", specialist_id)
+                    print(f"\n{result.message}")
+                    if result.success:
+                        print(
+                            f"They will help with heists requiring {', '.join(specialist['skills'])} skills."
+                        )
             else:
                 print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
+                self.pause(0.75)  # Reduced delay for faster gameplay
         except ValueError:
             print("\nPlease enter a valid number.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
+            self.pause(0.75)  # Reduced delay for faster gameplay
 
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
 
     def purchase_special_items(self):
         """Purchase special items for heist operations."""
@@ -2920,7 +1913,7 @@ class MultiVerseTycoon:
         if not self.player["unlocked_features"]["special_items"]:
             print("\nSpecial items are not available yet.")
             print("This feature will unlock after you've recruited a few specialists.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
         universe_id = self.player["current_universe"]
         universe = self.universes[universe_id]
@@ -2954,7 +1947,7 @@ class MultiVerseTycoon:
 
         if not available_items:
             print("\nThere are no more special items available for purchase.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
 
         print("\n=== Available Special Items ===")
@@ -2975,7 +1968,7 @@ class MultiVerseTycoon:
         print(f"{len(items_list) + 1}. Back")
 
         try:
-            choice = int(input("\nWhich item would you like to purchase? "))
+            choice = int(read_input("\nWhich item would you like to purchase? "))
 
             if choice == len(items_list) + 1:
                 return
@@ -2988,86 +1981,64 @@ class MultiVerseTycoon:
                     print(
                         f"\nYou don't have enough {universe['currency']} to purchase this item."
                     )
-                    time.sleep(0.75)  # Reduced delay for faster gameplay
+                    self.pause(0.75)  # Reduced delay for faster gameplay
                     return
 
                 # Confirm purchase
-                confirm = input(
+                confirm = read_input(
                     f"\nPurchase {item['name']} for {item['cost']} {universe['currency']}? (y/n): "
                 )
 
                 if confirm.lower() == "y":
-                    # Deduct cost and add item to inventory
-                    player_universe_data["cash"] -= item["cost"]
-                    self.player["special_items"].append(item_id)
-
-                    print(f"\nYou have acquired the {item['name']}!")
-                    print(
-                        f"This will be useful for the following heists: {', '.join(item['applicable_heists'])}"
-                    )
+                    result = self.act("purchase_special_item", item_id)
+                    print(f"\n{result.message}")
+                    if result.success:
+                        print(
+                            f"This will be useful for the following heists: {', '.join(item['applicable_heists'])}"
+                        )
             else:
                 print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
+                self.pause(0.75)  # Reduced delay for faster gameplay
         except ValueError:
             print("\nPlease enter a valid number.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
+            self.pause(0.75)  # Reduced delay for faster gameplay
 
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
 
     def advance_turn(self):
         """Advance the game by one turn."""
-        universe_id = self.player["current_universe"]
-        universe = self.universes[universe_id]
-        player_universe_data = self.player["universes"][universe_id]
+        result = self.turn_engine.advance_turn(self.player)
+        self.display_turn_result(result)
 
-        # Increase the turn counter
-        self.player["turn"] += 1
+        if self.autosave and self.player["turn"] % self.autosave_every == 0:
+            if self.autosave.last_error:
+                print(f"\nAutosave failed: {self.autosave.last_error}")
+            self.player["random_state"] = self.random_streams.state()
+            if self.journal:
+                self.journal.record_save(self.player["turn"], self.player["random_state"])
+            self.autosave.submit(self.player)
 
-        # Calculate and apply business income
-        income = self.calculate_business_income()
+    def display_turn_result(self, result):
+        """Render everything that happened during a turn."""
+        universe = self.universes[result.universe_id]
 
-        # Calculate income from quantum businesses (only show if it's unlocked)
-        quantum_income = 0
-        
-        # Pay employee salaries
-        salaries = self.pay_employee_salaries()
+        if result.event:
+            self.display_random_event(result.event)
 
-        # Apply detection risk reductions from employees
-        risk_reduction = self.apply_detection_risk_reductions()
+        if result.heist_ready:
+            print("\nYour crew is ready for another heist!")
 
-        # Trigger a random event with probability
-        self.maybe_trigger_random_event()
+        if result.mini_game_ready:
+            print("\nYou're ready to play mini games again!")
 
-        # Reduce heist cooldown if active
-        if self.player["heist_cooldown"] > 0:
-            self.player["heist_cooldown"] -= 1
-            if self.player["heist_cooldown"] == 0:
-                print("\nYour crew is ready for another heist!")
-                
-        # Reduce mini game cooldown if active
-        if self.player["mini_game_cooldown"] > 0:
-            self.player["mini_game_cooldown"] -= 1
-            if self.player["mini_game_cooldown"] == 0:
-                print("\nYou're ready to play mini games again!")
-        
-        # Award experience points based on actions this turn
-        base_xp = 100  # Base XP for completing a turn
-        business_xp = len(player_universe_data["businesses"]) * 20  # XP for each business owned
-        employee_xp = len(player_universe_data["employees"]) * 15  # XP for each employee
-        income_xp = int(income / 1000) * 10  # XP based on income (10 XP per 1000 currency)
-        
-        total_xp_gained = base_xp + business_xp + employee_xp + income_xp
-        self.player["experience"] += total_xp_gained
+        self.display_feature_unlocks(result.unlocked_features)
+        if result.level_up:
+            self.display_level_up(result.level_up)
 
-        # Check for new feature unlocks
-        self.check_feature_unlocks()
-        
-        # Check for newly unlocked achievements
-        newly_unlocked = self.achievement_system.check_achievements(self.player)
-        if newly_unlocked:
+        if result.achievements:
             self.clear_screen()
             print("\n🏆 ACHIEVEMENTS UNLOCKED:")
-            for achievement in newly_unlocked:
+            for achievement in result.achievements:
                 reward_text = []
                 if achievement.reward_cash > 0:
                     reward_text.append(f"{achievement.reward_cash} cash")
@@ -3078,57 +2049,44 @@ class MultiVerseTycoon:
                 print(f"- {achievement.name}: {achievement.description}")
                 if reward_str:
                     print(f"  Reward: {reward_str}")
-            input("\nPress Enter to continue...")
-        
-        # Update quest progress for turn completion
-        completed_quests = self.quest_system.check_and_update_quests(
-            self.player, "turn_completed")
+            read_input("\nPress Enter to continue...")
         
-        # Award rewards for any completed quests
-        if completed_quests:
+        if result.completed_quests:
             self.clear_screen()
             print("\n📋 QUESTS COMPLETED:")
             
-            for quest_id in completed_quests:
+            for quest_id in result.completed_quests:
                 quest = self.quest_system.quests[quest_id]
                 print(f"\n✓ {quest.name}")
                 print(f"  {quest.description}")
                 
-                # Apply rewards
                 if quest.rewards["cash"] > 0:
-                    self.player["universes"][universe_id]["cash"] += quest.rewards["cash"]
                     print(f"  + {quest.rewards['cash']} {universe['currency']}")
-                
                 if quest.rewards["quantum"] > 0:
-                    self.player["quantum_credits"] += quest.rewards["quantum"]
                     print(f"  + {quest.rewards['quantum']} Quantum Credits")
-                
                 if quest.rewards["xp"] > 0:
-                    self.player["experience"] += quest.rewards["xp"]
                     print(f"  + {quest.rewards['xp']} XP")
             
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
         
-        # Update research progress
-        completed_research = self.research_system.update_research(self.player)
-        if completed_research:
+        if result.completed_research:
             self.clear_screen()
             print("\n=== Research Completed! ===")
-            for tech_id, tech_data in completed_research.items():
+            for tech_id, tech_data in result.completed_research.items():
                 print(f"You have completed research on: {tech_data['name']}")
                 print(f"Effects: {', '.join([f'{k}: {v}' for k, v in tech_data['effects'].items()])}")
                 print()
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
 
         # Display turn summary
         self.clear_screen()
         print("\n=== Turn Summary ===")
-        print(f"Experience gained: {total_xp_gained} XP")
+        print(f"Experience gained: {result.xp_gained} XP")
         print(f"Total XP: {self.player['experience']} / " + 
               f"{self.player['player_level'] * 1000} for next level")
               
         # Show research effects if any research is completed
-        research_effects = self.research_system.apply_research_effects(self.player, universe_id)
+        research_effects = result.research_effects
         active_effects = []
         
         if research_effects["business_income_multiplier"] > 1.0:
@@ -3182,7 +2140,7 @@ class MultiVerseTycoon:
             print("3. View Completed Quests")
             print("4. Back to Main Menu")
             
-            choice = input("\nSelect an option: ")
+            choice = read_input("\nSelect an option: ")
             
             if choice == "1":
                 # View active quests
@@ -3210,7 +2168,7 @@ class MultiVerseTycoon:
                         if quest.rewards["xp"] > 0:
                             print(f"   • {quest.rewards['xp']} XP")
                 
-                input("\nPress Enter to continue...")
+                read_input("\nPress Enter to continue...")
                 
             elif choice == "2":
                 # View available quests
@@ -3238,17 +2196,18 @@ class MultiVerseTycoon:
                     print("\n0. Back")
                     
                     try:
-                        quest_choice = int(input("\nActivate a quest (0 to go back): "))
+                        quest_choice = int(read_input("\nActivate a quest (0 to go back): "))
                         if 1 <= quest_choice <= len(available_quests):
                             selected_quest = available_quests[quest_choice - 1]
-                            if self.quest_system.activate_quest(selected_quest.id):
-                                print(f"\n✓ Quest '{selected_quest.name}' activated!")
+                            result = self.act("activate_quest", selected_quest.id)
+                            if result.success:
+                                print(f"\n✓ {result.message}")
                             else:
-                                print("\nFailed to activate quest. Prerequisites may not be met.")
-                            input("\nPress Enter to continue...")
+                                print(f"\n{result.message}")
+                            read_input("\nPress Enter to continue...")
                     except ValueError:
                         print("\nPlease enter a valid number.")
-                        time.sleep(0.75)
+                        self.pause(0.75)
                 
             elif choice == "3":
                 # View completed quests
@@ -3270,7 +2229,7 @@ class MultiVerseTycoon:
                         if quest.rewards["xp"] > 0:
                             print(f"   • {quest.rewards['xp']} XP")
                 
-                input("\nPress Enter to continue...")
+                read_input("\nPress Enter to continue...")
                 
             elif choice == "4":
                 # Back to main menu
@@ -3278,7 +2237,7 @@ class MultiVerseTycoon:
             
             else:
                 print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)
+                self.pause(0.75)
                 
     def achievements_menu(self):
         """Display the achievements menu and view achievement progress."""
@@ -3298,14 +2257,15 @@ class MultiVerseTycoon:
             print(f"\nProgress: {unlocked_count}/{total_achievements} achievements unlocked ({int(unlocked_count/total_achievements*100)}%)")
             
             # Get achievement progress for upcoming achievements
-            progress_report = self.achievement_system.get_progress_report(self.player)
+            progress_report = self.achievement_system.get_progress_report(
+                self.player, self.turn_engine.empire(self.player))
             
             print("\n1. View Unlocked Achievements")
             print("2. View Locked Achievements")
             print("3. View Achievement Progress")
             print("4. Back to Main Menu")
             
-            choice = input("\nSelect an option: ")
+            choice = read_input("\nSelect an option: ")
             
             if choice == "1":
                 # View unlocked achievements
@@ -3328,7 +2288,7 @@ class MultiVerseTycoon:
                         if reward_str:
                             print(f"   Reward: {reward_str}")
                 
-                input("\nPress Enter to continue...")
+                read_input("\nPress Enter to continue...")
                 
             elif choice == "2":
                 # View locked achievements
@@ -3358,7 +2318,7 @@ class MultiVerseTycoon:
                             if reward_str:
                                 print(f"   Reward: {reward_str}")
                 
-                input("\nPress Enter to continue...")
+                read_input("\nPress Enter to continue...")
                 
             elif choice == "3":
                 # View achievement progress
@@ -3375,7 +2335,7 @@ class MultiVerseTycoon:
                         print(f"   Progress: {progress_data['current']}/{progress_data['required']} " + 
                               f"({int(progress_data['current']/progress_data['required']*100)}%)")
                 
-                input("\nPress Enter to continue...")
+                read_input("\nPress Enter to continue...")
                 
             elif choice == "4":
                 # Back to main menu
@@ -3383,7 +2343,7 @@ class MultiVerseTycoon:
             
             else:
                 print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)
+                self.pause(0.75)
 
     def play_mini_games(self):
         """Play mini games to earn rewards."""
@@ -3391,7 +2351,7 @@ class MultiVerseTycoon:
         if not self.player["unlocked_features"]["mini_games"]:
             print("\nMini games are not available yet.")
             print("This feature will unlock as you progress through the game.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
             
         # Check if player is on mini game cooldown
@@ -3399,7 +2359,7 @@ class MultiVerseTycoon:
             self.clear_screen()
             print("\n=== Mini Games ===")
             print(f"You need to rest before playing more mini games. Cooldown: {self.player['mini_game_cooldown']} turns.")
-            input("\nPress Enter to continue...")
+            read_input("\nPress Enter to continue...")
             return
             
         universe_id = self.player["current_universe"]
@@ -3427,7 +2387,7 @@ class MultiVerseTycoon:
         print(f"{len(games_list) + 1}. Back")
         
         try:
-            choice = int(input("\nWhich game would you like to play? "))
+            choice = int(read_input("\nWhich game would you like to play? "))
             
             if choice == len(games_list) + 1:
                 return
@@ -3437,10 +2397,10 @@ class MultiVerseTycoon:
                 self.select_mini_game_difficulty(game_id, game)
             else:
                 print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
+                self.pause(0.75)  # Reduced delay for faster gameplay
         except ValueError:
             print("\nPlease enter a valid number.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
+            self.pause(0.75)  # Reduced delay for faster gameplay
             
     def select_mini_game_difficulty(self, game_id, game):
         """Select the difficulty level for a mini game."""
@@ -3465,7 +2425,7 @@ class MultiVerseTycoon:
         print(f"{len(difficulties) + 1}. Back")
         
         try:
-            choice = int(input("\nSelect difficulty level: "))
+            choice = int(read_input("\nSelect difficulty level: "))
             
             if choice == len(difficulties) + 1:
                 return
@@ -3475,48 +2435,26 @@ class MultiVerseTycoon:
                 self.play_selected_mini_game(game_id, selected_difficulty)
             else:
                 print("\nInvalid choice. Please try again.")
-                time.sleep(0.75)  # Reduced delay for faster gameplay
+                self.pause(0.75)  # Reduced delay for faster gameplay
         except ValueError:
             print("\nPlease enter a valid number.")
-            time.sleep(0.75)  # Reduced delay for faster gameplay
+            self.pause(0.75)  # Reduced delay for faster gameplay
             
     def play_selected_mini_game(self, game_id, difficulty):
         """Play the selected mini game at the chosen difficulty."""
         universe_id = self.player["current_universe"]
         universe = self.universes[universe_id]
-        player_universe_data = self.player["universes"][universe_id]
-        
+
         # Play the game with universe-specific theming
         success = self.mini_game_system.play_game(game_id, difficulty, universe_id)
-        
-        # Update player stats
-        self.player["mini_games_played"] += 1
-        if success:
-            self.player["mini_games_won"] += 1
-            
-        # Add to mini game history
-        self.player["mini_game_history"].append({
-            "game_id": game_id,
-            "game_name": self.mini_game_system.mini_games[game_id]["name"],
-            "difficulty": difficulty,
-            "success": success,
-            "turn": self.player["turn"],
-            "universe": universe["name"]
-        })
-        
-        # Apply rewards if successful
-        if success:
-            rewards = self.mini_game_system.get_rewards(game_id, difficulty)
-            
-            # Add local currency
-            player_universe_data["cash"] += rewards["local_currency"]
-            
-            # Add quantum credits
-            self.player["quantum_credits"] += rewards["quantum_credits"]
-            
-            # Add reputation
-            player_universe_data["reputation"] += rewards["reputation"]
-            
+
+        # Record the outcome and apply the rewards
+        rng = self.mini_game_system.rng
+        result = self.act("finish_mini_game", game_id, difficulty, success, getattr(rng, "position", None))
+
+        if result.success and success:
+            rewards = result.details
+
             # Display rewards
             self.clear_screen()
             print("\n=== Mini Game Rewards ===")
@@ -3529,14 +2467,47 @@ class MultiVerseTycoon:
             print("\n=== Mini Game Results ===")
             print("Better luck next time! You didn't earn any rewards.")
         
-        # Set cooldown (1 turn for mini games)
-        self.player["mini_game_cooldown"] = 1
-        
-        input("\nPress Enter to continue...")
+        read_input("\nPress Enter to continue...")
     
     # All ad rewards related functions removed
 
 
 if __name__ == "__main__":
-    game = MultiVerseTycoon()
-    game.start_game()
+    parser = argparse.ArgumentParser(description="Multiverse Tycoon")
+    parser.add_argument("--autosave", type=int, default=0, metavar="N",
+                        help="autosave in the background every N turns")
+    parser.add_argument("--save-backend", choices=SAVE_BACKENDS, default=None,
+                        help="where to keep saves (default: $MULTIVERSE_SAVE_BACKEND or json)")
+    parser.add_argument("--pacing", choices=PACING_MODES, default=None,
+                        help="typing effects and pauses (default: $MULTIVERSE_PACING or cinematic)")
+    parser.add_argument("--timings", nargs="?", const="turn_timings.json",
+                        default=os.environ.get("MULTIVERSE_TIMINGS"), metavar="PATH",
+                        help="time each turn phase and write the stats to PATH at exit "
+                             "(default: $MULTIVERSE_TIMINGS; PATH defaults to turn_timings.json)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="campaign seed, to play the same dice rolls again (default: random)")
+    parser.add_argument("--no-journal", action="store_true",
+                        help="don't record an action journal next to the save")
+    parser.add_argument("--script", metavar="PATH",
+                        help="answer every prompt with the lines of PATH ('-' for stdin) instead of "
+                             "the keyboard; pacing defaults to instant")
+    args = parser.parse_args()
+
+    if args.script:
+        set_input_source(open_script(args.script))
+        if args.pacing is None and "MULTIVERSE_PACING" not in os.environ:
+            args.pacing = "instant"
+
+    timings = None
+    if args.timings:
+        timings = TurnTimings()
+        atexit.register(timings.dump, args.timings)
+
+    game = MultiVerseTycoon(autosave_every=args.autosave, save_backend=args.save_backend,
+                            pacing=args.pacing, timings=timings, seed=args.seed,
+                            journal=not args.no_journal)
+    try:
+        game.start_game()
+    except ScriptEnded as e:
+        # An unattended run is over once its script is
+        print(f"\n{e}.")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Central control over typing effects and dramatic pauses.
+
+Modes:
+    cinematic  Typing effects and pauses as written (the default)
+    fast       Text appears a line at a time and pauses are shortened
+    instant    No waiting at all; every line is written in one go
+    skip       Like cinematic, but pressing a key skips the rest of the
+               effects on the current screen
+"""
+
+import os
+import sys
+import time
+
+PACING_MODES = ("cinematic", "fast", "instant", "skip")
+DEFAULT_PACING = "cinematic"
+
+# Fraction of every pause kept in fast mode
+FAST_PAUSE_SCALE = 0.25
+
+# How often skip mode checks for a keypress while waiting
+KEY_POLL_INTERVAL = 0.02
+
+
+class _KeyWatcher:
+    """Non-blocking check for a keypress on an interactive stdin."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        try:
+            self.enabled = stream.isatty()
+        except (AttributeError, ValueError):
+            self.enabled = False
+
+    def pressed(self, timeout):
+        """Wait up to timeout seconds for a key, consuming it if one is pressed."""
+        if not self.enabled:
+            time.sleep(timeout)
+            return False
+
+        if os.name == "nt":
+            import msvcrt
+            deadline = time.monotonic() + timeout
+            while True:
+                if msvcrt.kbhit():
+                    while msvcrt.kbhit():
+                        msvcrt.getwch()
+                    return True
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(min(KEY_POLL_INTERVAL, max(0, deadline - time.monotonic())))
+
+        import select
+        import termios
+        import tty
+        fd = self.stream.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            # Without cbreak mode a key only shows up once Enter is pressed
+            tty.setcbreak(fd)
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if ready:
+                os.read(fd, 1024)
+            return bool(ready)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+class Pacer:
+    """Decides how long the game waits while showing text."""
+
+    def __init__(self, mode=None, output=None, keys=None):
+        """Initialize the pacer.
+
+        Args:
+            mode (str, optional): One of PACING_MODES; defaults to the
+                MULTIVERSE_PACING environment variable, then "cinematic"
+            output (file, optional): Stream to type into; defaults to sys.stdout
+            keys (file, optional): Stream watched for keypresses in skip mode;
+                defaults to sys.stdin
+        """
+        mode = mode or os.environ.get("MULTIVERSE_PACING", DEFAULT_PACING)
+        if mode not in PACING_MODES:
+            raise ValueError(f"Unknown pacing mode '{mode}'. Use one of {', '.join(PACING_MODES)}.")
+        self.mode = mode
+        self.output = output
+        self.keys = _KeyWatcher(keys or sys.stdin) if mode == "skip" else None
+        self.skipping = False
+
+    def new_screen(self):
+        """Re-enable effects skipped on the previous screen."""
+        self.skipping = False
+
+    def _wait(self, seconds):
+        """Sleep for a pause, unless the player presses a key in skip mode."""
+        if seconds <= 0 or self.skipping:
+            return
+        if self.keys is None:
+            time.sleep(seconds)
+        elif self.keys.pressed(seconds):
+            self.skipping = True
+
+    def pause(self, seconds):
+        """Show pending output, then wait as long as the mode allows."""
+        out = self.output or sys.stdout
+        out.flush()
+        if self.mode == "instant":
+            return
+        if self.mode == "fast":
+            seconds *= FAST_PAUSE_SCALE
+        self._wait(seconds)
+
+    def type_text(self, text, delay=0.01):
+        """Print a line of text, with a typing effect where the mode allows."""
+        out = self.output or sys.stdout
+        if self.mode in ("fast", "instant") or self.skipping:
+            out.write(text + "\n")
+            return
+
+        for i, char in enumerate(text):
+            out.write(char)
+            out.flush()
+            self._wait(delay)
+            if self.skipping:
+                out.write(text[i + 1:])
+                break
+        out.write("\n")
+        out.flush()
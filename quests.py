@@ -1,5 +1,100 @@
 #!/usr/bin/env python3
 
+from content import get_content
+
+
+class QuestTrigger:
+    """A quest objective compiled into the game event it listens for.
+    
+    Kinds:
+        count: add 1 progress when the event fires (optionally only for match_value)
+        cash: add 1 progress when value reaches threshold in the given universe
+        influence: complete when value reaches threshold in the given universe
+        businesses_owned: complete when the universe holds all of match_value
+        total_businesses: complete when businesses across all universes reach the target
+        at_least: complete when value reaches the objective target
+    """
+    
+    __slots__ = ("quest_id", "objective_index", "update_type", "kind", "match_value", "universe_id", "threshold")
+    
+    def __init__(self, quest_id, objective_index, update_type, kind,
+                 match_value=None, universe_id=None, threshold=None):
+        self.quest_id = quest_id
+        self.objective_index = objective_index
+        self.update_type = update_type
+        self.kind = kind
+        self.match_value = match_value
+        self.universe_id = universe_id
+        self.threshold = threshold
+
+
+def _description_number(description):
+    """Return the number written in an objective description (e.g. 10,000 -> 10000)."""
+    digits = ''.join(filter(str.isdigit, description))
+    return int(digits) if digits else 0
+
+
+def compile_objective(quest_id, objective_index, description):
+    """Compile an objective description into the triggers that advance it.
+    
+    Args:
+        quest_id (str): Quest the objective belongs to
+        objective_index (int): Position of the objective in the quest
+        description (str): Objective description
+        
+    Returns:
+        list: QuestTrigger objects, one per update type the objective listens for
+    """
+    triggers = []
+    
+    def listen(update_type, kind="count", **params):
+        triggers.append(QuestTrigger(quest_id, objective_index, update_type, kind, **params))
+    
+    if "Start" in description and "business" in description:
+        listen("business_started")
+    if "Hire" in description and "employee" in description:
+        listen("employee_hired")
+    if "Jump to another universe" in description:
+        listen("universe_traveled")
+    if "turns" in description:
+        listen("turn_completed")
+    if "Reduce detection risk" in description:
+        listen("risk_reduced")
+    if "Keep risk below" in description:
+        listen("low_risk_maintained")
+    if "Unlock universe travel" in description:
+        listen("feature_unlocked", match_value="universe_travel")
+    elif "Unlock research" in description:
+        listen("feature_unlocked", match_value="research")
+    if "Complete" in description and "research" in description:
+        listen("research_completed")
+    if "Win" in description and "mini-game" in description:
+        listen("minigame_won")
+    if "Achieve" in description and "Credits" in description and "Blade Runner" in description:
+        listen("cash_threshold", "cash", universe_id="blade_runner", threshold=_description_number(description))
+    elif "Achieve" in description and "$" in description and "GTA" in description:
+        listen("cash_threshold", "cash", universe_id="gta_v", threshold=_description_number(description))
+    if "Own a Replicant Manufacturing business" in description:
+        listen("specific_business_owned", match_value="replicant_manufacturing")
+    elif "Own a Nightclub and Auto Shop" in description:
+        listen("specific_business_owned", "businesses_owned", match_value=frozenset({"nightclub", "auto_shop"}),
+               universe_id="gta_v")
+    elif "Own a Stark Tech Competitor business" in description:
+        listen("specific_business_owned", match_value="stark_tech_competitor")
+    if "Experience the 'Stark Partnership' event" in description:
+        listen("event_experienced", match_value="Stark Partnership")
+    if "Reach" in description and "influence" in description:
+        listen("influence_threshold", "influence", universe_id="mcu", threshold=_description_number(description))
+    if "Own" in description and "businesses across all universes" in description:
+        listen("total_businesses", "total_businesses")
+    if "Accumulate" in description and "Quantum Credits" in description:
+        listen("quantum_credits", "at_least")
+    if "Reach player level" in description:
+        listen("player_level", "at_least")
+    
+    return triggers
+
+
 class Quest:
     def __init__(self, id, name, description, objectives, rewards, prerequisites=None):
         """Initialize a quest.
@@ -25,135 +120,59 @@ class Quest:
 class QuestSystem:
     def __init__(self):
         """Initialize the quest system with predefined quests."""
-        self.quests = {
-            # Beginner quests - guide the player through basic gameplay
-            "business_basics": Quest(
-                "business_basics",
-                "Business Basics",
-                "Start your interdimensional business empire with some basic operations.",
-                [
-                    {"description": "Start your first business", "target": 1, "current": 0, "completed": False},
-                    {"description": "Hire your first employee", "target": 1, "current": 0, "completed": False},
-                    {"description": "Complete 5 turns", "target": 5, "current": 0, "completed": False},
-                ],
-                {"cash": 2000, "quantum": 10, "xp": 200}
-            ),
-            
-            "risk_management": Quest(
-                "risk_management",
-                "Risk Management",
-                "Learn to manage detection risk in your operations.",
-                [
-                    {"description": "Reduce detection risk 3 times", "target": 3, "current": 0, "completed": False},
-                    {"description": "Keep risk below 30 for 5 turns", "target": 5, "current": 0, "completed": False},
-                ],
-                {"cash": 1500, "quantum": 15, "xp": 250},
-                ["business_basics"]
-            ),
-            
-            "multiverse_expansion": Quest(
-                "multiverse_expansion",
-                "Multiverse Expansion",
-                "Expand your business operations to multiple universes.",
-                [
-                    {"description": "Unlock universe travel", "target": 1, "current": 0, "completed": False},
-                    {"description": "Jump to another universe", "target": 1, "current": 0, "completed": False},
-                    {"description": "Start a business in a second universe", "target": 1, "current": 0, "completed": False},
-                ],
-                {"cash": 0, "quantum": 50, "xp": 500},
-                ["business_basics"]
-            ),
-            
-            "research_initiative": Quest(
-                "research_initiative",
-                "Research Initiative",
-                "Begin researching technologies to improve your operations.",
-                [
-                    {"description": "Unlock research", "target": 1, "current": 0, "completed": False},
-                    {"description": "Complete 1 research project", "target": 1, "current": 0, "completed": False},
-                ],
-                {"cash": 2500, "quantum": 25, "xp": 300},
-                ["business_basics"]
-            ),
-            
-            "entertainment_mogul": Quest(
-                "entertainment_mogul",
-                "Entertainment Mogul",
-                "Become skilled at the mini-games across universes.",
-                [
-                    {"description": "Win 5 mini-games", "target": 5, "current": 0, "completed": False},
-                    {"description": "Win 1 mini-game on hard difficulty", "target": 1, "current": 0, "completed": False},
-                ],
-                {"cash": 3000, "quantum": 30, "xp": 400},
-                ["business_basics"]
-            ),
-            
-            # Advanced universe-specific quests
-            "blade_runner_quest": Quest(
-                "blade_runner_quest",
-                "Replicant Revolution",
-                "Manage replicant resources in the Blade Runner universe to gain special benefits.",
-                [
-                    {"description": "Own a Replicant Manufacturing business", "target": 1, "current": 0, "completed": False},
-                    {"description": "Achieve 10,000 Credits in the Blade Runner universe", "target": 10000, "current": 0, "completed": False},
-                    {"description": "Reduce detection risk 5 times in Blade Runner", "target": 5, "current": 0, "completed": False},
-                ],
-                {"cash": 5000, "quantum": 50, "xp": 500}
-            ),
-            
-            "gta_quest": Quest(
-                "gta_quest",
-                "Criminal Enterprise",
-                "Build a criminal network in the GTA universe.",
-                [
-                    {"description": "Own a Nightclub and Auto Shop", "target": 2, "current": 0, "completed": False},
-                    {"description": "Complete a successful heist in GTA", "target": 1, "current": 0, "completed": False},
-                    {"description": "Achieve $50,000 in the GTA universe", "target": 50000, "current": 0, "completed": False},
-                ],
-                {"cash": 10000, "quantum": 75, "xp": 750},
-                ["multiverse_expansion"]
-            ),
-            
-            "mcu_quest": Quest(
-                "mcu_quest",
-                "Superhero Solutions",
-                "Provide tech solutions for superheroes in the MCU universe.",
-                [
-                    {"description": "Own a Stark Tech Competitor business", "target": 1, "current": 0, "completed": False},
-                    {"description": "Experience the 'Stark Partnership' event", "target": 1, "current": 0, "completed": False},
-                    {"description": "Reach 20 local influence in MCU", "target": 20, "current": 0, "completed": False},
-                ],
-                {"cash": 15000, "quantum": 100, "xp": 1000},
-                ["multiverse_expansion"]
-            ),
-            
-            # Master-level quests
-            "quantum_mastery": Quest(
-                "quantum_mastery",
-                "Quantum Entrepreneur",
-                "Master quantum business operations across the multiverse.",
-                [
-                    {"description": "Own 10 businesses across all universes", "target": 10, "current": 0, "completed": False},
-                    {"description": "Accumulate 500 Quantum Credits", "target": 500, "current": 0, "completed": False},
-                    {"description": "Reach player level 10", "target": 10, "current": 0, "completed": False},
-                ],
-                {"cash": 50000, "quantum": 250, "xp": 2000},
-                ["multiverse_expansion", "research_initiative"]
-            ),
-        }
-        
-        # Universe-specific quests
-        self.quests["blade_runner_quest"].universe_specific = "blade_runner"
-        self.quests["gta_quest"].universe_specific = "gta_v"
-        self.quests["mcu_quest"].universe_specific = "mcu"
+        self.quests = {}
+        for quest_id, entry in get_content("quests").items():
+            objectives = [
+                {"description": objective["description"], "target": objective["target"],
+                 "current": 0, "completed": False}
+                for objective in entry["objectives"]
+            ]
+            quest = Quest(quest_id, entry["name"], entry["description"], objectives,
+                          entry["rewards"], entry.get("prerequisites"))
+            # Universe-specific quests
+            quest.universe_specific = entry.get("universe_specific", "")
+            self.quests[quest_id] = quest
         
         # Track active quests
         self.active_quests = []
         self.completed_quests = []
         
+        # Objective triggers indexed by update type, and quest_id -> quests that require it
+        self.triggers_by_type = {}
+        self.dependents = {}
+        for quest in self.quests.values():
+            self._index_quest(quest)
+        
         # Initialize with the first quest active
         self.activate_quest("business_basics")
     
+    def add_quest(self, quest):
+        """Register an additional quest (e.g. from a mod) and compile its objectives.
+        
+        Args:
+            quest (Quest): Quest to add
+        """
+        if quest.id in self.quests:
+            self._unindex_quest(quest.id)
+        self.quests[quest.id] = quest
+        self._index_quest(quest)
+    
+    def _index_quest(self, quest):
+        """Compile a quest's objectives into triggers and record its prerequisites."""
+        for i, objective in enumerate(quest.objectives):
+            for trigger in compile_objective(quest.id, i, objective["description"]):
+                self.triggers_by_type.setdefault(trigger.update_type, []).append(trigger)
+        for prereq_id in quest.prerequisites:
+            self.dependents.setdefault(prereq_id, []).append(quest.id)
+    
+    def _unindex_quest(self, quest_id):
+        """Remove a quest's triggers and prerequisite links from the indexes."""
+        for update_type, triggers in self.triggers_by_type.items():
+            self.triggers_by_type[update_type] = [t for t in triggers if t.quest_id != quest_id]
+        for prereq_id, dependents in self.dependents.items():
+            if quest_id in dependents:
+                dependents.remove(quest_id)
+    
     def activate_quest(self, quest_id):
         """Activate a quest.
         
@@ -283,131 +302,71 @@ class QuestSystem:
         """
         newly_completed = []
         
-        for quest_id in self.active_quests[:]:  # Copy to avoid modification during iteration
-            quest = self.quests[quest_id]
+        for trigger in self.triggers_by_type.get(update_type, ()):
+            quest = self.quests[trigger.quest_id]
+            
+            # Only active quests progress; this also skips the rest of a quest
+            # once it completes during this update
+            if not quest.active:
+                continue
             
             # Skip universe-specific quests if not in that universe
             if quest.universe_specific and universe_id and quest.universe_specific != universe_id:
                 continue
             
-            for i, objective in enumerate(quest.objectives):
-                # Map update_type to objective descriptions
-                update_matches = False
-                
-                # Business related objectives
-                if update_type == "business_started" and "Start" in objective["description"] and "business" in objective["description"]:
-                    update_matches = True
-                
-                # Employee related objectives
-                elif update_type == "employee_hired" and "Hire" in objective["description"] and "employee" in objective["description"]:
-                    update_matches = True
-                
-                # Universe travel objectives
-                elif update_type == "universe_traveled" and "Jump to another universe" in objective["description"]:
-                    update_matches = True
-                
-                # Turn completion objectives
-                elif update_type == "turn_completed" and "turns" in objective["description"]:
-                    update_matches = True
-                
-                # Risk reduction objectives
-                elif update_type == "risk_reduced" and "Reduce detection risk" in objective["description"]:
-                    update_matches = True
-                
-                # Risk management objectives (keep below threshold)
-                elif update_type == "low_risk_maintained" and "Keep risk below" in objective["description"]:
-                    update_matches = True
-                
-                # Feature unlock objectives
-                elif update_type == "feature_unlocked":
-                    if "Unlock universe travel" in objective["description"] and isinstance(value, str) and value == "universe_travel":
-                        update_matches = True
-                    elif "Unlock research" in objective["description"] and isinstance(value, str) and value == "research":
-                        update_matches = True
-                
-                # Research completion objectives
-                elif update_type == "research_completed" and "Complete" in objective["description"] and "research" in objective["description"]:
-                    update_matches = True
-                
-                # Mini-game objectives
-                elif update_type == "minigame_won" and "Win" in objective["description"] and "mini-game" in objective["description"]:
-                    update_matches = True
-                
-                # Cash threshold objectives
-                elif update_type == "cash_threshold":
-                    if "Achieve" in objective["description"] and "Credits" in objective["description"] and "Blade Runner" in objective["description"]:
-                        if isinstance(value, int) and isinstance(universe_id, str):
-                            update_matches = universe_id == "blade_runner" and value >= int(''.join(filter(str.isdigit, objective["description"])))
-                    elif "Achieve" in objective["description"] and "$" in objective["description"] and "GTA" in objective["description"]:
-                        if isinstance(value, int) and isinstance(universe_id, str):
-                            update_matches = universe_id == "gta_v" and value >= int(''.join(filter(str.isdigit, objective["description"])))
-                
-                # Specific business ownership objectives
-                elif update_type == "specific_business_owned":
-                    if "Own a Replicant Manufacturing business" in objective["description"]:
-                        update_matches = value == "replicant_manufacturing"
-                    elif "Own a Nightclub and Auto Shop" in objective["description"]:
-                        current_businesses = set(game_state["universes"].get("gta_v", {}).get("businesses", []))
-                        target_businesses = {"nightclub", "auto_shop"}
-                        if target_businesses.issubset(current_businesses):
-                            update_matches = True
-                            objective["current"] = objective["target"]  # Complete this objective
-                    elif "Own a Stark Tech Competitor business" in objective["description"]:
-                        update_matches = value == "stark_tech_competitor"
-                
-                # Specific event experience objectives
-                elif update_type == "event_experienced" and "Experience the 'Stark Partnership' event" in objective["description"]:
-                    update_matches = value == "Stark Partnership"
-                
-                # Influence objectives
-                elif update_type == "influence_threshold" and "Reach" in objective["description"] and "influence" in objective["description"]:
-                    target_influence = int(''.join(filter(str.isdigit, objective["description"])))
-                    # Ensure value is an integer for comparison
-                    try:
-                        current_value = int(value) if isinstance(value, str) else value
-                        if universe_id == "mcu" and current_value >= target_influence:
-                            update_matches = True
-                            objective["current"] = objective["target"]  # Complete this objective
-                    except (ValueError, TypeError):
-                        # Skip if value can't be converted to int for comparison
-                        pass
-                
-                # Total businesses objectives
-                elif update_type == "total_businesses" and "Own" in objective["description"] and "businesses across all universes" in objective["description"]:
-                    total = 0
-                    for uni_id, uni_data in game_state["universes"].items():
-                        total += len(uni_data.get("businesses", []))
-                    if total >= objective["target"]:
-                        update_matches = True
-                        objective["current"] = objective["target"]  # Complete this objective
-                
-                # Quantum credits objectives
-                elif update_type == "quantum_credits" and "Accumulate" in objective["description"] and "Quantum Credits" in objective["description"]:
-                    if value >= objective["target"]:
-                        update_matches = True
-                        objective["current"] = objective["target"]  # Complete this objective
-                
-                # Player level objectives
-                elif update_type == "player_level" and "Reach player level" in objective["description"]:
-                    if value >= objective["target"]:
-                        update_matches = True
-                        objective["current"] = objective["target"]  # Complete this objective
-                
-                # If update matches this objective, update progress
-                if update_matches and not objective["completed"]:
-                    if self.update_quest_progress(quest_id, i, 1):  # Quest completed
-                        newly_completed.append(quest_id)
-                        break  # No need to check other objectives for this quest
+            objective = quest.objectives[trigger.objective_index]
+            if objective["completed"]:
+                continue
+            
+            if self._trigger_matches(trigger, objective, game_state, value, universe_id):
+                if self.update_quest_progress(quest.id, trigger.objective_index, 1):  # Quest completed
+                    newly_completed.append(quest.id)
         
         # Check for new quests to activate
         for completed_id in newly_completed:
             # Look for quests that have this as a prerequisite
-            for quest_id, quest in self.quests.items():
-                if completed_id in quest.prerequisites and not quest.active and not quest.completed:
+            for quest_id in self.dependents.get(completed_id, ()):
+                quest = self.quests[quest_id]
+                if not quest.active and not quest.completed:
                     self.activate_quest(quest_id)
         
         return newly_completed
     
+    @staticmethod
+    def _trigger_matches(trigger, objective, game_state, value, universe_id):
+        """Check whether an update advances an objective, completing it for threshold kinds."""
+        kind = trigger.kind
+        
+        if kind == "count":
+            return trigger.match_value is None or value == trigger.match_value
+        
+        if kind == "cash":
+            return (isinstance(value, int) and isinstance(universe_id, str)
+                    and universe_id == trigger.universe_id and value >= trigger.threshold)
+        
+        if kind == "influence":
+            # Ensure value is an integer for comparison
+            try:
+                current_value = int(value) if isinstance(value, str) else value
+                reached = universe_id == trigger.universe_id and current_value >= trigger.threshold
+            except (ValueError, TypeError):
+                # Skip if value can't be converted to int for comparison
+                return False
+        elif kind == "businesses_owned":
+            current_businesses = game_state["universes"].get(trigger.universe_id, {}).get("businesses", [])
+            reached = trigger.match_value.issubset(current_businesses)
+        elif kind == "total_businesses":
+            total = 0
+            for uni_data in game_state["universes"].values():
+                total += len(uni_data.get("businesses", []))
+            reached = total >= objective["target"]
+        else:  # at_least
+            reached = value >= objective["target"]
+        
+        if reached:
+            objective["current"] = objective["target"]  # Complete this objective
+        return reached
+    
     def get_active_quests_with_progress(self):
         """Get active quests with their progress information.
         
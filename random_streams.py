@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Independent, reproducible random number streams per subsystem.
+
+Every subsystem that rolls dice draws from its own random.Random, seeded
+from one campaign seed and the subsystem's name, so the draws of one never
+shift the draws of another and a campaign replays identically from its seed.
+
+Each stream counts the 32-bit words it has consumed. A save stores just the
+campaign seed and those positions; restoring re-seeds the streams and skips
+ahead, instead of storing the full Mersenne Twister state of every stream.
+"""
+
+import random
+
+# Streams used by the game
+EVENTS = "events"  # Random events in TurnEngine
+QUANTUM_EVENTS = "quantum_events"  # Quantum anomalies
+HEISTS = "heists"  # Heist outcomes
+MINIGAMES = "minigames"  # Mini game puzzles
+
+
+class CountingRandom(random.Random):
+    """A random.Random that knows how many 32-bit words it has drawn.
+
+    Every draw goes through random() (two words) or getrandbits(), so the
+    position is exact for all methods except gauss(), whose cached second
+    value is not part of it.
+    """
+
+    def seed(self, a=None, version=2):
+        super().seed(a, version)
+        self.position = 0
+
+    def random(self):
+        self.position += 2
+        return super().random()
+
+    def getrandbits(self, k):
+        self.position += (k + 31) // 32
+        return super().getrandbits(k)
+
+    def skip(self, words):
+        """Advance the stream by a number of words without using them."""
+        if words > 0:
+            self.getrandbits(32 * words)
+
+
+class RandomStreams:
+    """The named random streams of one campaign."""
+
+    def __init__(self, seed=None):
+        """Initialize the streams.
+
+        Args:
+            seed (int, optional): Campaign seed; drawn from the random module
+                when omitted, so random.seed() still makes runs repeatable
+        """
+        self.streams = {}
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Restart every stream from a new campaign seed."""
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        for name, stream in self.streams.items():
+            stream.seed(f"{self.seed}:{name}")
+
+    def __getitem__(self, name):
+        """The stream for a subsystem, created at position 0 on first use."""
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = self.streams[name] = CountingRandom(f"{self.seed}:{name}")
+        return stream
+
+    def state(self):
+        """Seed and stream positions, small enough to keep in the player state."""
+        return {
+            "seed": self.seed,
+            "positions": {name: stream.position for name, stream in self.streams.items() if stream.position},
+        }
+
+    def restore(self, state):
+        """Put every stream back where a saved state() left it.
+
+        Streams are restored in place, so subsystems holding them keep working.
+        """
+        self.reseed(state["seed"])
+        for name, position in state.get("positions", {}).items():
+            self[name].skip(position)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Terminal frame rendering.
+
+Every screen starts with clear_screen(). Instead of spawning a shell to run
+`clear`/`cls`, the renderer collects everything printed for the new screen
+and sends it to the terminal in a single write, prefixed with the ANSI
+cursor-home/erase sequence. The frame goes out as soon as anything flushes
+stdout, which input(), slow_print() and pause() all do.
+
+Terminals without ANSI support fall back to the platform clear command, and
+output that is not a terminal (pipes, files) is never cleared.
+"""
+
+import atexit
+import os
+import sys
+
+# Cursor home, erase screen, erase scrollback
+CLEAR_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
+
+def _enable_windows_ansi(stream):
+    """Turn on virtual terminal processing for a Windows console.
+
+    Returns:
+        bool: True if the console now understands ANSI sequences
+    """
+    try:
+        import ctypes
+        import msvcrt
+        kernel32 = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(stream.fileno())
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+
+def detect_clear_mode(stream):
+    """Work out how a stream's screen can be cleared.
+
+    Returns:
+        str: "ansi", "system" (run the platform clear command) or "none"
+    """
+    try:
+        if not stream.isatty():
+            return "none"
+    except (AttributeError, ValueError):
+        return "none"
+
+    if os.environ.get("TERM") == "dumb":
+        return "system"
+    if os.name == "nt" and not _enable_windows_ansi(stream):
+        return "system"
+    return "ansi"
+
+
+class FrameRenderer:
+    """Buffers each screen and writes it to the terminal in one go."""
+
+    def __init__(self, stream=None):
+        """Initialize the renderer.
+
+        Args:
+            stream (file, optional): Terminal stream to render to; defaults to
+                whatever sys.stdout is when a frame starts
+        """
+        self.stream = stream
+        self.frames = 0
+        self._target = None
+        self._parts = []
+        self._modes = {}
+
+    def clear_mode(self, stream):
+        """How the screen of a stream is cleared, detected once per stream."""
+        key = id(stream)
+        if key not in self._modes:
+            self._modes[key] = detect_clear_mode(stream)
+        return self._modes[key]
+
+    def clear(self):
+        """Start a new frame on a cleared screen.
+
+        Output printed until the next flush is held back and written together
+        with the clear sequence.
+        """
+        if self._target is None:
+            self._target = self.stream or sys.stdout
+            sys.stdout = self
+
+        mode = self.clear_mode(self._target)
+        if mode != "none":
+            # Whatever is still pending would be erased straight away
+            self._parts = []
+        if mode == "ansi":
+            self._parts.append(CLEAR_SEQUENCE)
+        elif mode == "system":
+            self._target.flush()
+            os.system('cls' if os.name == 'nt' else 'clear')
+        self.frames += 1
+
+    def write(self, text):
+        """Add text to the current frame.
+
+        Callers holding on to the renderer after the frame went out write
+        straight through to the terminal.
+        """
+        if self._target is None:
+            return self._passthrough().write(text)
+        self._parts.append(text)
+        return len(text)
+
+    def _passthrough(self):
+        """The stream output goes to while no frame is being built."""
+        if self.stream is not None:
+            return self.stream
+        return sys.stdout if sys.stdout is not self else sys.__stdout__
+
+    def flush(self):
+        """Send the current frame with a single write and stop buffering."""
+        target = self._target
+        if target is None:
+            self._passthrough().flush()
+            return
+        if sys.stdout is self:
+            sys.stdout = target
+        self._target = None
+
+        frame = "".join(self._parts)
+        self._parts = []
+        if frame:
+            target.write(frame)
+        target.flush()
+
+    def __getattr__(self, name):
+        # Anything else (encoding, isatty, fileno...) comes from the real stream
+        return getattr(self._target or self.stream or sys.__stdout__, name)
+
+
+_renderer = None
+
+
+def get_renderer():
+    """The renderer shared by the game and the admin tools."""
+    global _renderer
+    if _renderer is None:
+        _renderer = FrameRenderer()
+        atexit.register(_renderer.flush)
+    return _renderer
+
+
+def clear_screen():
+    """Clear the terminal screen and start a new frame."""
+    get_renderer().clear()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Replay a campaign from its action journal (see journal.py).
+
+Starts from the journal's first checkpoint (or its last, with --tail) and
+runs every recorded action and turn through a headless TurnEngine at full
+speed. Before each turn the random stream positions and the canonical state
+hash are checked against the recorded ones, and each later checkpoint (a
+loaded save) is compared with the replayed state, so a replay that drifts
+from what was played stops at the first entry where it does. The replayed
+player state can be written out to reproduce a crash or recover play since
+the last save.
+
+Usage:
+    python replay.py saves/multiverse_tycoon_save_Alice.journal.jsonl
+    python replay.py saves/multiverse_tycoon_save_Alice.journal.jsonl --tail --output recovered.json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from journal import read_journal
+from save_store import _plain
+
+
+class ReplayDivergence(Exception):
+    """The replayed campaign no longer matches the journal."""
+
+
+def _comparable(player):
+    """A player state as plain JSON values, without the save-time random state."""
+    return json.loads(json.dumps(
+        {key: value for key, value in player.items() if key != "random_state"}, default=_plain))
+
+
+def load_checkpoint(entry):
+    """A headless game continuing from a checkpoint entry, with fresh subsystems like a loaded save."""
+    from multiverse_tycoon import MultiVerseTycoon
+
+    game = MultiVerseTycoon(pacing="instant", seed=entry["random_state"]["seed"], journal=False)
+    game.player = entry["player"]
+    game.random_streams.restore(entry["random_state"])
+    return game
+
+
+def replay(entries, verify=True, tail=False):
+    """Replay journal entries.
+
+    Args:
+        entries (list): Journal entries, as read by read_journal()
+        verify (bool): Check random stream positions, state hashes and
+            loaded saves against the replay, raising ReplayDivergence on a
+            mismatch
+        tail (bool): Start from the last checkpoint instead of the first
+
+    Returns:
+        tuple: (game, stats) with the replayed game and the number of turns,
+            actions, saves and checkpoints replayed and the elapsed seconds
+    """
+    checkpoints = [index for index, entry in enumerate(entries) if entry["type"] == "checkpoint"]
+    if not checkpoints:
+        raise ValueError("The journal has no checkpoint to start from")
+
+    start = checkpoints[-1] if tail else checkpoints[0]
+    stats = {"turns": 0, "actions": 0, "saves": 0, "checkpoints": 0}
+    game = None
+    started = time.perf_counter()
+
+    for line, entry in enumerate(entries[start:], start + 1):
+        kind = entry["type"]
+        if kind == "checkpoint":
+            if verify and game is not None and _comparable(game.player) != _comparable(entry["player"]):
+                raise ReplayDivergence(f"Line {line}: the loaded save differs from the replayed state")
+            game = load_checkpoint(entry)
+            stats["checkpoints"] += 1
+        elif kind == "action":
+            getattr(game.turn_engine, entry["action"])(game.player, *entry["args"])
+            stats["actions"] += 1
+        elif kind == "turn":
+            if verify and (game.player["turn"] != entry["turn"]
+                           or game.random_streams.state() != entry["random_state"]
+                           or game.turn_engine.state_hash(game.player) != entry["state"]):
+                raise ReplayDivergence(f"Line {line}: turn {entry['turn']} starts from a different state")
+            game.turn_engine.advance_turn(game.player)
+            game.turn_engine.check_game_over(game.player, entry["universe"])
+            stats["turns"] += 1
+        elif kind == "save":
+            if verify and game.random_streams.state() != entry["random_state"]:
+                raise ReplayDivergence(f"Line {line}: the save at turn {entry['turn']} has different dice")
+            stats["saves"] += 1
+
+    stats["seconds"] = time.perf_counter() - started
+    return game, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a Multiverse Tycoon action journal headlessly.")
+    parser.add_argument("journal", help="journal file (multiverse_tycoon_save_<name>.journal.jsonl)")
+    parser.add_argument("--tail", action="store_true",
+                        help="start from the last checkpoint (the last new game or load) instead of the first")
+    parser.add_argument("--no-verify", action="store_true",
+                        help="don't stop where the replay drifts from the journal")
+    parser.add_argument("--output", metavar="PATH", help="write the replayed player state to PATH as JSON")
+    args = parser.parse_args()
+
+    try:
+        game, stats = replay(read_journal(args.journal), verify=not args.no_verify, tail=args.tail)
+    except (ReplayDivergence, ValueError) as e:
+        print(f"Replay failed: {e}", file=sys.stderr)
+        return 1
+
+    player = game.player
+    rate = stats["turns"] / stats["seconds"] if stats["seconds"] else 0
+    print(f"Replayed {stats['turns']} turns and {stats['actions']} actions "
+          f"({stats['saves']} saves, {stats['checkpoints']} checkpoints) "
+          f"in {stats['seconds']:.3f}s ({rate:.0f} turns/s)")
+    print(f"{player['name']}: turn {player['turn']}, level {player['player_level']}, "
+          f"{player['quantum_credits']} Q¢" + (f", game over: {player['end_reason']}" if player["game_over"] else ""))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(player, f, indent=2, default=_plain)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,129 +1,29 @@
 #!/usr/bin/env python3
 
+from content import get_content
+
+
 class ResearchSystem:
     """A system to manage research projects and technology development."""
     
     def __init__(self):
         """Initialize the research system with available technologies."""
         # Research technologies organized by categories
-        self.technologies = {
-            "business": {
-                "efficient_management": {
-                    "name": "Efficient Management",
-                    "description": "Streamline operations to increase business income by 10%.",
-                    "cost": {"quantum_credits": 150},
-                    "research_turns": 3,
-                    "effects": {"business_income_multiplier": 1.1},
-                    "required_level": 2,
-                    "prerequisites": []
-                },
-                "advanced_automation": {
-                    "name": "Advanced Automation",
-                    "description": "Automate routine tasks to increase business income by 20%.",
-                    "cost": {"quantum_credits": 350},
-                    "research_turns": 5,
-                    "effects": {"business_income_multiplier": 1.2},
-                    "required_level": 3,
-                    "prerequisites": ["efficient_management"]
-                },
-                "quantum_networking": {
-                    "name": "Quantum Networking",
-                    "description": "Connect businesses with quantum technology for a 30% income boost.",
-                    "cost": {"quantum_credits": 800},
-                    "research_turns": 8,
-                    "effects": {"business_income_multiplier": 1.3},
-                    "required_level": 5,
-                    "prerequisites": ["advanced_automation"]
-                }
-            },
-            "risk_management": {
-                "local_bribes": {
-                    "name": "Local Influence Networks",
-                    "description": "Establish connections with local officials to reduce detection risk by 2 per turn.",
-                    "cost": {"quantum_credits": 100},
-                    "research_turns": 2,
-                    "effects": {"detection_risk_reduction": 2},
-                    "required_level": 2,
-                    "prerequisites": []
-                },
-                "identity_masking": {
-                    "name": "Identity Masking",
-                    "description": "Use advanced technology to hide your true nature, reducing detection risk by 3 per turn.",
-                    "cost": {"quantum_credits": 300},
-                    "research_turns": 4,
-                    "effects": {"detection_risk_reduction": 3},
-                    "required_level": 3,
-                    "prerequisites": ["local_bribes"]
-                },
-                "dimensional_phasing": {
-                    "name": "Dimensional Phasing",
-                    "description": "Partially phase your operations into another dimension, reducing detection risk by 5 per turn.",
-                    "cost": {"quantum_credits": 700},
-                    "research_turns": 7,
-                    "effects": {"detection_risk_reduction": 5},
-                    "required_level": 5,
-                    "prerequisites": ["identity_masking"]
-                }
-            },
-            "interdimensional": {
-                "quantum_stabilizers": {
-                    "name": "Quantum Stabilizers",
-                    "description": "Stabilize quantum flux to generate 5 additional Quantum Credits per turn.",
-                    "cost": {"quantum_credits": 200},
-                    "research_turns": 3,
-                    "effects": {"quantum_income": 5},
-                    "required_level": 2,
-                    "prerequisites": []
-                },
-                "reality_anchors": {
-                    "name": "Reality Anchors",
-                    "description": "Create stable points across universes, generating 12 Quantum Credits per turn.",
-                    "cost": {"quantum_credits": 450},
-                    "research_turns": 6,
-                    "effects": {"quantum_income": 12},
-                    "required_level": 4,
-                    "prerequisites": ["quantum_stabilizers"]
-                },
-                "multiverse_resonance": {
-                    "name": "Multiverse Resonance",
-                    "description": "Harness the resonance between universes for 25 Quantum Credits per turn.",
-                    "cost": {"quantum_credits": 900},
-                    "research_turns": 9,
-                    "effects": {"quantum_income": 25},
-                    "required_level": 6,
-                    "prerequisites": ["reality_anchors"]
-                }
-            },
-            "expansion": {
-                "dimensional_scanner": {
-                    "name": "Dimensional Scanner",
-                    "description": "Scan for new universes, reducing the level requirement for the next universe by 1.",
-                    "cost": {"quantum_credits": 250},
-                    "research_turns": 4,
-                    "effects": {"universe_level_reduction": 1},
-                    "required_level": 3,
-                    "prerequisites": []
-                },
-                "quantum_tunneling": {
-                    "name": "Quantum Tunneling",
-                    "description": "Create stable tunnels between universes, reducing universe travel costs by 50%.",
-                    "cost": {"quantum_credits": 400},
-                    "research_turns": 5,
-                    "effects": {"universe_travel_discount": 0.5},
-                    "required_level": 4,
-                    "prerequisites": ["dimensional_scanner"]
-                },
-                "reality_synthesis": {
-                    "name": "Reality Synthesis",
-                    "description": "Gain the ability to unlock any universe regardless of level requirements.",
-                    "cost": {"quantum_credits": 1000},
-                    "research_turns": 10,
-                    "effects": {"ignore_universe_requirements": True},
-                    "required_level": 7,
-                    "prerequisites": ["quantum_tunneling"]
-                }
-            }
+        self.technologies = get_content("research")
+        
+        # Index of tech_id -> (category, tech) for direct lookups
+        self.tech_index = {
+            tech_id: (category, tech)
+            for category, technologies in self.technologies.items()
+            for tech_id, tech in technologies.items()
         }
+        
+        # Aggregated effects keyed by the frozenset of completed technologies
+        self._effects_cache = {}
+        # The completed_research list the cached effects were last served for
+        self._last_completed = None
+        self._last_completed_count = 0
+        self._last_effects = None
     
     def get_available_technologies(self, player_data):
         """Get technologies available to research based on player level and completed research."""
@@ -206,8 +106,7 @@ class ResearchSystem:
             # Check if complete
             if research_data["turns_remaining"] <= 0:
                 # Find the technology
-                category = research_data["category"]
-                tech = self.technologies[category][tech_id]
+                category, tech = self.tech_index[tech_id]
                 
                 # Add to completed research
                 if "completed_research" not in player_data:
@@ -228,10 +127,37 @@ class ResearchSystem:
         # Update current research to only include ongoing projects
         player_data["current_research"] = ongoing
         
+        # Aggregate the new set of effects now rather than on the next lookup
+        if completed:
+            self.apply_research_effects(player_data, player_data.get("current_universe"))
+        
         return completed
     
     def apply_research_effects(self, player_data, universe_id):
-        """Apply the effects of completed research to a universe."""
+        """Apply the effects of completed research to a universe.
+        
+        The returned dict is shared between callers and must not be modified.
+        """
+        completed_research = player_data.get("completed_research", [])
+        
+        # completed_research only ever grows, so the same list at the same
+        # length still has the same technologies
+        if (completed_research is self._last_completed
+                and len(completed_research) == self._last_completed_count):
+            return self._last_effects
+        
+        key = frozenset(completed_research)
+        effects = self._effects_cache.get(key)
+        if effects is None:
+            effects = self._effects_cache[key] = self._aggregate_effects(key)
+        
+        self._last_completed = completed_research
+        self._last_completed_count = len(completed_research)
+        self._last_effects = effects
+        return effects
+    
+    def _aggregate_effects(self, completed_research):
+        """Combine the effects of a set of completed technologies."""
         effects = {
             "business_income_multiplier": 1.0,
             "detection_risk_reduction": 0,
@@ -241,31 +167,27 @@ class ResearchSystem:
             "ignore_universe_requirements": False
         }
         
-        # Check if player has any completed research
-        if "completed_research" not in player_data:
-            return effects
-        
-        # Apply effects from all completed research
-        for tech_id in player_data["completed_research"]:
-            # Find the technology
-            for category, technologies in self.technologies.items():
-                if tech_id in technologies:
-                    tech = technologies[tech_id]
-                    
-                    # Apply each effect
-                    for effect_type, effect_value in tech["effects"].items():
-                        if effect_type == "business_income_multiplier":
-                            # Multiplicative stacking for income multipliers
-                            effects[effect_type] *= effect_value
-                        elif effect_type in ["detection_risk_reduction", "quantum_income", "universe_level_reduction"]:
-                            # Additive stacking for these effects
-                            effects[effect_type] += effect_value
-                        elif effect_type == "universe_travel_discount":
-                            # Take the highest discount
-                            effects[effect_type] = max(effects[effect_type], effect_value)
-                        elif effect_type == "ignore_universe_requirements":
-                            # Boolean OR
-                            effects[effect_type] = effects[effect_type] or effect_value
+        # Apply effects from all completed research, in a fixed order so the
+        # float product doesn't depend on set iteration order
+        for tech_id in sorted(completed_research):
+            if tech_id not in self.tech_index:
+                continue
+            category, tech = self.tech_index[tech_id]
+            
+            # Apply each effect
+            for effect_type, effect_value in tech["effects"].items():
+                if effect_type == "business_income_multiplier":
+                    # Multiplicative stacking for income multipliers
+                    effects[effect_type] *= effect_value
+                elif effect_type in ["detection_risk_reduction", "quantum_income", "universe_level_reduction"]:
+                    # Additive stacking for these effects
+                    effects[effect_type] += effect_value
+                elif effect_type == "universe_travel_discount":
+                    # Take the highest discount
+                    effects[effect_type] = max(effects[effect_type], effect_value)
+                elif effect_type == "ignore_universe_requirements":
+                    # Boolean OR
+                    effects[effect_type] = effects[effect_type] or effect_value
         
         return effects
     
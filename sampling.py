@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Weighted random sampling in constant time.
+
+AliasTable implements Vose's alias method: after O(n) setup, every draw
+takes one random number and two list lookups, however many outcomes there
+are. EventPool uses it to pick a universe's random events by weight while
+skipping the events that fired most recently.
+"""
+
+
+class AliasTable:
+    """Sample indexes 0..n-1 in proportion to fixed weights."""
+
+    def __init__(self, weights):
+        """Build the probability and alias columns.
+
+        Args:
+            weights (list): Non-negative weight per index, not all zero
+
+        Raises:
+            ValueError: If there are no weights or they don't sum to a positive number
+        """
+        size = len(weights)
+        total = sum(weights)
+        if size == 0 or total <= 0 or any(weight < 0 for weight in weights):
+            raise ValueError("Weights must be non-negative with a positive total")
+
+        # Pair every under-full column with an over-full one that tops it up
+        scaled = [weight * size / total for weight in weights]
+        probability = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is full up to rounding error
+
+        self.size = size
+        self.probability = probability
+        self.alias = alias
+
+    def sample(self, rng):
+        """Draw an index using rng (a random.Random or the random module)."""
+        position = rng.random() * self.size
+        column = int(position)
+        if position - column < self.probability[column]:
+            return column
+        return self.alias[column]
+
+
+class EventPool:
+    """A universe's random events, drawn by their optional "weight" (default 1)."""
+
+    # Draws that may hit a recently fired event before falling back to a
+    # filtered draw; only matters for universes with very few events
+    MAX_REJECTIONS = 16
+
+    def __init__(self, events):
+        """Precompute the alias table for a list of event dicts."""
+        self.events = events
+        self.weights = [event.get("weight", 1) for event in events]
+        self.table = AliasTable(self.weights)
+
+    def sample(self, rng, recent=()):
+        """Draw an event, avoiding the names in recent when any other event is left.
+
+        Rejecting recent events and drawing again keeps the remaining events
+        in proportion to their weights.
+        """
+        events = self.events
+        if not recent:
+            return events[self.table.sample(rng)]
+
+        for _ in range(self.MAX_REJECTIONS):
+            event = events[self.table.sample(rng)]
+            if event["name"] not in recent:
+                return event
+
+        available = [(event, weight) for event, weight in zip(events, self.weights)
+                     if event["name"] not in recent and weight > 0]
+        if not available:
+            # Every event fired recently
+            return events[self.table.sample(rng)]
+        candidates, weights = zip(*available)
+        return rng.choices(candidates, weights)[0]
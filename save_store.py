@@ -0,0 +1,666 @@
+#!/usr/bin/env python3
+"""
+Save storage for Multiverse Tycoon.
+
+JsonSaveStore (the default) keeps each save as a base snapshot
+(multiverse_tycoon_save_<name>.json) plus an append-only log of per-save
+deltas (multiverse_tycoon_save_<name>.delta.jsonl). Each save appends only
+what changed since the previous one, and every few saves the log is compacted
+back into a fresh snapshot.
+
+SQLiteSaveStore keeps every profile as one row of a SQLite database, for
+machines hosting many players.
+"""
+
+import copy
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+SAVE_PREFIX = "multiverse_tycoon_save_"
+SAVE_SUFFIX = ".json"
+DELTA_SUFFIX = ".delta.jsonl"
+JOURNAL_SUFFIX = ".journal.jsonl"
+MANIFEST_NAME = "save_manifest.json"
+DATABASE_NAME = "multiverse_tycoon_saves.db"
+SAVE_BACKENDS = ("json", "sqlite")
+SAVE_FORMAT_VERSION = 2
+
+# Lists that only ever grow during a campaign; deltas carry just the new entries
+APPEND_ONLY_KEYS = ("mini_game_history", "heist_history")
+
+# Summary fields that rewrite the manifest when they change; wealth and save
+# times alone are left to the next change so repeated saves stay cheap
+MANIFEST_KEY_FIELDS = ("level", "turn", "universes_unlocked")
+
+
+def _plain(value):
+    """JSON fallback for containers kept in the player state, such as ring buffers."""
+    if isinstance(value, deque):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode(value):
+    return json.dumps(value, separators=(",", ":"), default=_plain)
+
+
+def summarize_player(player, currency_exchange=None):
+    """Summarize a player state for save listings and statistics."""
+    if currency_exchange is not None:
+        quantum_wealth = currency_exchange.calculate_total_quantum_wealth(player)
+    else:
+        quantum_wealth = player.get("quantum_credits", 0)
+    return {
+        "name": player["name"],
+        "level": player.get("player_level", 1),
+        "turn": player.get("turn", 1),
+        "universes_unlocked": len(player.get("unlocked_universes", [])),
+        "quantum_wealth": quantum_wealth,
+        "last_saved": time.time(),
+    }
+
+
+def _resolve_exchange(currency_exchange):
+    """The exchange a store was given, calling it first if it was given as a function."""
+    return currency_exchange() if callable(currency_exchange) else currency_exchange
+
+
+def open_save_store(backend=None, directory="saves", currency_exchange=None):
+    """Create the save store for a backend name ("json" or "sqlite").
+
+    Without a backend name, the MULTIVERSE_SAVE_BACKEND environment variable
+    is used, defaulting to "json". currency_exchange values save summaries;
+    it may be a function returning the exchange, so that the exchange is
+    only built when the first summary is.
+    """
+    backend = backend or os.environ.get("MULTIVERSE_SAVE_BACKEND", "json")
+    if backend == "sqlite":
+        return SQLiteSaveStore(os.path.join(directory, DATABASE_NAME), currency_exchange)
+    if backend == "json":
+        return JsonSaveStore(directory, currency_exchange=currency_exchange)
+    raise ValueError(f"Unknown save backend '{backend}'. Use one of {', '.join(SAVE_BACKENDS)}.")
+
+
+def atomic_write(path, text):
+    """Replace a file's contents so readers see either the old or the new file, never a mix."""
+    directory = os.path.dirname(path) or "."
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "w") as temp_file:
+            temp_file.write(text)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    # Make the rename itself durable (not supported on Windows)
+    if hasattr(os, "O_DIRECTORY"):
+        directory_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+
+class JsonSaveStore:
+    """Stores player saves as JSON snapshots with append-only delta logs."""
+
+    def __init__(self, directory="saves", compact_every=20, currency_exchange=None):
+        self.directory = directory
+        self.compact_every = compact_every
+        self._currency_exchange = currency_exchange  # Or a function returning it
+        # Per-player record of what is already on disk:
+        # name -> {"seq", "deltas", "fields", "lengths"}
+        self._saved = {}
+        # name -> MANIFEST_KEY_FIELDS values last written to the manifest
+        self._listed = {}
+        # Saves may come from the autosave thread and the menu at the same time
+        self._lock = threading.RLock()
+
+    def save_path(self, player_name):
+        return os.path.join(self.directory, f"{SAVE_PREFIX}{player_name}{SAVE_SUFFIX}")
+
+    def delta_path(self, player_name):
+        return os.path.join(self.directory, f"{SAVE_PREFIX}{player_name}{DELTA_SUFFIX}")
+
+    def journal_path(self, player_name):
+        return os.path.join(self.directory, f"{SAVE_PREFIX}{player_name}{JOURNAL_SUFFIX}")
+
+    def list_saves(self):
+        """Return the player names that have a save in this store."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            f[len(SAVE_PREFIX):-len(SAVE_SUFFIX)] for f in os.listdir(self.directory)
+            if f.startswith(SAVE_PREFIX) and f.endswith(SAVE_SUFFIX)
+        )
+
+    def exists(self, player_name):
+        return os.path.exists(self.save_path(player_name))
+
+    def manifest_path(self):
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    def list_save_info(self):
+        """Return a summary of every save, read from the manifest.
+
+        Returns:
+            list: Dicts with name, level, turn, universes_unlocked,
+            quantum_wealth and last_saved (a Unix timestamp), most recently
+            saved first
+        """
+        with self._lock:
+            manifest = self._read_manifest()
+            names = set(self.list_saves())
+            changed = False
+
+            for name in [n for n in manifest if n not in names]:
+                del manifest[name]
+                changed = True
+
+            # Saves made before the manifest existed are summarized once
+            for name in names - set(manifest):
+                try:
+                    manifest[name] = self.manifest_entry(self._load(name))
+                    manifest[name].update(name=name, last_saved=os.path.getmtime(self.save_path(name)))
+                    changed = True
+                except (OSError, ValueError, KeyError):
+                    continue
+
+            if changed:
+                self._write_manifest(manifest)
+
+            # Saves that left the manifest entry alone still moved the files' times
+            for name, entry in manifest.items():
+                for path in (self.save_path(name), self.delta_path(name)):
+                    try:
+                        entry["last_saved"] = max(entry["last_saved"], os.path.getmtime(path))
+                    except OSError:
+                        pass
+
+        return sorted(manifest.values(), key=lambda entry: entry["last_saved"], reverse=True)
+
+    @property
+    def currency_exchange(self):
+        return _resolve_exchange(self._currency_exchange)
+
+    def manifest_entry(self, player):
+        """Summarize a player state for the load menu."""
+        return summarize_player(player, self.currency_exchange)
+
+    def stats(self):
+        """Aggregate statistics over all saved profiles."""
+        return _save_statistics(self.list_save_info())
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path(), "r") as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest):
+        os.makedirs(self.directory, exist_ok=True)
+        atomic_write(self.manifest_path(), json.dumps(manifest, indent=2))
+
+    def _update_manifest(self, entries):
+        """Write manifest entries (name -> summary, or None to remove) in one go."""
+        # Re-read so entries written by other game processes are kept
+        manifest = self._read_manifest()
+        for name, entry in entries.items():
+            if entry is None:
+                manifest.pop(name, None)
+            else:
+                manifest[name] = entry
+        self._write_manifest(manifest)
+
+        for name, entry in entries.items():
+            if entry is None:
+                self._listed.pop(name, None)
+            else:
+                self._listed[name] = tuple(entry[field] for field in MANIFEST_KEY_FIELDS)
+
+    def save(self, player):
+        """Save the player state, writing a delta when a snapshot already exists.
+
+        Returns:
+            str: Path of the snapshot file for this player
+        """
+        name = player["name"]
+        with self._lock:
+            self._save(name, player)
+            entry = self.manifest_entry(player)
+            if self._listed.get(name) != tuple(entry[field] for field in MANIFEST_KEY_FIELDS):
+                self._update_manifest({name: entry})
+        return self.save_path(name)
+
+    def _save(self, name, player):
+        saved = self._saved.get(name)
+        if (saved is None or saved["deltas"] >= self.compact_every
+                or not os.path.exists(self.save_path(name))):
+            self.compact(player)
+        else:
+            delta = self._diff(player, saved)
+            if delta["set"] or delta["unset"] or delta["append"]:
+                delta["seq"] = saved["seq"] + 1
+                delta["turn"] = player.get("turn")
+                try:
+                    with open(self.delta_path(name), "a") as delta_file:
+                        delta_file.write(_encode(delta) + "\n")
+                        delta_file.flush()
+                        os.fsync(delta_file.fileno())
+                except BaseException:
+                    # The record already holds this save's changes; forget it
+                    # so the next save writes a full snapshot instead
+                    self._saved.pop(name, None)
+                    raise
+                saved["seq"] = delta["seq"]
+                saved["deltas"] += 1
+
+    def compact(self, player):
+        """Write a full snapshot of the player and clear the delta log."""
+        name = player["name"]
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            saved = self._saved.get(name)
+            seq = saved["seq"] + 1 if saved else self._read_seq(name) + 1
+
+            snapshot = {"format": SAVE_FORMAT_VERSION, "seq": seq, "player": player}
+            atomic_write(self.save_path(name), json.dumps(snapshot, default=_plain))
+
+            # Deltas up to seq are now part of the snapshot; if we crash before the
+            # truncate below, load() skips them by sequence number.
+            open(self.delta_path(name), "w").close()
+            self._remember(name, player, seq)
+
+    def load(self, player_name):
+        """Load a player's state by replaying its delta log onto the snapshot."""
+        with self._lock:
+            return self._load(player_name)
+
+    def _load(self, player_name):
+        with open(self.save_path(player_name), "r") as save_file:
+            data = json.load(save_file)
+
+        # Saves written before the delta format are a bare player dict
+        if data.get("format") != SAVE_FORMAT_VERSION:
+            player, seq = data, 0
+        else:
+            player, seq = data["player"], data["seq"]
+
+        deltas = 0
+        for delta in self._read_deltas(player_name):
+            if delta["seq"] <= seq:
+                continue
+            self._apply(player, delta)
+            seq = delta["seq"]
+            deltas += 1
+
+        self._remember(player_name, player, seq)
+        self._saved[player_name]["deltas"] = deltas
+        return player
+
+    def delete(self, player_name):
+        """Remove a player's snapshot, delta log and action journal."""
+        self.delete_many([player_name])
+
+    def delete_many(self, player_names):
+        """Remove several players' saves, rewriting the manifest once."""
+        deleted = {}
+        with self._lock:
+            try:
+                for player_name in player_names:
+                    for path in (self.save_path(player_name), self.delta_path(player_name),
+                                 self.journal_path(player_name)):
+                        if os.path.exists(path):
+                            os.remove(path)
+                    self._saved.pop(player_name, None)
+                    deleted[player_name] = None
+            finally:
+                if deleted:
+                    self._update_manifest(deleted)
+
+    def _read_seq(self, player_name):
+        """Return the highest sequence number already on disk for a player."""
+        seq = 0
+        try:
+            with open(self.save_path(player_name), "r") as save_file:
+                seq = json.load(save_file).get("seq", 0)
+        except (OSError, ValueError):
+            pass
+        for delta in self._read_deltas(player_name):
+            seq = max(seq, delta["seq"])
+        return seq
+
+    def _read_deltas(self, player_name):
+        """Read a player's delta log, cutting off a partial line left by a crash.
+
+        The log is repaired on disk, so the next delta is appended after the
+        last good one instead of onto the broken line.
+        """
+        path = self.delta_path(player_name)
+        try:
+            with open(path, "rb") as delta_file:
+                lines = delta_file.readlines()
+        except FileNotFoundError:
+            return []
+
+        deltas = []
+        good_end = 0
+        for line in lines:
+            try:
+                deltas.append(json.loads(line))
+            except ValueError:
+                # A crash mid-append leaves a partial last line; everything
+                # before it is still good.
+                break
+            good_end += len(line)
+
+        size = sum(len(line) for line in lines)
+        if good_end < size:
+            with open(path, "r+b") as delta_file:
+                delta_file.truncate(good_end)
+        elif lines and not lines[-1].endswith(b"\n"):
+            # The last delta is complete but lost its newline
+            with open(path, "ab") as delta_file:
+                delta_file.write(b"\n")
+        return deltas
+
+    def _remember(self, name, player, seq):
+        """Record the encoded state just written so the next save can diff against it."""
+        fields = {}
+        for key, value in player.items():
+            if key in APPEND_ONLY_KEYS:
+                continue
+            if isinstance(value, dict):
+                fields[key] = {child: _encode(child_value) for child, child_value in value.items()}
+            else:
+                fields[key] = _encode(value)
+
+        self._saved[name] = {
+            "seq": seq,
+            "deltas": 0,
+            "fields": fields,
+            "lengths": {key: len(player.get(key, [])) for key in APPEND_ONLY_KEYS},
+        }
+
+    def _diff(self, player, saved):
+        """Build a delta against the last saved state and update the record.
+
+        Top-level values are compared by their JSON encoding, dicts one level
+        down so a change in one universe doesn't rewrite the others.
+        """
+        delta = {"set": [], "unset": [], "append": {}}
+        fields = saved["fields"]
+
+        for key, value in player.items():
+            if key in APPEND_ONLY_KEYS:
+                continue
+            previous = fields.get(key)
+
+            if isinstance(value, dict) and isinstance(previous, dict):
+                for child, child_value in value.items():
+                    encoded = _encode(child_value)
+                    if previous.get(child) != encoded:
+                        delta["set"].append([[key, child], child_value])
+                        previous[child] = encoded
+                for child in [c for c in previous if c not in value]:
+                    delta["unset"].append([key, child])
+                    del previous[child]
+            elif isinstance(value, dict):
+                delta["set"].append([[key], value])
+                fields[key] = {child: _encode(child_value) for child, child_value in value.items()}
+            else:
+                encoded = _encode(value)
+                if previous != encoded:
+                    delta["set"].append([[key], value])
+                    fields[key] = encoded
+
+        for key in [k for k in fields if k not in player]:
+            delta["unset"].append([key])
+            del fields[key]
+
+        for key in APPEND_ONLY_KEYS:
+            history = player.get(key, [])
+            saved_length = saved["lengths"][key]
+            if len(history) > saved_length:
+                delta["append"][key] = history[saved_length:]
+            elif len(history) < saved_length:
+                # The list was reset rather than appended to
+                delta["set"].append([[key], history])
+            saved["lengths"][key] = len(history)
+
+        return delta
+
+    @staticmethod
+    def _apply(player, delta):
+        for path, value in delta["set"]:
+            if len(path) == 1:
+                player[path[0]] = value
+            else:
+                player.setdefault(path[0], {})[path[1]] = value
+        for path in delta["unset"]:
+            if len(path) == 1:
+                player.pop(path[0], None)
+            else:
+                player.get(path[0], {}).pop(path[1], None)
+        for key, entries in delta["append"].items():
+            player.setdefault(key, []).extend(entries)
+
+
+class SQLiteSaveStore:
+    """Stores player saves as rows of a SQLite database.
+
+    Name, level, turn and total quantum wealth are indexed columns, so listing,
+    deleting and aggregating profiles never touches the rest of the state,
+    which is kept as a JSON blob.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS saves (
+            name TEXT PRIMARY KEY,
+            level INTEGER NOT NULL,
+            turn INTEGER NOT NULL,
+            quantum_wealth REAL NOT NULL,
+            universes_unlocked INTEGER NOT NULL,
+            last_saved REAL NOT NULL,
+            state BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS saves_level ON saves (level);
+        CREATE INDEX IF NOT EXISTS saves_turn ON saves (turn);
+        CREATE INDEX IF NOT EXISTS saves_quantum_wealth ON saves (quantum_wealth);
+        CREATE INDEX IF NOT EXISTS saves_last_saved ON saves (last_saved);
+    """
+
+    def __init__(self, path=os.path.join("saves", DATABASE_NAME), currency_exchange=None):
+        self.path = path
+        self._currency_exchange = currency_exchange  # Or a function returning it
+        self._lock = threading.RLock()
+        self._connection = None
+
+    def _connect(self):
+        if self._connection is None:
+            import sqlite3  # Only needed with the SQLite backend
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            # Shared with the autosave thread; self._lock serializes access
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            # Let other game processes read while one of them is saving
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(self.SCHEMA)
+        return self._connection
+
+    @property
+    def currency_exchange(self):
+        return _resolve_exchange(self._currency_exchange)
+
+    def save_path(self, player_name):
+        return f"{self.path} ({player_name})"
+
+    def journal_path(self, player_name):
+        return os.path.join(os.path.dirname(self.path), f"{SAVE_PREFIX}{player_name}{JOURNAL_SUFFIX}")
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def list_saves(self):
+        """Return the player names that have a save in this store."""
+        if not os.path.exists(self.path):
+            return []
+        with self._lock:
+            rows = self._connect().execute("SELECT name FROM saves ORDER BY name").fetchall()
+        return [name for (name,) in rows]
+
+    def list_save_info(self):
+        """Return a summary of every save, most recently saved first."""
+        if not os.path.exists(self.path):
+            return []
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT name, level, turn, universes_unlocked, quantum_wealth, last_saved "
+                "FROM saves ORDER BY last_saved DESC").fetchall()
+        return [
+            {"name": name, "level": level, "turn": turn, "universes_unlocked": universes_unlocked,
+             "quantum_wealth": quantum_wealth, "last_saved": last_saved}
+            for name, level, turn, universes_unlocked, quantum_wealth, last_saved in rows
+        ]
+
+    def exists(self, player_name):
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT 1 FROM saves WHERE name = ?", (player_name,)).fetchone()
+        return row is not None
+
+    def save(self, player):
+        """Save the player state in a single transaction."""
+        summary = summarize_player(player, self.currency_exchange)
+        state = _encode(player).encode("utf-8")
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO saves "
+                    "(name, level, turn, quantum_wealth, universes_unlocked, last_saved, state) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (summary["name"], summary["level"], summary["turn"], summary["quantum_wealth"],
+                     summary["universes_unlocked"], summary["last_saved"], state))
+        return self.save_path(player["name"])
+
+    def load(self, player_name):
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT state FROM saves WHERE name = ?", (player_name,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"No save found for {player_name}")
+        return json.loads(row[0])
+
+    def delete(self, player_name):
+        self.delete_many([player_name])
+
+    def delete_many(self, player_names):
+        """Remove several players' saves in a single transaction."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany("DELETE FROM saves WHERE name = ?",
+                                       [(player_name,) for player_name in player_names])
+        for player_name in player_names:
+            if os.path.exists(self.journal_path(player_name)):
+                os.remove(self.journal_path(player_name))
+
+    def stats(self):
+        """Aggregate statistics over all saved profiles."""
+        if not os.path.exists(self.path):
+            return _save_statistics([])
+        with self._lock:
+            connection = self._connect()
+            profiles, average_level, max_level, max_turn, total_wealth = connection.execute(
+                "SELECT COUNT(*), AVG(level), MAX(level), MAX(turn), SUM(quantum_wealth) FROM saves"
+            ).fetchone()
+            richest = connection.execute(
+                "SELECT name, quantum_wealth FROM saves ORDER BY quantum_wealth DESC LIMIT 5").fetchall()
+        return {
+            "profiles": profiles,
+            "average_level": round(average_level or 0, 2),
+            "max_level": max_level or 0,
+            "max_turn": max_turn or 0,
+            "total_quantum_wealth": round(total_wealth or 0, 2),
+            "richest": richest,
+        }
+
+
+def _save_statistics(entries):
+    """Compute the stats() report from a list of save summaries."""
+    richest = sorted(entries, key=lambda entry: entry.get("quantum_wealth", 0), reverse=True)[:5]
+    return {
+        "profiles": len(entries),
+        "average_level": round(sum(e["level"] for e in entries) / len(entries), 2) if entries else 0,
+        "max_level": max((e["level"] for e in entries), default=0),
+        "max_turn": max((e["turn"] for e in entries), default=0),
+        "total_quantum_wealth": round(sum(e.get("quantum_wealth", 0) for e in entries), 2),
+        "richest": [(e["name"], e.get("quantum_wealth", 0)) for e in richest],
+    }
+
+
+class AutosaveWorker:
+    """Writes copies of the player state to a save store on a background thread.
+
+    Only the newest pending copy is kept: if the disk falls behind, older
+    autosaves are skipped rather than queued.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.last_error = None
+        self.last_saved_turn = None
+        self._pending = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def submit(self, player):
+        """Queue a consistent copy of the player state for writing."""
+        snapshot = copy.deepcopy(player)
+        while True:
+            try:
+                self._pending.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self._pending.get_nowait()
+                    self._pending.task_done()
+                except queue.Empty:
+                    pass
+
+    def flush(self):
+        """Block until every queued autosave has been written."""
+        self._pending.join()
+
+    def close(self):
+        """Write any pending autosave and stop the thread."""
+        if self._thread.is_alive():
+            self.flush()
+            self._pending.put(None)
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            player = self._pending.get()
+            try:
+                if player is None:
+                    return
+                self.store.save(player)
+                self.last_saved_turn = player.get("turn")
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+            finally:
+                self._pending.task_done()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo campaign simulator for balancing Multiverse Tycoon.
+
+Plays many complete campaigns headlessly through the TurnEngine, spread over a
+process pool, and reports how long victories take, why campaigns end and how
+much quantum wealth players finish with.
+
+Usage:
+    python simulate.py -n 1000 --policy greedy --seed 42
+    python simulate.py -n 200 --policy my_bots:cautious_policy --json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import statistics
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+
+def idle_policy(engine, player, rng):
+    """Never take an action, just let the turns pass."""
+
+
+def random_policy(engine, player, rng):
+    """Take one random action per turn, whether or not it is affordable."""
+    universe = engine.universes[player["current_universe"]]
+    choice = rng.randrange(5)
+
+    if choice == 0:
+        engine.start_business(player, rng.choice(list(universe["businesses"])))
+    elif choice == 1:
+        engine.hire_employee(player, rng.choice(list(engine.employee_types)))
+    elif choice == 2:
+        engine.reduce_detection_risk(player, rng.randrange(len(engine.COUNTERMEASURES)))
+    elif choice == 3 and player["unlocked_features"]["universe_travel"]:
+        engine.jump_universe(player, rng.choice(player["unlocked_universes"]))
+    # Otherwise wait a turn
+
+
+def greedy_policy(engine, player, rng):
+    """Keep risk in check, then buy the best affordable business, then expand."""
+    universe_id = player["current_universe"]
+    universe = engine.universes[universe_id]
+    player_universe_data = player["universes"][universe_id]
+    cash = player_universe_data["cash"]
+
+    # Stay well clear of the detection threshold
+    if player_universe_data["danger"] >= 60:
+        for option in reversed(range(len(engine.COUNTERMEASURES))):
+            if engine.reduce_detection_risk(player, option).success:
+                return
+
+    # Buy the highest income business we can afford
+    affordable = [
+        (business["income_per_turn"], business_id)
+        for business_id, business in universe["businesses"].items()
+        if business_id not in player_universe_data["businesses"] and business["cost"] <= cash
+    ]
+    if affordable:
+        engine.start_business(player, max(affordable)[1])
+        return
+
+    # Research whatever is cheapest once the division is open
+    if player["unlocked_features"]["research"] and not player["current_research"]:
+        available = engine.research_system.get_available_technologies(player)
+        options = [
+            (tech["cost"]["quantum_credits"], tech_id, category)
+            for category, technologies in available.items()
+            for tech_id, tech in technologies.items()
+        ]
+        if options:
+            cost, tech_id, category = min(options)
+            if cost <= player["quantum_credits"]:
+                engine.research_system.start_research(player, tech_id, category)
+                return
+
+    # Move on once this universe is fully built out
+    if len(player_universe_data["businesses"]) == len(universe["businesses"]):
+        if player["unlocked_features"]["universe_travel"]:
+            targets = [
+                (len(player["universes"][target]["businesses"]), target)
+                for target in player["unlocked_universes"]
+                if target != universe_id
+            ]
+            if targets and min(targets)[0] < len(engine.universes[min(targets)[1]]["businesses"]):
+                engine.jump_universe(player, min(targets)[1])
+                return
+
+        # Bank surplus cash as Quantum Credits for the victory condition
+        if player["unlocked_features"]["currency_exchange"] and cash > 20000:
+            engine.exchange_to_quantum(player, cash - 10000)
+            return
+
+    # Staff up when there is income to boost
+    if player_universe_data["businesses"] and cash > 15000:
+        engine.hire_employee(player, "tech_expert")
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
+
+
+def resolve_policy(name):
+    """Look up a built-in policy or import one given as 'module:function'."""
+    if name in POLICIES:
+        return POLICIES[name]
+    module_name, _, function_name = name.partition(":")
+    if not function_name:
+        raise ValueError(f"Unknown policy '{name}'. Use one of {sorted(POLICIES)} or 'module:function'.")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def run_campaign(seed, policy_name="greedy", max_turns=500):
+    """Play one campaign from a new game until it ends or max_turns is reached.
+
+    Args:
+        seed (int): Seed for the game's random events and the policy
+        policy_name (str): Built-in policy name or 'module:function'
+        max_turns (int): Turn limit before the campaign is abandoned
+
+    Returns:
+        dict: Outcome of the campaign
+    """
+    from multiverse_tycoon import MultiVerseTycoon
+
+    policy_rng = random.Random(seed ^ 0x5EED)
+    policy = resolve_policy(policy_name)
+
+    game = MultiVerseTycoon(seed=seed)
+    engine = game.turn_engine
+    player = game.player
+    engine.start_new_game(player, f"sim-{seed}")
+
+    while player["turn"] < max_turns:
+        universe_id = player["current_universe"]
+        policy(engine, player, policy_rng)
+        engine.advance_turn(player)
+        if engine.check_game_over(player, universe_id) or player.get("victory_achieved"):
+            break
+
+    if player.get("victory_achieved"):
+        outcome = "victory"
+    elif player["game_over"]:
+        outcome = player["end_reason"]
+    else:
+        outcome = "turn limit reached"
+
+    return {
+        "seed": seed,
+        "turns": player["turn"],
+        "victory_turn": player.get("victory_turn"),
+        "outcome": outcome,
+        "quantum_wealth": game.currency_exchange.calculate_total_quantum_wealth(player),
+        "player_level": player["player_level"],
+    }
+
+
+def describe(values):
+    """Summarize a list of numbers as count, mean and percentiles."""
+    if not values:
+        return {"count": 0}
+    values = sorted(values)
+
+    def percentile(p):
+        return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+    return {
+        "count": len(values),
+        "min": values[0],
+        "p10": percentile(10),
+        "median": round(statistics.median(values), 2),
+        "mean": round(statistics.fmean(values), 2),
+        "p90": percentile(90),
+        "max": values[-1],
+    }
+
+
+def histogram(values, buckets=10):
+    """Bucket values into equal-width bins for a quick text plot."""
+    if not values:
+        return []
+    low, high = min(values), max(values)
+    width = (high - low) / buckets or 1
+    counts = [0] * buckets
+    for value in values:
+        counts[min(buckets - 1, int((value - low) / width))] += 1
+    return [
+        {"from": round(low + i * width, 2), "to": round(low + (i + 1) * width, 2), "count": count}
+        for i, count in enumerate(counts)
+    ]
+
+
+def summarize(results):
+    """Aggregate campaign outcomes into the balancing report."""
+    victory_turns = [r["victory_turn"] for r in results if r["victory_turn"] is not None]
+    wealth = [r["quantum_wealth"] for r in results]
+    return {
+        "campaigns": len(results),
+        "victories": len(victory_turns),
+        "turns_to_victory": describe(victory_turns),
+        "campaign_length": describe([r["turns"] for r in results]),
+        "outcomes": dict(Counter(r["outcome"] for r in results).most_common()),
+        "final_quantum_wealth": describe(wealth),
+        "quantum_wealth_histogram": histogram(wealth),
+    }
+
+
+def simulate(campaigns, policy="greedy", seed=0, max_turns=500, workers=None):
+    """Play campaigns in parallel and return the aggregated report.
+
+    Args:
+        campaigns (int): Number of campaigns to play
+        policy (str): Built-in policy name or 'module:function'
+        seed (int): Base seed; campaign i uses seed + i
+        max_turns (int): Turn limit per campaign
+        workers (int, optional): Worker processes (defaults to all cores)
+
+    Returns:
+        dict: Report produced by summarize()
+    """
+    # Fail fast on a bad policy instead of once per worker
+    resolve_policy(policy)
+
+    seeds = range(seed, seed + campaigns)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(
+            run_campaign, seeds, [policy] * campaigns, [max_turns] * campaigns,
+            chunksize=max(1, campaigns // ((workers or os.cpu_count() or 1) * 4))))
+    return summarize(results)
+
+
+def print_report(report):
+    """Print the report in a readable form."""
+    print("=" * 80)
+    print(f"Campaigns: {report['campaigns']}   Victories: {report['victories']}")
+    print("=" * 80)
+
+    for title, key in (("Turns to victory", "turns_to_victory"),
+                       ("Campaign length", "campaign_length"),
+                       ("Final quantum wealth (Q¢)", "final_quantum_wealth")):
+        stats = report[key]
+        if stats["count"]:
+            print(f"\n{title}: min {stats['min']}  p10 {stats['p10']}  median {stats['median']}  "
+                  f"mean {stats['mean']}  p90 {stats['p90']}  max {stats['max']}")
+        else:
+            print(f"\n{title}: no data")
+
+    print("\nOutcomes:")
+    for outcome, count in report["outcomes"].items():
+        print(f"  {count:6d}  {outcome}")
+
+    if report["quantum_wealth_histogram"]:
+        print("\nQuantum wealth distribution:")
+        peak = max(bucket["count"] for bucket in report["quantum_wealth_histogram"])
+        for bucket in report["quantum_wealth_histogram"]:
+            bar = "#" * int(bucket["count"] / peak * 40) if peak else ""
+            print(f"  {bucket['from']:>12} - {bucket['to']:<12} {bucket['count']:6d} {bar}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate Multiverse Tycoon campaigns in parallel.")
+    parser.add_argument("-n", "--campaigns", type=int, default=100, help="number of campaigns to play")
+    parser.add_argument("--policy", default="greedy",
+                        help=f"action policy: {', '.join(sorted(POLICIES))} or module:function")
+    parser.add_argument("--seed", type=int, default=0, help="base seed, campaign i uses seed + i")
+    parser.add_argument("--max-turns", type=int, default=500, help="turn limit per campaign")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    report = simulate(args.campaigns, args.policy, args.seed, args.max_turns, args.workers)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
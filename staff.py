@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Compact employee storage.
+
+A universe's staff is stored per employee type as a head count plus a loyalty
+histogram, instead of one dict per employee:
+
+    {"tech_expert": {"count": 3, "loyalty": {"100": 2, "60": 1}}}
+
+Histogram keys are strings so the structure survives a JSON round trip
+unchanged. Salaries, bonuses and loyalty changes cost O(employee types) and
+O(distinct loyalty values) rather than O(employees).
+"""
+
+STARTING_LOYALTY = 100
+MAX_LOYALTY = 100
+
+
+def employee_count(staff):
+    """Total number of employees in a universe's staff."""
+    return sum(group["count"] for group in staff.values())
+
+
+def type_counts(staff):
+    """Iterate over (employee type ID, count) for every type on the staff."""
+    for emp_id, group in staff.items():
+        yield emp_id, group["count"]
+
+
+def loyalty_groups(staff):
+    """List (employee type ID, loyalty, count) for every group of identical employees.
+
+    Groups are ordered by type as hired, highest loyalty first.
+    """
+    groups = []
+    for emp_id, group in staff.items():
+        for loyalty in sorted(group["loyalty"], key=int, reverse=True):
+            groups.append((emp_id, int(loyalty), group["loyalty"][loyalty]))
+    return groups
+
+
+def hire(staff, emp_id, loyalty=STARTING_LOYALTY, count=1):
+    """Add employees of a type with the given loyalty."""
+    group = staff.setdefault(emp_id, {"count": 0, "loyalty": {}})
+    group["count"] += count
+    key = str(loyalty)
+    group["loyalty"][key] = group["loyalty"].get(key, 0) + count
+
+
+def fire(staff, emp_id, loyalty):
+    """Remove one employee of a type with the given loyalty.
+
+    Returns:
+        bool: False if there is no such employee
+    """
+    group = staff.get(emp_id)
+    key = str(loyalty)
+    if not group or not group["loyalty"].get(key):
+        return False
+
+    group["count"] -= 1
+    group["loyalty"][key] -= 1
+    if not group["loyalty"][key]:
+        del group["loyalty"][key]
+    if not group["count"]:
+        del staff[emp_id]
+    return True
+
+
+def change_loyalty(staff, amount):
+    """Shift every employee's loyalty, capped at MAX_LOYALTY.
+
+    Employees whose loyalty drops to zero or below quit.
+
+    Returns:
+        int: Number of employees who quit
+    """
+    quit_count = 0
+    for emp_id in list(staff):
+        group = staff[emp_id]
+        histogram = {}
+        for loyalty, count in group["loyalty"].items():
+            new_loyalty = min(MAX_LOYALTY, int(loyalty) + amount)
+            if new_loyalty <= 0:
+                quit_count += count
+                continue
+            key = str(new_loyalty)
+            histogram[key] = histogram.get(key, 0) + count
+
+        group["loyalty"] = histogram
+        group["count"] = sum(histogram.values())
+        if not group["count"]:
+            del staff[emp_id]
+    return quit_count
+
+
+def from_employee_list(employees):
+    """Convert the old list-of-dicts employee format into compact staff."""
+    staff = {}
+    for employee in employees:
+        hire(staff, employee["type"], employee["loyalty"])
+    return staff
+
+
+def upgrade_player_staff(player):
+    """Convert every universe of a player state saved with the old employee lists."""
+    for universe_data in player["universes"].values():
+        if isinstance(universe_data.get("employees"), list):
+            universe_data["employees"] = from_employee_list(universe_data["employees"])
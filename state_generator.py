@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Synthetic late-game player states for benchmarks and soak tests.
+
+generate_game() builds a headless game whose player state looks like a long
+campaign: many unlocked universes, hundreds of businesses, thousands of
+employees, long heist and mini game histories, completed research, and
+quest and achievement progress in the game's subsystems. The same seed and
+size always give the same state.
+
+When a size asks for more universes or businesses than the game content
+defines, the catalog is extended with numbered copies of the existing ones
+(the way content mods add entries), and the game is built against that
+catalog.
+
+Usage:
+    from state_generator import generate_game
+    game = generate_game(seed=7, size="huge", employees=20000)
+    game.turn_engine.advance_turn(game.player)
+"""
+
+import random
+
+from content import freeze, load_content, validate_universes
+import staff
+
+# Named sizes; any field can be overridden when generating
+SIZES = {
+    "small": {
+        "turns": 10, "universes": 1, "businesses": 2, "employees": 4, "history": 3,
+        "research": 0.0, "quests": 0.1, "achievements": 0.1,
+    },
+    "mid": {
+        "turns": 150, "universes": 4, "businesses": 40, "employees": 300, "history": 100,
+        "research": 0.4, "quests": 0.5, "achievements": 0.4,
+    },
+    "huge": {
+        "turns": 500, "universes": 12, "businesses": 400, "employees": 5000, "history": 2000,
+        "research": 1.0, "quests": 0.8, "achievements": 0.8,
+    },
+}
+
+
+def resolve_size(size="huge", **overrides):
+    """The generation parameters for a named size with overrides applied.
+
+    Args:
+        size (str): One of SIZES
+        **overrides: Parameters replacing the size's defaults:
+            turns (int): Turn the campaign has reached
+            universes (int): Number of unlocked universes
+            businesses (int): Businesses owned, spread over the unlocked universes
+            employees (int): Employees, spread over the unlocked universes
+            history (int): Length of the heist and mini game histories
+            research (float): Fraction of technologies completed
+            quests (float): Fraction of quests completed
+            achievements (float): Fraction of achievements unlocked
+
+    Raises:
+        ValueError: For an unknown size or parameter
+    """
+    if size not in SIZES:
+        raise ValueError(f"Unknown state size '{size}'. Use one of {', '.join(SIZES)}.")
+    params = dict(SIZES[size])
+    for name, value in overrides.items():
+        if name not in params:
+            raise ValueError(f"Unknown state parameter '{name}'")
+        params[name] = value
+    if params["universes"] < 1:
+        raise ValueError("A state needs at least one universe")
+    return params
+
+
+def synthetic_universes(universe_count, business_count):
+    """A universe catalog with at least universe_count universes and room for business_count businesses.
+
+    Returns:
+        dict: The game's universes, extended with numbered copies of existing
+            universes and businesses where needed (plain, modifiable dicts)
+    """
+    universes = load_content("universes")
+    base_ids = list(universes)
+
+    # Extra universes copy an existing one under a numbered ID
+    copy_number = 1
+    while len(universes) < universe_count:
+        for base_id in base_ids:
+            if len(universes) == universe_count:
+                break
+            base = universes[base_id]
+            universes[f"{base_id}_{copy_number}"] = dict(
+                base, name=f"{base['name']} {copy_number + 1}",
+                level_required=base["level_required"] + copy_number)
+        copy_number += 1
+
+    # Extra businesses copy the universe's own, with rising cost and income
+    unlocked = list(universes)[:universe_count]
+    per_universe = -(-business_count // universe_count)
+    for universe_id in unlocked:
+        businesses = dict(universes[universe_id]["businesses"])
+        base_businesses = list(businesses.items())
+        copy_number = 1
+        while len(businesses) < per_universe:
+            for business_id, business in base_businesses:
+                if len(businesses) == per_universe:
+                    break
+                scale = 1 + copy_number / 10
+                businesses[f"{business_id}_{copy_number}"] = dict(
+                    business, name=f"{business['name']} #{copy_number + 1}",
+                    cost=int(business["cost"] * scale),
+                    income_per_turn=int(business["income_per_turn"] * scale))
+            copy_number += 1
+        universes[universe_id] = dict(universes[universe_id], businesses=businesses)
+
+    validate_universes(universes)
+    return universes
+
+
+def _spread(total, buckets):
+    """Split total into buckets near-equal parts."""
+    share, extra = divmod(total, buckets)
+    return [share + (1 if i < extra else 0) for i in range(buckets)]
+
+
+def populate_player(game, rng, params):
+    """Fill a new game's player state to the given size.
+
+    The game's catalog must already hold enough universes and businesses.
+    """
+    player = game.player
+    engine = game.turn_engine
+    universe_ids = list(game.universes)[:params["universes"]]
+    universe_names = [game.universes[universe_id]["name"] for universe_id in universe_ids]
+    turn = params["turns"]
+
+    player["turn"] = turn
+    player["player_level"] = max(1, turn // 25)
+    player["experience"] = rng.randrange(player["player_level"] * 1000)
+    player["quantum_credits"] = rng.randrange(turn * 500 + 1)
+    player["unlocked_universes"] = list(universe_ids)
+    player["current_universe"] = universe_ids[0]
+    player["last_event_turn"] = max(0, turn - rng.randrange(1, 4))
+    player["heist_cooldown"] = rng.randrange(3)
+    player["mini_game_cooldown"] = rng.randrange(3)
+    for feature, unlock_turn in engine.TURN_FEATURE_UNLOCKS:
+        player["unlocked_features"][feature] = turn >= unlock_turn
+    player["unlocked_features"]["specialists"] = player["unlocked_features"]["heist_operations"]
+    player["unlocked_features"]["special_items"] = player["unlocked_features"]["heist_operations"]
+
+    # Businesses and staff, spread over the unlocked universes
+    employee_types = list(game.employee_types)
+    for universe_id, businesses, employees in zip(
+            universe_ids, _spread(params["businesses"], len(universe_ids)),
+            _spread(params["employees"], len(universe_ids))):
+        universe = game.universes[universe_id]
+        universe_data = player["universes"].setdefault(universe_id, engine.new_universe_state())
+        universe_data["businesses"] = list(universe["businesses"])[:businesses]
+        universe_data["cash"] = rng.randrange(10000, 10000 + turn * 2000)
+        universe_data["danger"] = rng.randrange(0, 60)
+        universe_data["reputation"] = rng.randrange(-20, turn + 1)
+        for count, emp_id in zip(_spread(employees, len(employee_types)), employee_types):
+            for loyalty, loyal_count in zip((100, 80, 60, 40), _spread(count, 4)):
+                if loyal_count:
+                    staff.hire(universe_data["employees"], emp_id, loyalty, loyal_count)
+        player["event_history"][universe_id] = [
+            event["name"] for event in rng.sample(list(universe["events"]), min(3, len(universe["events"])))]
+
+    # Heist crew, equipment and history
+    heists = game.heist_system
+    player["heist_specialists"] = list(heists.specialists)
+    player["special_items"] = list(heists.special_items)
+    difficulty_names = [level["name"] for level in heists.difficulty_levels.values()]
+    heist_names = [heist["name"] for heist_types in heists.heist_types.values() for heist in heist_types]
+    for i in range(params["history"]):
+        success = rng.random() < 0.6
+        player["heist_history"].append({
+            "name": rng.choice(heist_names), "universe": rng.choice(universe_names),
+            "difficulty": rng.choice(difficulty_names), "success": success,
+            "reward_local": rng.randrange(1000, 50000) if success else 0,
+            "reward_quantum": rng.randrange(10, 500) if success else 0,
+            "turn": i * turn // max(1, params["history"]),
+        })
+
+    # Mini game history
+    mini_games = game.mini_game_system.mini_games
+    for i in range(params["history"]):
+        game_id = rng.choice(list(mini_games))
+        success = rng.random() < 0.5
+        player["mini_game_history"].append({
+            "game_id": game_id, "game_name": mini_games[game_id]["name"],
+            "difficulty": rng.choice(("easy", "medium", "hard")), "success": success,
+            "turn": i * turn // max(1, params["history"]), "universe": rng.choice(universe_names),
+        })
+    player["mini_games_played"] = params["history"]
+    player["mini_games_won"] = sum(entry["success"] for entry in player["mini_game_history"])
+
+    # Completed research, in prerequisite order, plus one project in progress
+    research = game.research_system
+    completed = player["completed_research"]
+    pending = list(research.tech_index)
+    target = round(params["research"] * len(pending))
+    while len(completed) < target:
+        ready = [tech_id for tech_id in pending
+                 if all(prereq in completed for prereq in research.tech_index[tech_id][1]["prerequisites"])]
+        tech_id = rng.choice(ready)
+        pending.remove(tech_id)
+        completed.append(tech_id)
+    if pending:
+        tech_id = rng.choice(pending)
+        category, tech = research.tech_index[tech_id]
+        player["current_research"][tech_id] = {
+            "name": tech["name"], "category": category,
+            "turns_remaining": rng.randrange(1, tech["research_turns"] + 1),
+            "total_turns": tech["research_turns"],
+        }
+
+    engine.aggregates.rebuild(player)
+    return player
+
+
+def populate_progress(game, rng, params):
+    """Complete and activate quests and unlock achievements to match the player state."""
+    player = game.player
+
+    # Complete quests in prerequisite order, then start whatever became available
+    quests = game.quest_system
+    target = round(params["quests"] * len(quests.quests))
+    while len(quests.completed_quests) < target:
+        ready = quests.get_available_quests(player) + [
+            quests.quests[quest_id] for quest_id in quests.active_quests]
+        if not ready:
+            break
+        quest = rng.choice(ready)
+        for objective in quest.objectives:
+            objective["current"] = objective["target"]
+            objective["completed"] = True
+        quest.completed = True
+        quest.active = False
+        if quest.id in quests.active_quests:
+            quests.active_quests.remove(quest.id)
+        quests.completed_quests.append(quest.id)
+    for quest in quests.get_available_quests(player):
+        quests.activate_quest(quest.id)
+        objective = quest.objectives[0]
+        objective["current"] = rng.randrange(max(1, int(objective["target"])))
+
+    # Achievement statistics and unlocked achievements (rewards are part of the cash already)
+    achievements = game.achievement_system
+    empire = game.turn_engine.empire(player)
+    achievements.stats.update({
+        "risk_reductions": params["turns"] // 10,
+        "heists_completed": sum(entry["success"] for entry in player["heist_history"]),
+        "minigames_won": player["mini_games_won"],
+        "businesses_started": empire.total_businesses,
+        "total_businesses": empire.total_businesses,
+        "universe_visited": {universe_id: True for universe_id in player["unlocked_universes"]},
+        "different_universes_visited": len(player["unlocked_universes"]),
+        "events_experienced": params["turns"] // 3,
+    })
+    achievement_ids = list(achievements.achievements)
+    for achievement_id in rng.sample(achievement_ids, round(params["achievements"] * len(achievement_ids))):
+        achievement = achievements.achievements[achievement_id]
+        achievement.unlocked = True
+        achievement.unlock_time = rng.randrange(1, params["turns"] + 1)
+        achievements.unlocked_achievements.append(achievement_id)
+
+
+def generate_game(seed=0, size="huge", **overrides):
+    """A headless game whose player state is a synthetic campaign.
+
+    Args:
+        seed (int): Seed for every random choice; the same seed and size
+            always give the same state
+        size (str): "small", "mid" or "huge"
+        **overrides: Size parameters to change (see resolve_size)
+
+    Returns:
+        MultiVerseTycoon: Game with the generated player state and matching
+            quest, achievement and research progress
+    """
+    from multiverse_tycoon import MultiVerseTycoon
+
+    params = resolve_size(size, **overrides)
+    rng = random.Random(seed)
+
+    game = MultiVerseTycoon(pacing="instant", seed=seed)
+    catalog_businesses = sum(len(universe["businesses"])
+                             for universe in list(game.universes.values())[:params["universes"]])
+    if params["universes"] > len(game.universes) or params["businesses"] > catalog_businesses:
+        game.universes = freeze(synthetic_universes(params["universes"], params["businesses"]))
+
+    game.turn_engine.start_new_game(game.player, f"synthetic-{seed}")
+    populate_player(game, rng, params)
+    populate_progress(game, rng, params)
+    return game
+
+
+def generate_state(seed=0, size="huge", **overrides):
+    """Just the player state of generate_game()."""
+    return generate_game(seed, size, **overrides).player
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Canonical hashes of game states.
+
+Two states that would save to the same JSON hash the same, however they were
+reached: dict keys are taken in sorted order (and as strings, like JSON
+object keys), tuples and ring buffers count as lists, and whole-number floats
+count as ints. The save-time random state is left out.
+
+Values are written in a compact, self-delimiting encoding instead of JSON.
+The heist and mini game histories only ever grow, so StateHasher keeps a
+running hash of each one and only encodes the entries appended since the
+last call; a late-game state hashes in a fraction of the time its
+histories would take to encode.
+
+The game hash covers the player state plus what lives in the subsystems
+rather than the player: achievement stats and unlocks, and quest progress.
+Research progress is part of the player state.
+"""
+
+import hashlib
+from collections import deque
+
+from save_store import APPEND_ONLY_KEYS
+
+DIGEST_SIZE = 16
+
+# Player keys not part of the game state
+IGNORED_KEYS = ("random_state",)
+
+
+def _encode(value, parts):
+    """Append the canonical encoding of a JSON-like value to parts."""
+    kind = type(value)
+    if kind is str:
+        parts.append(f"s{len(value)}:")
+        parts.append(value)
+    elif kind is int:
+        parts.append(f"i{value};")
+    elif kind is dict:
+        parts.append("{")
+        for key in sorted(value, key=str):
+            key_text = str(key)
+            parts.append(f"{len(key_text)}:")
+            parts.append(key_text)
+            _encode(value[key], parts)
+        parts.append("}")
+    elif kind is list or kind is tuple or kind is deque:
+        parts.append("[")
+        for item in value:
+            _encode(item, parts)
+        parts.append("]")
+    elif kind is float:
+        parts.append(f"i{int(value)};" if value.is_integer() else f"f{value!r};")
+    elif kind is bool:
+        parts.append("T" if value else "F")
+    elif value is None:
+        parts.append("N")
+    else:
+        raise TypeError(f"Cannot hash a value of type {kind.__name__}")
+
+
+def encode(value):
+    """The canonical encoding of a JSON-like value, as bytes."""
+    parts = []
+    _encode(value, parts)
+    return "".join(parts).encode("utf-8")
+
+
+class StateHasher:
+    """Hashes states, remembering the running hashes of append-only histories."""
+
+    def __init__(self):
+        # Player key -> (history list, copy of its hashed entries, running hash)
+        self._histories = {}
+
+    def _history_digest(self, key, history):
+        """The hash of a history list, encoding only the entries new since the last call.
+
+        A copy of the last history hashed (as bots make when exploring
+        moves) is recognised by comparing its entries, which is much cheaper
+        than encoding them again.
+        """
+        cached = self._histories.get(key)
+        if cached is not None and history is cached[0] and len(cached[1]) <= len(history):
+            _, hashed, running = cached
+        elif cached is not None and history[:len(cached[1])] == cached[1]:
+            _, hashed, running = cached
+        else:
+            hashed, running = [], hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+        if len(hashed) < len(history):
+            parts = []
+            for index in range(len(hashed), len(history)):
+                _encode(history[index], parts)
+            running = running.copy()
+            running.update("".join(parts).encode("utf-8"))
+            hashed = history[:]
+        self._histories[key] = (history, hashed, running)
+        return running.hexdigest()
+
+    def player_parts(self, player, parts):
+        """Append the canonical encoding of a player state to parts."""
+        parts.append("{")
+        for key in sorted(player):
+            if key in IGNORED_KEYS:
+                continue
+            parts.append(f"{len(key)}:")
+            parts.append(key)
+            value = player[key]
+            if key in APPEND_ONLY_KEYS and type(value) is list:
+                parts.append(f"h{self._history_digest(key, value)};")
+            else:
+                _encode(value, parts)
+        parts.append("}")
+
+    def hash_player(self, player):
+        """Hex digest of a player state alone."""
+        parts = []
+        self.player_parts(player, parts)
+        return hashlib.blake2b("".join(parts).encode("utf-8"), digest_size=DIGEST_SIZE).hexdigest()
+
+    def hash_game(self, player, achievement_system=None, quest_system=None):
+        """Hex digest of a player state and the progress kept in its subsystems.
+
+        Args:
+            player (dict): Player state
+            achievement_system (AchievementSystem, optional): Stats and unlocked achievements
+            quest_system (QuestSystem, optional): Active and completed quests
+                and the objective progress of the active ones
+        """
+        parts = []
+        self.player_parts(player, parts)
+        if achievement_system is not None:
+            achievements = achievement_system.achievements
+            _encode(achievement_system.stats, parts)
+            _encode([(achievement_id, achievements[achievement_id].unlock_time)
+                     for achievement_id in achievement_system.unlocked_achievements], parts)
+        if quest_system is not None:
+            quests = quest_system.quests
+            _encode(quest_system.completed_quests, parts)
+            _encode([(quest_id, [(objective["current"], objective["completed"])
+                                 for objective in quests[quest_id].objectives])
+                     for quest_id in quest_system.active_quests], parts)
+        return hashlib.blake2b("".join(parts).encode("utf-8"), digest_size=DIGEST_SIZE).hexdigest()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Optional wall-time instrumentation for the phases of a turn.
+
+When enabled, the turn engine marks the end of each phase of advance_turn
+and TurnTimings records how long it took with time.perf_counter_ns. Every
+phase keeps its total call count and time, plus a rolling window of the most
+recent samples with a histogram over it, so long campaigns show how the
+current cost of a phase compares with the start of the game.
+
+Disabled timing goes through NO_TIMINGS, whose methods do nothing.
+"""
+
+import json
+import time
+from bisect import bisect_left
+from collections import deque
+
+# Phases of TurnEngine.advance_turn, in the order they run
+TURN_PHASES = (
+    "income", "salaries", "risk_reduction", "random_events", "cooldowns", "xp",
+    "feature_unlocks", "achievements", "quests", "research", "summary",
+)
+
+# Samples kept per phase for percentiles and the histogram
+DEFAULT_WINDOW = 1000
+
+# Histogram bucket upper bounds in microseconds; the last bucket is open ended
+BUCKET_BOUNDS_US = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+_BUCKET_BOUNDS_NS = tuple(bound * 1000 for bound in BUCKET_BOUNDS_US)
+BUCKET_LABELS = tuple(f"<={bound}us" for bound in BUCKET_BOUNDS_US) + (f">{BUCKET_BOUNDS_US[-1]}us",)
+
+
+class PhaseStats:
+    """Call count, total time and a rolling histogram for one phase."""
+
+    __slots__ = ("calls", "total_ns", "max_ns", "samples", "buckets")
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.samples = deque(maxlen=window)
+        self.buckets = [0] * len(BUCKET_LABELS)
+
+    def add(self, elapsed_ns):
+        """Record one call that took elapsed_ns nanoseconds."""
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+        samples = self.samples
+        if len(samples) == samples.maxlen:
+            # The oldest sample leaves the window
+            self.buckets[bisect_left(_BUCKET_BOUNDS_NS, samples[0])] -= 1
+        samples.append(elapsed_ns)
+        self.buckets[bisect_left(_BUCKET_BOUNDS_NS, elapsed_ns)] += 1
+
+    def summary(self):
+        """Statistics for the phase, with times in microseconds.
+
+        Returns:
+            dict: calls, total_ms, mean_us and max_us over every call, and
+                p50_us, p90_us, p99_us and histogram over the recent window
+        """
+        recent = sorted(self.samples)
+
+        def percentile(fraction):
+            if not recent:
+                return 0.0
+            return round(recent[int(fraction * (len(recent) - 1))] / 1000, 2)
+
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total_ns / 1e6, 3),
+            "mean_us": round(self.total_ns / self.calls / 1000, 2) if self.calls else 0.0,
+            "max_us": round(self.max_ns / 1000, 2),
+            "window": len(recent),
+            "p50_us": percentile(0.5),
+            "p90_us": percentile(0.9),
+            "p99_us": percentile(0.99),
+            "histogram": {label: count for label, count in zip(BUCKET_LABELS, self.buckets) if count},
+        }
+
+
+class TurnTimings:
+    """Wall time per turn phase, recorded as laps between phase boundaries."""
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        """Initialize empty timings.
+
+        Args:
+            window (int): Recent samples kept per phase for percentiles and
+                the histogram
+        """
+        if window < 1:
+            raise ValueError("Timing window must be at least 1 sample")
+        self.window = window
+        self.phases = {}
+        self._mark = 0
+
+    def start(self):
+        """Start timing the first phase of a turn."""
+        self._mark = time.perf_counter_ns()
+
+    def lap(self, phase):
+        """End the current phase, recording the time since the previous mark."""
+        now = time.perf_counter_ns()
+        self.record(phase, now - self._mark)
+        self._mark = now
+
+    def record(self, phase, elapsed_ns):
+        """Record one call of a phase."""
+        stats = self.phases.get(phase)
+        if stats is None:
+            stats = self.phases[phase] = PhaseStats(self.window)
+        stats.add(elapsed_ns)
+
+    def report(self):
+        """Statistics per phase, in turn order, for the phases that ran."""
+        ordered = [phase for phase in TURN_PHASES if phase in self.phases]
+        ordered += sorted(phase for phase in self.phases if phase not in TURN_PHASES)
+        return {phase: self.phases[phase].summary() for phase in ordered}
+
+    def format_report(self):
+        """The report as a text table."""
+        report = self.report()
+        if not report:
+            return "No turns have been timed yet."
+
+        lines = [f"{'Phase':<16}{'Calls':>8}{'Total ms':>11}{'Mean us':>10}"
+                 f"{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}{'Max us':>10}"]
+        for phase, stats in report.items():
+            lines.append(f"{phase:<16}{stats['calls']:>8}{stats['total_ms']:>11.2f}"
+                         f"{stats['mean_us']:>10.1f}{stats['p50_us']:>10.1f}"
+                         f"{stats['p90_us']:>10.1f}{stats['p99_us']:>10.1f}{stats['max_us']:>10.1f}")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """Write the report to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"window": self.window, "phases": self.report()}, f, indent=2)
+
+
+class _NoTimings:
+    """Stand-in used while timing is off."""
+
+    def start(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+
+NO_TIMINGS = _NoTimings()
@@ -0,0 +1,850 @@
+#!/usr/bin/env python3
+
+import random
+from collections import deque
+from itertools import islice
+
+from achievements import BUSINESS_STATS, CASH_STATS, DANGER_STATS, EMPLOYEE_STATS, UNIVERSE_STATS
+from aggregates import EmpireAggregates
+from sampling import EventPool
+from state_hash import StateHasher
+import staff
+from timings import NO_TIMINGS
+
+
+class TurnResult:
+    def __init__(self, turn, universe_id):
+        """Initialize the outcome of a single turn.
+
+        Args:
+            turn (int): Turn number reached by the advance
+            universe_id (str): Universe the turn was played in
+        """
+        self.turn = turn
+        self.universe_id = universe_id
+        self.income = 0  # Local currency earned from businesses
+        self.salaries = 0  # Salaries owed this turn
+        self.salaries_paid = True  # False if the player couldn't cover salaries
+        self.employees_lost = 0  # Employees who quit over unpaid salaries
+        self.risk_reduction = 0  # Detection risk removed by employees and research
+        self.event = None  # Random event that fired, if any
+        self.heist_ready = False  # Heist cooldown expired this turn
+        self.mini_game_ready = False  # Mini game cooldown expired this turn
+        self.xp_gained = 0
+        self.unlocked_features = []  # Feature IDs unlocked this turn, in unlock order
+        self.level_up = None  # Level up details, if the player levelled up
+        self.achievements = []  # Newly unlocked Achievement objects
+        self.completed_quests = []  # IDs of quests completed this turn
+        self.completed_research = {}  # Technologies finished this turn
+        self.research_effects = {}  # Research effects active after the turn
+        self.game_over = False
+        self.end_reason = ""
+
+
+class ActionResult:
+    def __init__(self, success, message=""):
+        """Initialize the outcome of a player action.
+
+        Args:
+            success (bool): Whether the action was carried out
+            message (str): Player-facing description of the outcome
+        """
+        self.success = success
+        self.message = message
+        self.details = {}  # Action specific values for display (costs, changes)
+        self.achievements = []  # Newly unlocked Achievement objects
+        self.completed_quests = []  # IDs of quests completed by the action
+
+
+class TurnEngine:
+    """Run the turn logic on a player state dict without any terminal I/O.
+
+    The engine mutates the player dict exactly like the interactive game does,
+    but reports what happened through a TurnResult instead of printing, so the
+    same rules can drive the menus, bots and balancing simulations.
+    """
+
+    # Features unlocked purely by turn count, in the order they are announced
+    TURN_FEATURE_UNLOCKS = [
+        ("universe_travel", 10),
+        ("currency_exchange", 15),
+        ("mini_games", 5),
+        ("research", 8),
+        ("heist_operations", 20),
+    ]
+
+    EVENT_COOLDOWN = 2  # Minimum turns between random events
+    EVENT_PROBABILITY = 0.45  # Base probability of a random event
+    EVENT_HISTORY_LENGTH = 10  # Event names remembered per universe
+    RECENT_EVENTS = 3  # Most recent events skipped when picking the next one
+
+    # Detection risk countermeasures: (name, cost, risk reduction, flavour text)
+    COUNTERMEASURES = [
+        ("Basic Countermeasures", 1000, 5, "You implemented basic security measures."),
+        ("Advanced Protocols", 3000, 15, "You deployed advanced security protocols."),
+        ("Elite Security System", 7000, 35, "You installed an elite security system."),
+    ]
+
+    def __init__(self, universes, employee_types, research_system, achievement_system,
+                 quest_system, currency_exchange=None, starting_cash=10000,
+                 detection_risk_threshold=100, timings=None, rng=None, heist_system=None,
+                 mini_game_system=None):
+        """Initialize the turn engine with the game content and subsystems.
+
+        timings, a timings.TurnTimings, records how long each phase of
+        advance_turn takes; phases are not timed without it. rng (a
+        random.Random) rolls the random events; without one the random
+        module is used. heist_system and mini_game_system are only needed for
+        the heist and mini game actions.
+        """
+        self.universes = universes
+        self.employee_types = employee_types
+        self.research_system = research_system
+        self.achievement_system = achievement_system
+        self.quest_system = quest_system
+        self.currency_exchange = currency_exchange
+        self.heist_system = heist_system
+        self.mini_game_system = mini_game_system
+        self.starting_cash = starting_cash
+        self.DETECTION_RISK_THRESHOLD = detection_risk_threshold
+
+        self.timings = timings if timings is not None else NO_TIMINGS
+        self.rng = rng if rng is not None else random
+
+        # Running totals for the player state this engine is driving
+        self.aggregates = EmpireAggregates()
+
+        # Universe ID -> EventPool, built on the first event in each universe
+        self.event_pools = {}
+
+        # Canonical state hashes, reusing the hashes of unchanged histories
+        self.state_hasher = StateHasher()
+
+    def empire(self, player):
+        """Get the running totals for a player state, rebuilding them for a new state."""
+        if self.aggregates.player is not player:
+            # Saves from older versions keep employees as a list of dicts
+            staff.upgrade_player_staff(player)
+            self.aggregates.rebuild(player)
+            self.achievement_system.mark_changed(*UNIVERSE_STATS)
+        return self.aggregates
+
+    def add_cash(self, player, universe_id, amount):
+        """Add (or, if negative, remove) local cash in a universe, keeping totals current."""
+        # Totals for a new player state are built before the change, so it isn't counted twice
+        empire = self.empire(player)
+        player["universes"][universe_id]["cash"] += amount
+        empire.cash_changed(amount)
+        self.achievement_system.mark_changed(*CASH_STATS)
+
+    def check_achievements(self, player):
+        """Check achievements, accounting for any cash rewards they pay out."""
+        aggregates = self.empire(player)
+        universe_data = player["universes"][player["current_universe"]]
+        cash_before = universe_data["cash"]
+        achievements = self.achievement_system.check_achievements(player, aggregates)
+        aggregates.cash_changed(universe_data["cash"] - cash_before)
+        return achievements
+
+    def new_universe_state(self):
+        """Create the per-universe player state for a freshly unlocked universe."""
+        return {
+            "cash": self.starting_cash,
+            "danger": 0,  # This is now detection_risk but keeping variable name for compatibility
+            "reputation": 0,
+            "businesses": [],
+            "employees": {}  # Employee type -> head count and loyalty histogram (see staff.py)
+        }
+
+    def start_new_game(self, player, player_name):
+        """Prepare a player state for a new campaign."""
+        player["name"] = player_name
+
+        # Initialize player state for each universe
+        for universe_id in self.universes:
+            player["universes"][universe_id] = self.new_universe_state()
+
+        # Start in the Blade Runner universe
+        player["current_universe"] = "blade_runner"
+        self.aggregates.rebuild(player)
+        self.achievement_system.mark_changed(*UNIVERSE_STATS)
+
+    def calculate_business_income(self, player):
+        """Calculate and apply income from all businesses in the current universe."""
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+        player_universe_data = player["universes"][universe_id]
+
+        total_income = 0
+
+        # Calculate base income from businesses
+        for business_id in player_universe_data["businesses"]:
+            business = universe["businesses"][business_id]
+            total_income += business["income_per_turn"]
+
+        # Apply employee efficiency bonuses
+        employee_bonus = 0
+        for emp_id, count in staff.type_counts(player_universe_data["employees"]):
+            employee_bonus += total_income * self.employee_types[emp_id]["efficiency_bonus"] * count
+
+        total_income += employee_bonus
+
+        # Apply research effects
+        research_effects = self.research_system.apply_research_effects(player, universe_id)
+        if research_effects["business_income_multiplier"] > 1.0:
+            research_bonus = total_income * (research_effects["business_income_multiplier"] - 1.0)
+            total_income += research_bonus
+
+        # Generate quantum income from research
+        if research_effects["quantum_income"] > 0:
+            player["quantum_credits"] += research_effects["quantum_income"]
+
+        # Apply income
+        self.add_cash(player, universe_id, int(total_income))
+
+        return int(total_income)
+
+    def pay_employee_salaries(self, player):
+        """Pay salaries to all employees in the current universe."""
+        universe_id = player["current_universe"]
+        player_universe_data = player["universes"][universe_id]
+
+        total_salaries = 0
+
+        # Calculate total salaries
+        for emp_id, count in staff.type_counts(player_universe_data["employees"]):
+            total_salaries += self.employee_types[emp_id]["salary_per_turn"] * count
+
+        # Pay salaries if you have enough cash
+        if player_universe_data["cash"] >= total_salaries:
+            self.add_cash(player, universe_id, -total_salaries)
+
+            # Increase loyalty for being paid
+            staff.change_loyalty(player_universe_data["employees"], 5)
+        else:
+            # Couldn't pay salaries; employees with zero loyalty quit
+            empire = self.empire(player)
+            quit_count = staff.change_loyalty(player_universe_data["employees"], -20)
+            if quit_count:
+                empire.employees_changed(-quit_count)
+                self.achievement_system.mark_changed(*EMPLOYEE_STATS)
+
+        return total_salaries
+
+    def apply_detection_risk_reductions(self, player):
+        """Apply detection risk reductions from employees and research."""
+        universe_id = player["current_universe"]
+        player_universe_data = player["universes"][universe_id]
+
+        total_reduction = 0
+
+        # Calculate total detection risk reduction
+        for emp_id, count in staff.type_counts(player_universe_data["employees"]):
+            total_reduction += self.employee_types[emp_id]["risk_reduction"] * count
+
+        # Apply research effects for detection risk reduction
+        research_effects = self.research_system.apply_research_effects(player, universe_id)
+        if research_effects["detection_risk_reduction"] > 0:
+            total_reduction += research_effects["detection_risk_reduction"]
+
+        # Apply reduction
+        if total_reduction > 0:
+            player_universe_data["danger"] = max(
+                0, player_universe_data["danger"] - total_reduction)
+            self.achievement_system.mark_changed(*DANGER_STATS)
+
+        return total_reduction
+
+    def maybe_trigger_random_event(self, player):
+        """Decide whether a random event fires this turn.
+
+        Returns:
+            dict: The event that was applied, or None
+        """
+        universe_id = player["current_universe"]
+        current_turn = player["turn"]
+
+        # Check if enough turns have passed since last event
+        turns_since_last_event = current_turn - player["last_event_turn"]
+        if turns_since_last_event < self.EVENT_COOLDOWN:
+            return None
+
+        # Increase probability based on detection risk (up to +20%)
+        detection_risk = player["universes"][universe_id]["danger"]
+        adjusted_probability = self.EVENT_PROBABILITY + (detection_risk / 500)
+
+        # Roll the dice - if random value is less than probability, trigger event
+        if self.rng.random() < adjusted_probability:
+            event = self.trigger_random_event(player)
+            player["last_event_turn"] = current_turn
+            return event
+        return None
+
+    def event_history(self, player, universe_id):
+        """The ring buffer of recent event names for a universe.
+
+        Saves hold the history as a plain list; it becomes a bounded deque
+        the first time it is used.
+        """
+        history = player["event_history"].get(universe_id)
+        if not isinstance(history, deque):
+            history = player["event_history"][universe_id] = deque(
+                history or (), maxlen=self.EVENT_HISTORY_LENGTH)
+        return history
+
+    def event_pool(self, universe_id):
+        """The weighted event pool for a universe."""
+        pool = self.event_pools.get(universe_id)
+        if pool is None:
+            pool = self.event_pools[universe_id] = EventPool(self.universes[universe_id]["events"])
+        return pool
+
+    def trigger_random_event(self, player):
+        """Pick a random event from the current universe's pool and apply it."""
+        universe_id = player["current_universe"]
+        player_universe_data = player["universes"][universe_id]
+
+        # Pick by weight, avoiding the last few events where possible
+        history = self.event_history(player, universe_id)
+        recent_events = tuple(islice(reversed(history), self.RECENT_EVENTS))
+        event = self.event_pool(universe_id).sample(self.rng, recent_events)
+
+        # Record this event; the oldest falls out of the history
+        history.append(event["name"])
+
+        # Apply the event effects
+        self.add_cash(player, universe_id, event["effect"]["cash"])
+        player_universe_data["danger"] += event["effect"]["danger"]  # danger is detection_risk
+        player_universe_data["reputation"] += event["effect"]["reputation"]
+
+        # Ensure detection risk doesn't go below 0
+        player_universe_data["danger"] = max(0, player_universe_data["danger"])
+        self.achievement_system.mark_changed(*DANGER_STATS)
+
+        return event
+
+    def check_feature_unlocks(self, player):
+        """Unlock features earned through game progress.
+
+        Returns:
+            list: Feature IDs unlocked by this call, in announcement order
+        """
+        unlocked = []
+        features = player["unlocked_features"]
+
+        for feature, turn_required in self.TURN_FEATURE_UNLOCKS:
+            if player["turn"] >= turn_required and not features[feature]:
+                features[feature] = True
+                unlocked.append(feature)
+
+        # Unlock specialists after completing 2 heists
+        if len(player["heist_history"]) >= 2 and not features["specialists"]:
+            features["specialists"] = True
+            unlocked.append("specialists")
+
+        # Unlock special items after recruiting 2 specialists
+        if len(player["heist_specialists"]) >= 2 and not features["special_items"]:
+            features["special_items"] = True
+            unlocked.append("special_items")
+
+        return unlocked
+
+    def check_level_up(self, player):
+        """Level the player up and unlock universes if they have enough XP.
+
+        Returns:
+            dict: Level up details (level, new_universes, bonus_quantum, victory), or None
+        """
+        # Calculate XP threshold for next level (increases with each level)
+        xp_threshold = player["player_level"] * 1000
+
+        # Check if player has enough XP to level up
+        if player["experience"] < xp_threshold:
+            return None
+
+        player["player_level"] += 1
+        player["experience"] -= xp_threshold  # Reset XP counter (keeping extra XP)
+
+        # Get research effects
+        research_effects = self.research_system.apply_research_effects(player, player["current_universe"])
+        universe_level_reduction = research_effects["universe_level_reduction"]
+        ignore_requirements = research_effects["ignore_universe_requirements"]
+
+        # Check for newly unlocked universes
+        newly_unlocked = []
+        for universe_id, universe in self.universes.items():
+            # Apply research effects to level requirements
+            effective_level_required = universe["level_required"] - universe_level_reduction
+
+            if ((universe["level_required"] <= player["player_level"] or
+                 effective_level_required <= player["player_level"] or
+                 ignore_requirements) and
+                    universe_id not in player["unlocked_universes"]):
+                # Unlock this universe
+                player["unlocked_universes"].append(universe_id)
+
+                # Initialize player state for this universe
+                if universe_id not in player["universes"]:
+                    empire = self.empire(player)
+                    player["universes"][universe_id] = self.new_universe_state()
+                    empire.universe_added(player["universes"][universe_id])
+                    self.achievement_system.mark_changed(*UNIVERSE_STATS)
+
+                newly_unlocked.append(universe_id)
+
+        # Extra rewards for leveling up
+        bonus_quantum = player["player_level"] * 50
+        player["quantum_credits"] += bonus_quantum
+
+        # Check for victory condition at level 10
+        victory = player["player_level"] >= 10 and self.check_victory_condition(player)
+
+        return {
+            "level": player["player_level"],
+            "new_universes": newly_unlocked,
+            "bonus_quantum": bonus_quantum,
+            "victory": victory
+        }
+
+    def check_victory_condition(self, player):
+        """Check if player meets all requirements for the victory ending."""
+        aggregates = self.empire(player)
+        total_quantum = player["quantum_credits"]
+        total_businesses_all = aggregates.total_businesses
+        universes_with_businesses = aggregates.universes_with_businesses
+
+        # Victory is only triggered if player has established substantial presence across most universes
+        # and accumulated significant quantum credits
+        if total_quantum >= 5000 and total_businesses_all >= 20 and universes_with_businesses >= len(self.universes) - 1:
+            # Record victory in player state for future reference
+            if "victory_achieved" not in player:
+                player["victory_achieved"] = True
+                player["victory_turn"] = player["turn"]
+            return True
+        return False
+
+    def state_hash(self, player):
+        """Canonical hash of the player state with its achievement and quest progress.
+
+        Equal states hash equal however they were reached, including after a
+        save and load, so replays can be compared turn by turn and bots can
+        skip states they have already seen.
+        """
+        return self.state_hasher.hash_game(player, self.achievement_system, self.quest_system)
+
+    def check_game_over(self, player, universe_id=None):
+        """End the game if detection risk in a universe reached the threshold."""
+        if universe_id is None:
+            universe_id = player["current_universe"]
+        if player["universes"][universe_id]["danger"] >= self.DETECTION_RISK_THRESHOLD:
+            player["game_over"] = True
+            player["end_reason"] = f"Your detection risk reached {self.DETECTION_RISK_THRESHOLD} in the {self.universes[universe_id]['name']} universe!"
+        return player["game_over"]
+
+    def apply_quest_rewards(self, player, quest_ids, universe_id):
+        """Grant the rewards of completed quests, paying cash into the given universe."""
+        for quest_id in quest_ids:
+            quest = self.quest_system.quests[quest_id]
+            if quest.rewards["cash"] > 0:
+                self.add_cash(player, universe_id, quest.rewards["cash"])
+            if quest.rewards["quantum"] > 0:
+                player["quantum_credits"] += quest.rewards["quantum"]
+            if quest.rewards["xp"] > 0:
+                player["experience"] += quest.rewards["xp"]
+
+    def start_business(self, player, business_id):
+        """Buy a business in the current universe."""
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+        player_universe_data = player["universes"][universe_id]
+
+        if business_id not in universe["businesses"] or business_id in player_universe_data["businesses"]:
+            return ActionResult(False, "That business is not available.")
+
+        business = universe["businesses"][business_id]
+        if player_universe_data["cash"] < business["cost"]:
+            return ActionResult(False, f"Not enough cash! You need {business['cost']} {universe['currency']}.")
+
+        # Purchase the business
+        self.add_cash(player, universe_id, -business["cost"])
+        player_universe_data["businesses"].append(business_id)
+        self.empire(player).business_added(player_universe_data)
+        player_universe_data["danger"] += business["risk_increase"]  # Adding to detection risk
+        self.achievement_system.mark_changed(*BUSINESS_STATS, *DANGER_STATS)
+
+        result = ActionResult(
+            True, f"Congratulations! You now own a {business['name']} in the {universe['name']} universe!")
+
+        # Update achievement stats
+        self.achievement_system.update_stats("businesses_started")
+        self.achievement_system.update_stats(f"businesses_in_{universe_id}")
+        self.achievement_system.stats["total_businesses"] = self.empire(player).total_businesses
+        result.achievements = self.check_achievements(player)
+
+        # Check for quest progress - business started and specific business ownership
+        result.completed_quests = self.quest_system.check_and_update_quests(
+            player, "business_started", universe_id=universe_id)
+        result.completed_quests += self.quest_system.check_and_update_quests(
+            player, "specific_business_owned", value=business_id)
+        self.apply_quest_rewards(player, result.completed_quests, universe_id)
+
+        return result
+
+    def hire_employee(self, player, emp_id):
+        """Hire an employee of the given type in the current universe."""
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+        player_universe_data = player["universes"][universe_id]
+
+        if emp_id not in self.employee_types:
+            return ActionResult(False, "Unknown employee type.")
+
+        emp_type = self.employee_types[emp_id]
+        if player_universe_data["cash"] < emp_type["hiring_cost"]:
+            return ActionResult(False, f"Not enough cash! You need {emp_type['hiring_cost']} {universe['currency']}.")
+
+        # Hire the employee
+        self.add_cash(player, universe_id, -emp_type["hiring_cost"])
+        staff.hire(player_universe_data["employees"], emp_id)
+        self.empire(player).employees_changed(1)
+        self.achievement_system.mark_changed(*EMPLOYEE_STATS)
+
+        result = ActionResult(True, f"You've hired a {emp_type['name']} in the {universe['name']} universe!")
+
+        # Update achievement stats and quest progress
+        self.achievement_system.update_stats("employees_hired")
+        result.completed_quests = self.quest_system.check_and_update_quests(
+            player, "employee_hired", universe_id=universe_id)
+        self.apply_quest_rewards(player, result.completed_quests, universe_id)
+
+        return result
+
+    def fire_employee(self, player, emp_id, loyalty):
+        """Fire one employee of the given type and loyalty in the current universe."""
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+        player_universe_data = player["universes"][universe_id]
+
+        group = player_universe_data["employees"].get(emp_id)
+        if not group or not group["loyalty"].get(str(loyalty)):
+            return ActionResult(False, "No such employee.")
+
+        emp_type = self.employee_types[emp_id]
+
+        # Severance pay (25% of hiring cost)
+        severance_pay = int(emp_type["hiring_cost"] * 0.25)
+        if player_universe_data["cash"] < severance_pay:
+            return ActionResult(False, f"Not enough cash for severance pay! You need {severance_pay} {universe['currency']}.")
+
+        # Pay severance and fire the employee
+        self.add_cash(player, universe_id, -severance_pay)
+        staff.fire(player_universe_data["employees"], emp_id, loyalty)
+        self.empire(player).employees_changed(-1)
+        self.achievement_system.mark_changed(*EMPLOYEE_STATS)
+
+        # Reputation impact based on loyalty - better loyalty = less reputation damage
+        reputation_change = -10 + int(loyalty / 10)
+        player_universe_data["reputation"] += reputation_change
+
+        result = ActionResult(True, f"You've fired a {emp_type['name']} from the {universe['name']} universe.")
+        result.details = {"severance_pay": severance_pay, "reputation_change": reputation_change}
+        return result
+
+    def reduce_detection_risk(self, player, option):
+        """Buy one of the COUNTERMEASURES (by index) in the current universe."""
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+        player_universe_data = player["universes"][universe_id]
+
+        if not 0 <= option < len(self.COUNTERMEASURES):
+            return ActionResult(False, "Unknown countermeasure.")
+
+        name, cost, reduction, flavour = self.COUNTERMEASURES[option]
+        if player_universe_data["cash"] < cost:
+            return ActionResult(False, f"Not enough cash! You need {cost} {universe['currency']}.")
+
+        self.add_cash(player, universe_id, -cost)
+        player_universe_data["danger"] = max(0, player_universe_data["danger"] - reduction)
+        self.achievement_system.mark_changed(*DANGER_STATS)
+        return ActionResult(True, f"{flavour} Detection risk reduced by {reduction}.")
+
+    def jump_universe(self, player, target_universe_id):
+        """Travel to another unlocked universe."""
+        if not player["unlocked_features"]["universe_travel"]:
+            return ActionResult(False, "Universe travel is not available yet.")
+        if target_universe_id == player["current_universe"]:
+            return ActionResult(False, "You're already in this universe!")
+        if target_universe_id not in player["unlocked_universes"]:
+            return ActionResult(False, "That universe has not been unlocked yet.")
+
+        player["current_universe"] = target_universe_id
+        result = ActionResult(True, f"You've jumped to the {self.universes[target_universe_id]['name']} universe!")
+
+        # Update achievement stats for universe jumps
+        stats = self.achievement_system.stats
+        self.achievement_system.update_stats("universe_jumps")
+        stats["universe_visited"][target_universe_id] = True
+        self.achievement_system.mark_changed("all_universes_visited")
+        stats["different_universes_visited"] = sum(
+            1 for visited in stats.get("universe_visited", {}).values() if visited)
+        result.achievements = self.check_achievements(player)
+
+        # Update quest progress - universe jump and specific universe visits
+        result.completed_quests = self.quest_system.check_and_update_quests(
+            player, "universe_jump", value=1, universe_id=target_universe_id)
+        result.completed_quests += self.quest_system.check_and_update_quests(
+            player, "specific_universe_visited", value=target_universe_id, universe_id=None)
+        self.apply_quest_rewards(player, result.completed_quests, target_universe_id)
+
+        return result
+
+    def exchange_to_quantum(self, player, amount):
+        """Exchange local currency of the current universe for Quantum Credits."""
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+        player_universe_data = player["universes"][universe_id]
+
+        if amount <= 0:
+            return ActionResult(False, "Please enter a positive amount.")
+        if amount > player_universe_data["cash"]:
+            return ActionResult(False, f"You don't have enough {universe['currency']}.")
+
+        quantum_amount = self.currency_exchange.local_to_quantum(amount, universe_id)
+        self.add_cash(player, universe_id, -amount)
+        player["quantum_credits"] += quantum_amount
+        return ActionResult(True, f"Exchange complete! You now have {player['quantum_credits']} Q¢.")
+
+    def exchange_to_local(self, player, amount):
+        """Exchange Quantum Credits for the current universe's local currency."""
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+        player_universe_data = player["universes"][universe_id]
+
+        if amount <= 0:
+            return ActionResult(False, "Please enter a positive amount.")
+        if amount > player["quantum_credits"]:
+            return ActionResult(False, "You don't have enough Quantum Credits.")
+
+        local_amount = self.currency_exchange.quantum_to_local(amount, universe_id)
+        player["quantum_credits"] -= amount
+        self.add_cash(player, universe_id, local_amount)
+        return ActionResult(True, f"Exchange complete! You now have {player_universe_data['cash']} {universe['currency']}.")
+
+    def start_research(self, player, tech_id, category):
+        """Start researching a technology, paid for in Quantum Credits."""
+        success, message = self.research_system.start_research(player, tech_id, category)
+        return ActionResult(success, message)
+
+    def activate_quest(self, player, quest_id):
+        """Take on an available quest."""
+        if not self.quest_system.activate_quest(quest_id):
+            return ActionResult(False, "Failed to activate quest. Prerequisites may not be met.")
+        return ActionResult(True, f"Quest '{self.quest_system.quests[quest_id].name}' activated!")
+
+    def recruit_specialist(self, player, specialist_id):
+        """Hire a heist specialist, paid in the current universe's currency."""
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+
+        specialist = self.heist_system.specialists.get(specialist_id)
+        if specialist is None or specialist_id in player["heist_specialists"]:
+            return ActionResult(False, "That specialist is not available.")
+        if player["universes"][universe_id]["cash"] < specialist["hiring_cost"]:
+            return ActionResult(False, f"You don't have enough {universe['currency']} to hire this specialist.")
+
+        self.add_cash(player, universe_id, -specialist["hiring_cost"])
+        player["heist_specialists"].append(specialist_id)
+        return ActionResult(True, f"{specialist['name']} has joined your crew!")
+
+    def purchase_special_item(self, player, item_id):
+        """Buy a special item for heists, paid in the current universe's currency."""
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+
+        item = self.heist_system.special_items.get(item_id)
+        if item is None or item_id in player["special_items"]:
+            return ActionResult(False, "That item is not available.")
+        if player["universes"][universe_id]["cash"] < item["cost"]:
+            return ActionResult(False, f"You don't have enough {universe['currency']} to purchase this item.")
+
+        self.add_cash(player, universe_id, -item["cost"])
+        player["special_items"].append(item_id)
+        return ActionResult(True, f"You have acquired the {item['name']}!")
+
+    def execute_heist(self, player, heist_name, difficulty_id):
+        """Pay for the preparations and attempt a heist in the current universe.
+
+        The heist system's outcome (success, roll, rewards, crew payment and
+        danger increase) is returned in the result's details.
+        """
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+        player_universe_data = player["universes"][universe_id]
+        heists = self.heist_system
+
+        heist = next((heist for heist in heists.get_available_heists(universe_id)
+                      if heist["name"] == heist_name), None)
+        if heist is None or difficulty_id not in heists.difficulty_levels:
+            return ActionResult(False, "That heist is not available.")
+        if player["heist_cooldown"] > 0:
+            return ActionResult(False, f"Your crew is laying low after the last heist. Cooldown: {player['heist_cooldown']} turns.")
+
+        difficulty = heists.difficulty_levels[difficulty_id]
+        if len(player["heist_specialists"]) < difficulty["min_crew"]:
+            return ActionResult(False, "You don't have enough crew members for this difficulty level.")
+        if player_universe_data["cash"] < difficulty["min_preparation"]:
+            return ActionResult(False, f"You don't have enough {universe['currency']} for the necessary preparations.")
+
+        self.add_cash(player, universe_id, -difficulty["min_preparation"])
+        outcome = heists.execute_heist(heist, difficulty_id, player["heist_specialists"], player["special_items"])
+        reward = outcome["net_reward"]
+
+        if outcome["success"]:
+            self.add_cash(player, universe_id, reward["local_currency"])
+            player["quantum_credits"] += reward["quantum_credits"]
+            player_universe_data["danger"] += outcome["danger_increase"]
+            self.achievement_system.mark_changed(*DANGER_STATS)
+            if player_universe_data["danger"] >= self.DETECTION_RISK_THRESHOLD:
+                player["game_over"] = True
+                player["end_reason"] = f"Your heist operation in {universe['name']} was discovered by authorities!"
+
+        player["heist_history"].append({
+            "name": heist["name"],
+            "universe": universe["name"],
+            "difficulty": difficulty["name"],
+            "success": outcome["success"],
+            "reward_local": reward["local_currency"],
+            "reward_quantum": reward["quantum_credits"],
+            "turn": player["turn"],
+        })
+        player["heist_cooldown"] = 3 if outcome["success"] else 2
+
+        result = ActionResult(True, "Heist succeeded!" if outcome["success"] else "Heist failed!")
+        result.details = outcome
+        return result
+
+    def finish_mini_game(self, player, game_id, difficulty, success, stream_position=None):
+        """Record a mini game played in the current universe and pay out its rewards.
+
+        The puzzle itself is played interactively; only its outcome is an
+        action. stream_position is where the mini game random stream stood
+        after the puzzle, so a replay skips the draws the puzzle made.
+        """
+        universe_id = player["current_universe"]
+        universe = self.universes[universe_id]
+        mini_games = self.mini_game_system
+
+        game = mini_games.mini_games.get(game_id)
+        if game is None or difficulty not in game["rewards"]:
+            return ActionResult(False, "That mini game is not available.")
+
+        rng = mini_games.rng
+        if stream_position is not None and hasattr(rng, "skip"):
+            rng.skip(stream_position - rng.position)
+
+        player["mini_games_played"] += 1
+        if success:
+            player["mini_games_won"] += 1
+        player["mini_game_history"].append({
+            "game_id": game_id,
+            "game_name": game["name"],
+            "difficulty": difficulty,
+            "success": success,
+            "turn": player["turn"],
+            "universe": universe["name"],
+        })
+
+        result = ActionResult(True, "You won the mini game!" if success else "Better luck next time!")
+        if success:
+            rewards = game["rewards"][difficulty]
+            self.add_cash(player, universe_id, rewards["local_currency"])
+            player["quantum_credits"] += rewards["quantum_credits"]
+            player["universes"][universe_id]["reputation"] += rewards["reputation"]
+            result.details = rewards
+
+        player["mini_game_cooldown"] = 1  # 1 turn until the next mini game
+        return result
+
+    def advance_turn(self, player):
+        """Advance the game by one turn.
+
+        Args:
+            player (dict): Player state to advance in place
+
+        Returns:
+            TurnResult: Everything that happened during the turn
+        """
+        universe_id = player["current_universe"]
+        player_universe_data = player["universes"][universe_id]
+
+        # Increase the turn counter
+        player["turn"] += 1
+        result = TurnResult(player["turn"], universe_id)
+        timings = self.timings
+        timings.start()
+
+        # Calculate and apply business income
+        result.income = self.calculate_business_income(player)
+        timings.lap("income")
+
+        # Pay employee salaries
+        employees_before = staff.employee_count(player_universe_data["employees"])
+        cash_before = player_universe_data["cash"]
+        result.salaries = self.pay_employee_salaries(player)
+        result.salaries_paid = cash_before - player_universe_data["cash"] == result.salaries
+        result.employees_lost = employees_before - staff.employee_count(player_universe_data["employees"])
+        timings.lap("salaries")
+
+        # Apply detection risk reductions from employees
+        result.risk_reduction = self.apply_detection_risk_reductions(player)
+        timings.lap("risk_reduction")
+
+        # Trigger a random event with probability
+        result.event = self.maybe_trigger_random_event(player)
+        timings.lap("random_events")
+
+        # Reduce heist cooldown if active
+        if player["heist_cooldown"] > 0:
+            player["heist_cooldown"] -= 1
+            result.heist_ready = player["heist_cooldown"] == 0
+
+        # Reduce mini game cooldown if active
+        if player["mini_game_cooldown"] > 0:
+            player["mini_game_cooldown"] -= 1
+            result.mini_game_ready = player["mini_game_cooldown"] == 0
+        timings.lap("cooldowns")
+
+        # Award experience points based on actions this turn
+        base_xp = 100  # Base XP for completing a turn
+        business_xp = len(player_universe_data["businesses"]) * 20  # XP for each business owned
+        employee_xp = staff.employee_count(player_universe_data["employees"]) * 15  # XP for each employee
+        income_xp = int(result.income / 1000) * 10  # XP based on income (10 XP per 1000 currency)
+
+        result.xp_gained = base_xp + business_xp + employee_xp + income_xp
+        player["experience"] += result.xp_gained
+        timings.lap("xp")
+
+        # Check for new feature unlocks, level ups and universe unlocks
+        result.unlocked_features = self.check_feature_unlocks(player)
+        result.level_up = self.check_level_up(player)
+        timings.lap("feature_unlocks")
+
+        # Check for newly unlocked achievements (rewards are granted on unlock)
+        result.achievements = self.check_achievements(player)
+        timings.lap("achievements")
+
+        # Update quest progress for turn completion and award rewards
+        result.completed_quests = self.quest_system.check_and_update_quests(player, "turn_completed")
+        self.apply_quest_rewards(player, result.completed_quests, universe_id)
+        timings.lap("quests")
+
+        # Update research progress
+        result.completed_research = self.research_system.update_research(player)
+        result.research_effects = self.research_system.apply_research_effects(player, universe_id)
+        timings.lap("research")
+
+        result.game_over = self.check_game_over(player, universe_id)
+        result.end_reason = player["end_reason"]
+        timings.lap("summary")
+
+        return result